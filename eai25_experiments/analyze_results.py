@@ -15,39 +15,57 @@ import numpy as np
 from constants import SCORE_MAP, DATA_DIR
 
 
-Scores: TypeAlias = dict[str, dict[Literal["human_scores", "gpt_scores"], list[float]]]
+Source: TypeAlias = Literal["human_scores", "gpt_scores"]
 
 
-def load_scores() -> Scores:
+def load_scores() -> pd.DataFrame:
+    """Loads all scores as a long-format DataFrame w/ columns: subject, source, score."""
     annotations_df = pd.read_csv(os.path.join(DATA_DIR, "annotations.csv"))
     gpt_scores_df = pd.read_csv(os.path.join(DATA_DIR, "gpt_scores.csv"))
-    screenshot_subjects = list(annotations_df.columns)[1:]  # 1st col = annatator_name
-    scores = {}
-    for subject in screenshot_subjects:
-        human_scores = [SCORE_MAP[s.lower()] for s in annotations_df[subject]]
-        gpt_scores = gpt_scores_df[subject].tolist()
-        scores[subject] = {"human_scores": human_scores, "gpt_scores": gpt_scores}
-    return scores
-
-
-def summarize_scores(scores: Scores) -> pd.DataFrame:
-    rows = []
-    for subject, data in scores.items():
-        mean_human = sum(data["human_scores"]) / len(data["human_scores"])
-        mean_gpt_score = sum(data["gpt_scores"]) / len(data["gpt_scores"])
-        rows.append(
-            {
-                "subject": subject,
-                "abs_diff_of_means": abs(mean_gpt_score - mean_human),
-                "human_scores": str(data["human_scores"]),
-                "human_scores_mean": mean_human,
-                "human_scores_std": np.std(data["human_scores"]),
-                "gpt_scores": str(data["gpt_scores"]),
-                "gpt_scores_mean": mean_gpt_score,
-                "gpt_scores_std": np.std(data["gpt_scores"]),
-            }
-        )
-    df = pd.DataFrame(rows)
+    annotator_col = annotations_df.columns[0]  # 1st col = annatator_name
+    human_scores = annotations_df.melt(
+        id_vars=annotator_col, var_name="subject", value_name="label"
+    )
+    human_scores["score"] = human_scores["label"].str.lower().map(SCORE_MAP)
+    human_scores["source"] = "human_scores"
+    gpt_scores = gpt_scores_df.melt(var_name="subject", value_name="score")
+    gpt_scores["source"] = "gpt_scores"
+    columns = ["subject", "source", "score"]
+    return pd.concat([human_scores[columns], gpt_scores[columns]], ignore_index=True)
+
+
+def get_scores(scores: pd.DataFrame, subject: str, source: Source) -> list[float]:
+    mask = (scores["subject"] == subject) & (scores["source"] == source)
+    return scores.loc[mask, "score"].tolist()
+
+
+def summarize_scores(scores: pd.DataFrame) -> pd.DataFrame:
+    grouped = scores.groupby(["subject", "source"], sort=False)["score"]
+    stats = pd.DataFrame(
+        {
+            "scores": grouped.agg(lambda s: str(s.tolist())),
+            "mean": grouped.mean(),
+            "std": grouped.std(ddof=0),  # (Population std, like np.std)
+        }
+    ).unstack("source")
+    stats.columns = [
+        source if stat == "scores" else f"{source}_{stat}" for stat, source in stats.columns
+    ]
+    df = stats.reset_index()
+    abs_diff_of_means = (df["gpt_scores_mean"] - df["human_scores_mean"]).abs()
+    df.insert(1, "abs_diff_of_means", abs_diff_of_means)
+    df = df[
+        [
+            "subject",
+            "abs_diff_of_means",
+            "human_scores",
+            "human_scores_mean",
+            "human_scores_std",
+            "gpt_scores",
+            "gpt_scores_mean",
+            "gpt_scores_std",
+        ]
+    ]
     df = df.sort_values("abs_diff_of_means", ascending=False).reset_index(drop=True)
     pearson_corr, p_value = pearsonr(df["human_scores_mean"], df["gpt_scores_mean"])
     print(f"Pearson correlation: {pearson_corr:.2f}, p-value: {p_value:.2e}")
@@ -280,10 +298,10 @@ if __name__ == "__main__":
     dist1 = "something organic and orange"
     dist2 = "an animal whose enclosure gives it a reason to be happy"
     plot_distributions(
-        left_human_vals=scores[dist1]["human_scores"],
-        left_gpt_vals=scores[dist1]["gpt_scores"],
-        right_human_vals=scores[dist2]["human_scores"],
-        right_gpt_vals=scores[dist2]["gpt_scores"],
+        left_human_vals=get_scores(scores, dist1, "human_scores"),
+        left_gpt_vals=get_scores(scores, dist1, "gpt_scores"),
+        right_human_vals=get_scores(scores, dist2, "human_scores"),
+        right_gpt_vals=get_scores(scores, dist2, "gpt_scores"),
         left_img_path=os.path.join(DATA_DIR, f"{dist1}.png"),
         right_img_path=os.path.join(DATA_DIR, f"{dist2}.png"),
         left_text=f"'{dist1}'",
@@ -1,9 +1,11 @@
-import openai
+import asyncio
+import base64
+import hashlib
+import json
 import os
 import re
-import base64
-from collections import defaultdict
 
+import openai
 import pandas as pd
 from tqdm import tqdm
 from tenacity import retry, stop_after_attempt
@@ -13,6 +15,8 @@ from constants import SCORE_MAP, DATA_DIR
 
 MODEL = "gpt-4.1-2025-04-14"
 TEMPERATURE = 0.6
+MAX_CONCURRENT_REQUESTS = 16
+SCORE_CACHE_FPATH = os.path.join(DATA_DIR, "gpt_score_cache.jsonl")
 PROMPT = """
 Here is a screenshot taken by a Minecraft player who was asked to perform the task: '{task}'.
 Your job is to consider the degree to which the screenshot evidences that the player fulfilled this task.
@@ -39,20 +43,74 @@ def extract_final_answer_from_response(response: str) -> str | None:
     return final_answer
 
 
-@retry(stop=stop_after_attempt(8))
-def get_gpt_4_1_score(screenshot_fpath: str, task: str) -> float:
-    api_key = os.getenv("OPENAI_API_KEY")
-    if api_key is None:
-        raise ValueError("OPENAI_API_KEY environment variable not set.")
-    client = openai.OpenAI(api_key=api_key)
+def encode_screenshot(screenshot_fpath: str) -> tuple[str, str]:
+    """Reads a screenshot once, returning its data URL and the hash of its contents."""
     with open(screenshot_fpath, "rb") as image_file:
-        encoded_image = base64.b64encode(image_file.read()).decode("utf-8")
-    formatted_prompt = PROMPT.format(task=task).strip()
+        image_bytes = image_file.read()
+    encoded_image = base64.b64encode(image_bytes).decode("utf-8")
     img_url = f"data:image/jpeg;base64,{encoded_image}"
+    return img_url, hashlib.sha256(image_bytes).hexdigest()
+
+
+class ScoreCache:
+    """Append-only, on-disk cache of scores (so that interrupted runs can be resumed).
+
+    Each score is keyed by the hash of the screenshot, the prompt, the model, the sample
+    index, and the endpoint (so that scores from a stand-in server are never reused for
+    OpenAI's), and is written to disk as soon as it is received.
+    """
+
+    def __init__(self, fpath: str = SCORE_CACHE_FPATH):
+        self.fpath = fpath
+        self.scores: dict[str, float] = {}
+        if os.path.exists(fpath):
+            with open(fpath) as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self.scores[entry["key"]] = entry["score"]
+
+    @staticmethod
+    def get_key(
+        image_hash: str,
+        prompt: str,
+        model: str,
+        sample_index: int,
+        base_url: str | None = None,
+    ) -> str:
+        key_parts = [image_hash, prompt, model, sample_index]
+        if base_url is not None:
+            key_parts.append(base_url)  # (Keeps the keys of OpenAI's scores unchanged)
+        return hashlib.sha256(json.dumps(key_parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> float | None:
+        return self.scores.get(key)
+
+    def put(self, key: str, score: float) -> None:
+        self.scores[key] = score
+        with open(self.fpath, "a") as f:
+            f.write(json.dumps({"key": key, "score": score}) + "\n")
+
+
+def get_client(base_url: str | None = None) -> openai.AsyncOpenAI:
+    """Gets a client for the OpenAI API or, if `base_url` is given, for any server that
+    implements its chat completions endpoint (e.g., a local stand-in for benchmarking)."""
+    api_key = os.getenv("OPENAI_API_KEY")
+    if api_key is None:
+        if base_url is None:
+            raise ValueError("OPENAI_API_KEY environment variable not set.")
+        api_key = "unused"
+    return openai.AsyncOpenAI(api_key=api_key, base_url=base_url)
+
+
+@retry(stop=stop_after_attempt(8))
+async def get_gpt_4_1_score(
+    client: openai.AsyncOpenAI, img_url: str, formatted_prompt: str
+) -> float:
     text_content = {"type": "text", "text": formatted_prompt}
     image_content = {"type": "image_url", "image_url": {"url": img_url}}
     messages = [{"role": "user", "content": [text_content, image_content]}]
-    response = client.chat.completions.create(
+    response = await client.chat.completions.create(
         model=MODEL, messages=messages, max_tokens=15_000, temperature=TEMPERATURE
     )
     final_answer = extract_final_answer_from_response(response.choices[0].message.content)
@@ -61,23 +119,70 @@ def get_gpt_4_1_score(screenshot_fpath: str, task: str) -> float:
     return SCORE_MAP[final_answer]
 
 
-def run_experiment(n_gpt_samples_per_task: int = 10) -> pd.DataFrame:
+async def run_experiment_async(
+    n_gpt_samples_per_task: int = 10,
+    base_url: str | None = None,
+    max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+    cache: ScoreCache | None = None,
+) -> pd.DataFrame:
     annotations_df = pd.read_csv(os.path.join(DATA_DIR, "annotations.csv"))
     screenshot_subjects = list(annotations_df.columns)[1:]  # 1st col = annatator_name
-    tasks = [f"Take a screenshot of {subject}" for subject in screenshot_subjects]
-    scores: dict[str, list[float]] = defaultdict(list)
-    for task, subject in zip(tasks, screenshot_subjects):
-        print(f"Getting sample scores for task, '{task}'...")
+    client = get_client(base_url)
+    cache = cache if cache is not None else ScoreCache()
+    semaphore = asyncio.Semaphore(max_concurrent_requests)
+    scores: dict[str, list[float | None]] = {
+        subject: [None] * n_gpt_samples_per_task for subject in screenshot_subjects
+    }
+    progress_bar = tqdm(total=len(screenshot_subjects) * n_gpt_samples_per_task)
+
+    async def score_sample(
+        subject: str, sample_index: int, img_url: str, prompt: str, cache_key: str
+    ) -> None:
+        async with semaphore:
+            score = await get_gpt_4_1_score(client, img_url, prompt)
+        cache.put(cache_key, score)
+        scores[subject][sample_index] = score
+        progress_bar.update()
+
+    sample_coroutines = []
+    for subject in screenshot_subjects:
         screenshot_fpath = os.path.join(DATA_DIR, f"{subject}.png")
         assert os.path.exists(screenshot_fpath)
-        for i in tqdm(range(n_gpt_samples_per_task)):
-            score = get_gpt_4_1_score(screenshot_fpath, task)
-            scores[subject].append(score)
-        print("Scores:", scores[subject])
+        img_url, image_hash = encode_screenshot(screenshot_fpath)
+        prompt = PROMPT.format(task=f"Take a screenshot of {subject}").strip()
+        for i in range(n_gpt_samples_per_task):
+            cache_key = ScoreCache.get_key(image_hash, prompt, MODEL, i, base_url)
+            cached_score = cache.get(cache_key)
+            if cached_score is not None:
+                scores[subject][i] = cached_score
+                progress_bar.update()
+            else:
+                sample = score_sample(subject, i, img_url, prompt, cache_key)
+                sample_coroutines.append(sample)
+
+    try:
+        await asyncio.gather(*sample_coroutines)
+    finally:
+        progress_bar.close()
+        await client.close()
     assert len(scores) == len(screenshot_subjects)
     return pd.DataFrame(scores)
 
 
+def run_experiment(
+    n_gpt_samples_per_task: int = 10,
+    base_url: str | None = None,
+    max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+    cache: ScoreCache | None = None,
+) -> pd.DataFrame:
+    return asyncio.run(
+        run_experiment_async(
+            n_gpt_samples_per_task, base_url, max_concurrent_requests, cache
+        )
+    )
+
+
 if __name__ == "__main__":
-    df = run_experiment()
+    # NOTE: Set EVAL_BASE_URL to score w/ a server other than OpenAI's
+    df = run_experiment(base_url=os.getenv("EVAL_BASE_URL"))
     df.to_csv(os.path.join(DATA_DIR, "gpt_scores.csv"), index=False)
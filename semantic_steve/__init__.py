@@ -1,4 +1,6 @@
 from semantic_steve.py.cli import run_as_cli
 from semantic_steve.py.semantic_steve import SemanticSteve
 from semantic_steve.py.js_messages import DataFromMinecraft
+from semantic_steve.py.schema import SemanticSteveProfilingConfig
+from semantic_steve.py.world_memory import WorldMemory, get_world_memory_path
 from semantic_steve.py.constants import SCREENSHORT_DIR_ENV_VAR_NAME
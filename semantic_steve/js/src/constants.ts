@@ -1,3 +1,5 @@
+import * as os from "os";
+import * as path from "path";
 import { Vec3 } from "vec3";
 import { ConnectingSide } from "./types";
 
@@ -28,6 +30,13 @@ export const MAX_MINING_REACH = 4.5;
 // Bot eye height in meters
 export const BOT_EYE_HEIGHT = 1.62;
 
+// Directory for caches that persist across sessions (e.g., per-version lookup tables)
+export const SEMANTIC_STEVE_CACHE_DIR = path.join(
+  os.homedir(),
+  ".semantic_steve",
+  "cache",
+);
+
 // Six sides of a cubed meter in minecraft
 export const ADJACENT_OFFSETS = {
   [ConnectingSide.WEST]: new Vec3(-1, 0, 0),
@@ -37,3 +46,7 @@ export const ADJACENT_OFFSETS = {
   [ConnectingSide.NORTH]: new Vec3(0, 0, -1),
   [ConnectingSide.SOUTH]: new Vec3(0, 0, 1),
 };
+
+// Min. size of payloads to Python that are written to shared memory (when enabled)
+// rather than sent over ZMQ
+export const SHARED_MEMORY_MIN_PAYLOAD_BYTES = 64 * 1024;
@@ -43,15 +43,32 @@ export type EnvStateDTO = {
   surroundings: SurroundingsDTO;
 };
 
+type SectionDTOCacheEntry<T> = { version: number; dto: T };
+
 export class EnvState {
   private bot: Bot;
   public surroundings: Surroundings;
   public inventory: Inventory;
+  // Versions of the sections that aren't versioned by their own classes
+  private positionVersion: number = 0;
+  private vitalsVersion: number = 0;
+  private heldItemVersion: number = 0;
+  // Section name -> the DTO of that section at some version
+  private sectionDTOCache: Map<string, SectionDTOCacheEntry<any>> = new Map();
 
   constructor(bot: Bot, surroundingsRadii: SurroundingsRadii) {
     this.bot = bot;
     this.surroundings = new Surroundings(bot, surroundingsRadii);
     this.inventory = new Inventory(bot);
+    this.bot.on("move", () => {
+      this.positionVersion++;
+    });
+    this.bot.on("health", () => {
+      this.vitalsVersion++;
+    });
+    this.bot.on("heldItemChanged", () => {
+      this.heldItemVersion++;
+    });
   }
 
   public get botCoords(): Vec3 {
@@ -81,23 +98,73 @@ export class EnvState {
     this.surroundings.hydrate(throttleMS);
   }
 
+  private get equipmentVersion(): number {
+    // Equipment changes w/ the held item or w/ (armor/off-hand) inventory slots
+    return this.heldItemVersion + this.inventory.version;
+  }
+
+  /**
+   * Sum of the versions of all sections (changes whenever any section changes, so it can
+   * be compared to tell whether the DTO has changed).
+   */
+  public get version(): number {
+    return (
+      this.positionVersion +
+      this.vitalsVersion +
+      this.equipmentVersion +
+      this.inventory.version +
+      this.surroundings.version
+    );
+  }
+
+  private getSectionDTO<T>(
+    section: string,
+    version: number,
+    build: () => T,
+  ): T {
+    const cached = this.sectionDTOCache.get(section);
+    if (cached && cached.version === version) {
+      return cached.dto;
+    }
+    const dto = build();
+    this.sectionDTOCache.set(section, { version, dto });
+    return dto;
+  }
+
+  /**
+   * Gets the DTO, reusing the DTOs of the sections that haven't changed since they were
+   * last built.
+   */
   public getDTO(): EnvStateDTO {
-    return {
-      playerCoordinates: [
-        // Round to 1 decimal place
-        Math.round(this.botCoords.x * 10) / 10,
-        Math.round(this.botCoords.y * 10) / 10,
-        Math.round(this.botCoords.z * 10) / 10,
-      ],
+    const vitals = this.getSectionDTO("vitals", this.vitalsVersion, () => ({
       health: `${this.health}/20`, // NOTE: 20 is the max health in vanilla Minecraft
       hunger: `${this.hunger}/20`, // NOTE: 20 is the max hunger in vanilla Minecraft
+    }));
+    return {
+      playerCoordinates: this.getSectionDTO(
+        "position",
+        this.positionVersion,
+        (): [number, number, number] => [
+          // Round to 1 decimal place
+          Math.round(this.botCoords.x * 10) / 10,
+          Math.round(this.botCoords.y * 10) / 10,
+          Math.round(this.botCoords.z * 10) / 10,
+        ],
+      ),
+      health: vitals.health,
+      hunger: vitals.hunger,
       inventory: this.inventory.getDTO(),
-      equipped: Object.fromEntries(
-        Object.entries(this.equipped).map(([key, item]) => [
-          key,
-          item?.name ?? null,
-        ]),
-      ) as Map<EquipmentDestination, string | undefined>,
+      equipped: this.getSectionDTO(
+        "equipment",
+        this.equipmentVersion,
+        () =>
+          Object.fromEntries(
+            Object.entries(this.equipped).map(([key, item]) => [
+              key,
+              item?.name ?? null,
+            ]),
+          ) as Map<EquipmentDestination, string | undefined>,
+      ),
       surroundings: this.surroundings.getDTO(),
     };
   }
@@ -1,6 +1,7 @@
 import { Bot } from "mineflayer";
 import type { Item as PItem } from "prismarine-item";
 import { getDurabilityRemainingString } from "../utils/durability";
+import { Enchantment } from "../utils/mining";
 
 /**
  * "Data Transfer Object" (DTO) for an inventory slot item containing the information that
@@ -14,15 +15,92 @@ export type InventoryItemDTO = {
   durabilityRemaining?: string; // e.g. "50%"
 };
 
+type SlotContents = { name: string; count: number };
+
 /**
  * Inventory class that wraps the bot's inventory and provides additional functionality
  * for managing and querying the inventory.
+ *
+ * Per-item totals are maintained incrementally from `updateSlot` events (and re-synced
+ * w/ the actual slots whenever a window closes), and every change to them is appended to
+ * a journal from which inventory changes over any period can be read.
  */
 export class Inventory {
   private bot: Bot;
+  // Slot index -> parsed enchantments of the item in that slot (cleared on slot change)
+  private slotsToEnchantments: Map<number, Enchantment[]> = new Map();
+  // Slot index -> what we last saw in that slot (what the totals currently account for)
+  private slotsToContents: Map<number, SlotContents> = new Map();
+  private itemTotals: Map<string, number> = new Map();
+  // (item name, count differential) entries, the first of which is at `journalOffset`
+  private journal: [string, number][] = [];
+  private journalOffset: number = 0;
+  private cachedItemSlots?: PItem[];
+  private cachedItemsToSlots?: Map<string, PItem>;
+  private cachedDTO?: InventoryItemDTO[];
+  private cachedDTOVersion?: number;
+  // Bumped on every slot update (including ones that don't change totals, e.g. durability)
+  public version: number = 0;
 
   constructor(bot: Bot) {
     this.bot = bot;
+    this.bot.inventory.on("updateSlot", (slot: number) => {
+      this.handleSlotUpdate(slot);
+    });
+    this.bot.on("windowClose", () => {
+      this.resync();
+    });
+    this.resync();
+  }
+
+  private handleSlotUpdate(slot: number): void {
+    this.version++;
+    this.slotsToEnchantments.delete(slot);
+    this.cachedItemSlots = undefined;
+    this.cachedItemsToSlots = undefined;
+
+    const oldContents = this.slotsToContents.get(slot);
+    const newItem = this.bot.inventory.slots[slot];
+    if (
+      oldContents &&
+      newItem &&
+      oldContents.name === newItem.name &&
+      oldContents.count === newItem.count
+    ) {
+      return;
+    }
+    if (oldContents) {
+      this.slotsToContents.delete(slot);
+      this.applyDifferential(oldContents.name, -oldContents.count);
+    }
+    if (newItem) {
+      const newContents = { name: newItem.name, count: newItem.count };
+      this.slotsToContents.set(slot, newContents);
+      this.applyDifferential(newItem.name, newItem.count);
+    }
+  }
+
+  private applyDifferential(itemName: string, countDifferential: number): void {
+    const total = (this.itemTotals.get(itemName) ?? 0) + countDifferential;
+    if (total > 0) {
+      this.itemTotals.set(itemName, total);
+    } else {
+      this.itemTotals.delete(itemName);
+    }
+    this.journal.push([itemName, countDifferential]);
+  }
+
+  /**
+   * Brings the totals back in line w/ the actual slots (e.g., in case an item's count was
+   * changed in place w/out an `updateSlot` event).
+   */
+  private resync(): void {
+    const slots = this.bot.inventory.slots;
+    for (let slot = 0; slot < slots.length; slot++) {
+      if (slots[slot] || this.slotsToContents.has(slot)) {
+        this.handleSlotUpdate(slot);
+      }
+    }
   }
 
   /**
@@ -31,38 +109,109 @@ export class Inventory {
    * (wrapper around the this.bot.inventory.slots to filter out null values)
    */
   public get itemSlots(): PItem[] {
-    return this.bot.inventory.slots.filter(
-      (item): item is PItem => item !== null,
-    );
+    if (!this.cachedItemSlots) {
+      this.cachedItemSlots = this.bot.inventory.slots.filter(
+        (item): item is PItem => item !== null,
+      );
+    }
+    return this.cachedItemSlots;
   }
 
   /**
    * Map of item names to their corresponding PItem objects.
    */
   public get itemsToSlots(): Map<string, PItem> {
-    return new Map(this.itemSlots.map((item) => [item.name, item]));
+    if (!this.cachedItemsToSlots) {
+      this.cachedItemsToSlots = new Map(
+        this.itemSlots.map((item) => [item.name, item]),
+      );
+    }
+    return this.cachedItemsToSlots;
   }
 
   /**
    * Map of item names to their total counts in the inventory.
    */
-  public get itemsToTotalCounts(): Map<string, number> {
-    const itemTotals = new Map<string, number>();
-    this.itemSlots.map((item) => {
-      const currentCount = itemTotals.get(item.name) || 0;
-      itemTotals.set(item.name, currentCount + item.count);
-    });
-    return itemTotals;
+  public get itemsToTotalCounts(): ReadonlyMap<string, number> {
+    return this.itemTotals;
+  }
+
+  // ==================
+  // Inventory journal
+  // ==================
+
+  /**
+   * Position of the end of the journal (i.e., where the next change will be recorded).
+   */
+  public get journalPosition(): number {
+    return this.journalOffset + this.journal.length;
+  }
+
+  /**
+   * Gets the net (non-zero) item count differentials since a journal position.
+   */
+  public getChangesSince(position: number): Map<string, number> {
+    if (position < this.journalOffset) {
+      throw new Error(
+        `Journal position ${position} has already been discarded (oldest is ${this.journalOffset})`,
+      );
+    }
+    const differentials = new Map<string, number>();
+    for (let i = position - this.journalOffset; i < this.journal.length; i++) {
+      const [itemName, countDifferential] = this.journal[i];
+      differentials.set(
+        itemName,
+        (differentials.get(itemName) ?? 0) + countDifferential,
+      );
+    }
+    for (const [itemName, countDifferential] of differentials) {
+      if (countDifferential === 0) {
+        differentials.delete(itemName);
+      }
+    }
+    return differentials;
+  }
+
+  /**
+   * Discards the journal entries before a position (which can no longer be read from).
+   */
+  public discardJournalBefore(position: number): void {
+    const nToDiscard = Math.min(
+      position - this.journalOffset,
+      this.journal.length,
+    );
+    if (nToDiscard > 0) {
+      this.journal.splice(0, nToDiscard);
+      this.journalOffset += nToDiscard;
+    }
+  }
+
+  /**
+   * Gets the enchantments of an inventory item, only parsing its NBT the first time it is
+   * asked about while in its slot.
+   */
+  public getEnchantments(item: PItem): Enchantment[] {
+    let enchantments = this.slotsToEnchantments.get(item.slot);
+    if (!enchantments) {
+      enchantments = item.enchants.map((e) => ({ name: e.name, level: e.lvl }));
+      this.slotsToEnchantments.set(item.slot, enchantments);
+    }
+    return enchantments;
   }
 
   /**
    * Returns an array of `InventoryItemDTO` objects.
    */
   public getDTO(): InventoryItemDTO[] {
-    return this.itemSlots.map((item) => ({
+    if (this.cachedDTO && this.cachedDTOVersion === this.version) {
+      return this.cachedDTO;
+    }
+    this.cachedDTOVersion = this.version;
+    this.cachedDTO = this.itemSlots.map((item) => ({
       name: item.name,
       count: item.count,
       durabilityRemaining: getDurabilityRemainingString(item),
     }));
+    return this.cachedDTO;
   }
 }
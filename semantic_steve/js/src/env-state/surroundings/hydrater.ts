@@ -13,9 +13,33 @@ import {
 
 import type { Item as PItem } from "prismarine-item";
 import { isBlockVisible } from "../../utils/visibility";
+import { WorldMemory } from "./world-memory";
 
 export const BLOCKS_TO_IGNORE = ["cheeto"];
 
+type ItemEntityData = {
+  name: string; // The dropped item's name (not the entity name)
+  vicinity: Vicinity;
+  // NOTE: Shared w/ the surroundings (so that moves can be applied in place)
+  position: Vec3;
+};
+
+/**
+ * Called w/ the name of the watched thing (block, item entity, or biome) that was seen and
+ * the vicinity it was seen in.
+ */
+export type FirstSeenCallback = (
+  thingName: string,
+  vicinity: Vicinity,
+) => void;
+
+type FirstSeenSubscription = {
+  thingNames: string[];
+  vicinities?: Set<Vicinity>; // undefined = all vicinities
+  callback: FirstSeenCallback;
+  isActive: boolean;
+};
+
 export class SurroundingsHydrater {
   private bot: Bot;
   private radii: SurroundingsRadii;
@@ -24,8 +48,17 @@ export class SurroundingsHydrater {
   // Cache maps for fast lookups
   private blockLookup: Map<string, { name: string; vicinity: Vicinity }> =
     new Map();
-  private entityLookup: Map<number, { name: string; vicinity: Vicinity }> =
+  private itemEntityLookup: Map<number, ItemEntityData> = new Map();
+  // Block name -> keys of the (visible) blocks w/ that name
+  private blockNamesToKeys: Map<string, Set<string>> = new Map();
+  // Direction -> item name -> IDs of the item entities w/ that name in that direction
+  private distantItemEntityIDs: Map<Direction, Map<string, Set<number>>> =
+    new Map(Object.values(Direction).map((dir) => [dir, new Map()]));
+  // Watched thing name -> subscriptions watching for it
+  private firstSeenSubscriptions: Map<string, Set<FirstSeenSubscription>> =
     new Map();
+  // Opt-in persistent memory of the blocks seen (see `attachWorldMemory`)
+  private worldMemory?: WorldMemory;
 
   constructor(bot: Bot, radii: SurroundingsRadii) {
     this.bot = bot;
@@ -46,6 +79,11 @@ export class SurroundingsHydrater {
 
     // Handle block updates
     this.bot.on("blockUpdate", (oldBlock, newBlock) => {
+      if (this.worldMemory && oldBlock && oldBlock.name !== newBlock?.name) {
+        // We know the block is gone (as opposed to no longer visible/in range). If its
+        // replacement is visible, updateBlock records it (superseding this)
+        this.worldMemory.forgetBlock(oldBlock.position);
+      }
       if (newBlock) {
         this.updateBlock(newBlock);
       } else if (oldBlock) {
@@ -62,14 +100,14 @@ export class SurroundingsHydrater {
 
     // Handle item entity movements
     this.bot.on("entityMoved", (entity) => {
-      if (entity.name === "item" && this.entityLookup.has(entity.id)) {
-        this.updateItemEntity(entity);
+      if (entity.name === "item" && this.itemEntityLookup.has(entity.id)) {
+        this.moveItemEntity(entity.id, entity.position);
       }
     });
 
     // Handle item entity removals
     this.bot.on("entityGone", (entity) => {
-      if (entity.name === "item" && this.entityLookup.has(entity.id)) {
+      if (entity.name === "item" && this.itemEntityLookup.has(entity.id)) {
         this.removeItemEntity(entity.id);
       }
     });
@@ -80,6 +118,145 @@ export class SurroundingsHydrater {
     });
   }
 
+  /**
+   * Starts recording every block seen from now on (and forgetting every block seen being
+   * removed) into a persistent world memory.
+   */
+  public attachWorldMemory(worldMemory: WorldMemory): void {
+    this.worldMemory = worldMemory;
+    // Record the blocks that are already visible
+    for (const [blockKey, { name }] of this.blockLookup) {
+      const [x, y, z] = blockKey.split(",").map(Number);
+      worldMemory.recordBlock(new Vec3(x, y, z), name);
+    }
+  }
+
+  private markVicinityAsChanged(vicinity: Vicinity): void {
+    if (vicinity === Vicinity.IMMEDIATE_SURROUNDINGS) {
+      this.surroundings.immediate.version++;
+    } else {
+      const direction = vicinity as unknown as Direction;
+      this.surroundings.distant.get(direction)!.version++;
+    }
+  }
+
+  // =========================
+  // First-seen subscriptions
+  // =========================
+
+  /**
+   * Subscribes to the first time any of the given things is visible in one of the given
+   * vicinities (all vicinities if `vicinityFilter` is undefined).
+   *
+   * The callback is called at most once: as soon as the hydrater adds a watched thing to
+   * a matching vicinity, or right away if one is already visible there. It is called in a
+   * microtask (i.e., never mid-update), and never after unsubscribing.
+   *
+   * @returns A function that unsubscribes.
+   */
+  public onFirstSeen(
+    thingNames: string[],
+    vicinityFilter: Vicinity[] | undefined,
+    callback: FirstSeenCallback,
+  ): () => void {
+    const subscription: FirstSeenSubscription = {
+      thingNames: [...thingNames],
+      vicinities: vicinityFilter ? new Set(vicinityFilter) : undefined,
+      callback,
+      isActive: true,
+    };
+    const unsubscribe = () => {
+      subscription.isActive = false;
+      this.removeFirstSeenSubscription(subscription);
+    };
+
+    // Already visible?
+    for (const thingName of subscription.thingNames) {
+      const vicinity = this.getVicinityWhereVisible(
+        thingName,
+        subscription.vicinities,
+      );
+      if (vicinity !== undefined) {
+        this.fireFirstSeen(subscription, thingName, vicinity);
+        return unsubscribe;
+      }
+    }
+
+    for (const thingName of subscription.thingNames) {
+      let subscriptions = this.firstSeenSubscriptions.get(thingName);
+      if (!subscriptions) {
+        subscriptions = new Set();
+        this.firstSeenSubscriptions.set(thingName, subscriptions);
+      }
+      subscriptions.add(subscription);
+    }
+    return unsubscribe;
+  }
+
+  private fireFirstSeen(
+    subscription: FirstSeenSubscription,
+    thingName: string,
+    vicinity: Vicinity,
+  ): void {
+    this.removeFirstSeenSubscription(subscription);
+    queueMicrotask(() => {
+      if (subscription.isActive) {
+        subscription.isActive = false;
+        subscription.callback(thingName, vicinity);
+      }
+    });
+  }
+
+  private removeFirstSeenSubscription(
+    subscription: FirstSeenSubscription,
+  ): void {
+    for (const thingName of subscription.thingNames) {
+      const subscriptions = this.firstSeenSubscriptions.get(thingName);
+      subscriptions?.delete(subscription);
+      if (subscriptions?.size === 0) {
+        this.firstSeenSubscriptions.delete(thingName);
+      }
+    }
+  }
+
+  private notifyFirstSeen(thingName: string, vicinity: Vicinity): void {
+    const subscriptions = this.firstSeenSubscriptions.get(thingName);
+    if (!subscriptions) return;
+    for (const subscription of [...subscriptions]) {
+      if (!subscription.vicinities || subscription.vicinities.has(vicinity)) {
+        this.fireFirstSeen(subscription, thingName, vicinity);
+      }
+    }
+  }
+
+  private getVicinityWhereVisible(
+    thingName: string,
+    vicinities?: Set<Vicinity>,
+  ): Vicinity | undefined {
+    const biomeID = this.bot.registry.biomesByName[thingName]?.id;
+    const immediate = this.surroundings.immediate;
+    if (
+      (!vicinities || vicinities.has(Vicinity.IMMEDIATE_SURROUNDINGS)) &&
+      (immediate.blocksToAllCoords.has(thingName) ||
+        immediate.itemEntitiesToAllCoords.has(thingName) ||
+        (biomeID !== undefined && immediate.biomes.has(biomeID)))
+    ) {
+      return Vicinity.IMMEDIATE_SURROUNDINGS;
+    }
+    for (const [direction, distantDir] of this.surroundings.distant) {
+      const vicinity = direction as unknown as Vicinity;
+      if (
+        (!vicinities || vicinities.has(vicinity)) &&
+        (distantDir.blocksToCounts.has(thingName) ||
+          distantDir.itemEntitiesToCounts.has(thingName) ||
+          (biomeID !== undefined &&
+            distantDir.biomesToClosestCoords.has(biomeID)))
+      ) {
+        return vicinity;
+      }
+    }
+  }
+
   private getBlockKey(pos: Vec3): string {
     return `${Math.floor(pos.x)},${Math.floor(pos.y)},${Math.floor(pos.z)}`;
   }
@@ -215,11 +392,22 @@ export class SurroundingsHydrater {
     // Add to appropriate vicinity
     this.addBlockToVicinity(block, vicinity);
 
-    // Update lookup map
+    // Update lookup maps
+    if (existingData && existingData.name !== block.name) {
+      this.unindexBlockName(existingData.name, blockKey);
+    }
     this.blockLookup.set(blockKey, {
       name: block.name,
       vicinity: vicinity,
     });
+    let keys = this.blockNamesToKeys.get(block.name);
+    if (!keys) {
+      keys = new Set();
+      this.blockNamesToKeys.set(block.name, keys);
+    }
+    keys.add(blockKey);
+
+    this.worldMemory?.recordBlock(pos, block.name);
   }
 
   private removeBlock(pos: Vec3): void {
@@ -229,11 +417,29 @@ export class SurroundingsHydrater {
     if (blockData) {
       this.removeBlockFromVicinity(blockData.name, pos, blockData.vicinity);
       this.blockLookup.delete(blockKey);
+      this.unindexBlockName(blockData.name, blockKey);
+    }
+  }
+
+  private unindexBlockName(blockName: string, blockKey: string): void {
+    const keys = this.blockNamesToKeys.get(blockName);
+    keys?.delete(blockKey);
+    if (keys?.size === 0) {
+      this.blockNamesToKeys.delete(blockName);
     }
   }
 
   private addBlockToVicinity(block: Block, vicinity: Vicinity): void {
     const pos = block.position;
+    this.markVicinityAsChanged(vicinity);
+    if (this.firstSeenSubscriptions.size > 0) {
+      this.notifyFirstSeen(block.name, vicinity);
+      const biomeName =
+        block.biome && this.bot.registry.biomes[block.biome.id]?.name;
+      if (biomeName) {
+        this.notifyFirstSeen(biomeName, vicinity);
+      }
+    }
 
     if (vicinity === Vicinity.IMMEDIATE_SURROUNDINGS) {
       // Add to immediate surroundings
@@ -294,6 +500,7 @@ export class SurroundingsHydrater {
     pos: Vec3,
     vicinity: Vicinity,
   ): void {
+    this.markVicinityAsChanged(vicinity);
     if (vicinity === Vicinity.IMMEDIATE_SURROUNDINGS) {
       const blocks =
         this.surroundings.immediate.blocksToAllCoords.get(blockName);
@@ -361,135 +568,181 @@ export class SurroundingsHydrater {
     const distance = this.bot.entity.position.distanceTo(pos);
     if (distance > this.radii.distantSurroundingsRadius) return;
 
-    // Determine vicinity
-    const vicinity = this.getVicinityForPosition(pos);
-
-    // Add to appropriate vicinity
-    this.addItemToVicinity(item.name, pos, vicinity, entity.id);
+    // Remove the old entry (in case the entity was somehow processed already)
+    this.removeItemEntity(entity.id);
 
-    // Update lookup map
-    this.entityLookup.set(entity.id, {
+    const entityData: ItemEntityData = {
       name: item.name,
-      vicinity: vicinity,
-    });
+      vicinity: this.getVicinityForPosition(pos),
+      position: pos.clone(),
+    };
+    this.itemEntityLookup.set(entity.id, entityData);
+    this.addItemToVicinity(entity.id, entityData);
   }
 
-  private updateItemEntity(entity: Entity): void {
-    const entityData = this.entityLookup.get(entity.id);
+  private moveItemEntity(entityId: number, pos: Vec3): void {
+    const entityData = this.itemEntityLookup.get(entityId);
     if (!entityData) return;
 
-    const item = entity.getDroppedItem();
-    if (!item) return;
-
-    const pos = entity.position;
-
     // Check if within range
     const distance = this.bot.entity.position.distanceTo(pos);
     if (distance > this.radii.distantSurroundingsRadius) {
-      this.removeItemEntity(entity.id);
+      this.removeItemEntity(entityId);
       return;
     }
 
-    // Determine new vicinity
     const newVicinity = this.getVicinityForPosition(pos);
+    if (newVicinity !== entityData.vicinity) {
+      this.removeItemFromVicinity(entityId, entityData);
+      entityData.vicinity = newVicinity;
+      entityData.position.update(pos);
+      this.addItemToVicinity(entityId, entityData);
+      return;
+    }
 
-    // we would normally not update if the position is the same, but we don't track that currently.
-    this.removeItemFromVicinity(
-      entityData.name,
-      entity.id,
-      entityData.vicinity,
-    );
-
-    // Add to new vicinity
-    this.addItemToVicinity(item.name, pos, newVicinity, entity.id);
-
-    // Update lookup map
-    entityData.vicinity = newVicinity;
+    // Same vicinity: update the (shared) position in place
+    entityData.position.update(pos);
+    if (newVicinity === Vicinity.IMMEDIATE_SURROUNDINGS) {
+      // (Immediate item entity coords are part of the DTO)
+      this.markVicinityAsChanged(newVicinity);
+    } else {
+      const direction = newVicinity as unknown as Direction;
+      const distantDir = this.surroundings.distant.get(direction)!;
+      const closest = distantDir.itemEntitiesToClosestCoords.get(
+        entityData.name,
+      );
+      if (closest === entityData.position) {
+        // It may no longer be the closest
+        this.recalculateClosestItemEntity(direction, entityData.name);
+      } else if (
+        !closest ||
+        distance < this.bot.entity.position.distanceTo(closest)
+      ) {
+        distantDir.itemEntitiesToClosestCoords.set(
+          entityData.name,
+          entityData.position,
+        );
+      }
+    }
   }
 
   private removeItemEntity(entityId: number): void {
-    const entityData = this.entityLookup.get(entityId);
+    const entityData = this.itemEntityLookup.get(entityId);
     if (!entityData) return;
 
-    this.removeItemFromVicinity(entityData.name, entityId, entityData.vicinity);
-    this.entityLookup.delete(entityId);
+    this.removeItemFromVicinity(entityId, entityData);
+    this.itemEntityLookup.delete(entityId);
   }
 
   private addItemToVicinity(
-    itemName: string,
-    pos: Vec3,
-    vicinity: Vicinity,
     entityId: number,
+    entityData: ItemEntityData,
   ): void {
+    const { name: itemName, vicinity, position: pos } = entityData;
+    this.markVicinityAsChanged(vicinity);
+    if (this.firstSeenSubscriptions.size > 0) {
+      this.notifyFirstSeen(itemName, vicinity);
+    }
     if (vicinity === Vicinity.IMMEDIATE_SURROUNDINGS) {
       // Add to immediate surroundings
-      if (!this.surroundings.immediate.itemEntitiesToAllCoords.has(itemName)) {
-        this.surroundings.immediate.itemEntitiesToAllCoords.set(itemName, []);
+      let entityIDsToCoords =
+        this.surroundings.immediate.itemEntitiesToAllCoords.get(itemName);
+      if (!entityIDsToCoords) {
+        entityIDsToCoords = new Map();
+        this.surroundings.immediate.itemEntitiesToAllCoords.set(
+          itemName,
+          entityIDsToCoords,
+        );
       }
-      this.surroundings.immediate.itemEntitiesToAllCoords
-        .get(itemName)!
-        .push(pos.clone());
+      entityIDsToCoords.set(entityId, pos);
     } else {
       // Get direction from vicinity
       const direction = vicinity as unknown as Direction;
       const distantDir = this.surroundings.distant.get(direction)!;
+      const namesToIDs = this.distantItemEntityIDs.get(direction)!;
+      let entityIDs = namesToIDs.get(itemName);
+      if (!entityIDs) {
+        entityIDs = new Set();
+        namesToIDs.set(itemName, entityIDs);
+      }
+      entityIDs.add(entityId);
 
-      // Add to item counts
-      distantDir.itemEntitiesToCounts.set(
-        itemName,
-        (distantDir.itemEntitiesToCounts.get(itemName) || 0) + 1,
-      );
+      // Update item count
+      distantDir.itemEntitiesToCounts.set(itemName, entityIDs.size);
 
       // Update closest item
       const botPos = this.bot.entity.position;
-      const distance = botPos.distanceTo(pos);
       const currentClosest =
         distantDir.itemEntitiesToClosestCoords.get(itemName);
-
-      if (!currentClosest || botPos.distanceTo(currentClosest) > distance) {
-        distantDir.itemEntitiesToClosestCoords.set(itemName, pos.clone());
+      if (
+        !currentClosest ||
+        botPos.distanceTo(currentClosest) > botPos.distanceTo(pos)
+      ) {
+        distantDir.itemEntitiesToClosestCoords.set(itemName, pos);
       }
     }
   }
 
   private removeItemFromVicinity(
-    itemName: string,
     entityId: number,
-    vicinity: Vicinity,
+    entityData: ItemEntityData,
   ): void {
+    const { name: itemName, vicinity } = entityData;
+    this.markVicinityAsChanged(vicinity);
     if (vicinity === Vicinity.IMMEDIATE_SURROUNDINGS) {
-      const items =
-        this.surroundings.immediate.itemEntitiesToAllCoords.get(itemName)!;
-      if (items) {
-        // For immediate vicinity, we need to find the item by its coordinates
-        // This is a limitation since we don't store entity IDs
-        // In a full implementation, we'd want to track entity IDs for immediate vicinity too
-        const newItems = items.filter((_, idx) => idx !== items.length - 1); // Remove last one as approximation
-
-        if (newItems.length > 0) {
-          this.surroundings.immediate.itemEntitiesToAllCoords.set(
-            itemName,
-            newItems,
-          );
-        } else {
+      const entityIDsToCoords =
+        this.surroundings.immediate.itemEntitiesToAllCoords.get(itemName);
+      if (entityIDsToCoords) {
+        entityIDsToCoords.delete(entityId);
+        if (entityIDsToCoords.size === 0) {
           this.surroundings.immediate.itemEntitiesToAllCoords.delete(itemName);
         }
       }
     } else {
       const direction = vicinity as unknown as Direction;
       const distantDir = this.surroundings.distant.get(direction)!;
+      const namesToIDs = this.distantItemEntityIDs.get(direction)!;
+      const entityIDs = namesToIDs.get(itemName);
+      entityIDs?.delete(entityId);
 
-      // Decrease count
-      const count = distantDir.itemEntitiesToCounts.get(itemName) || 0;
-      if (count > 1) {
-        distantDir.itemEntitiesToCounts.set(itemName, count - 1);
-      } else {
+      if (!entityIDs || entityIDs.size === 0) {
+        namesToIDs.delete(itemName);
         distantDir.itemEntitiesToCounts.delete(itemName);
         distantDir.itemEntitiesToClosestCoords.delete(itemName);
+      } else {
+        distantDir.itemEntitiesToCounts.set(itemName, entityIDs.size);
+        const closest = distantDir.itemEntitiesToClosestCoords.get(itemName);
+        if (closest === entityData.position) {
+          this.recalculateClosestItemEntity(direction, itemName);
+        }
       }
     }
   }
 
+  private recalculateClosestItemEntity(
+    direction: Direction,
+    itemName: string,
+  ): void {
+    const distantDir = this.surroundings.distant.get(direction)!;
+    const entityIDs = this.distantItemEntityIDs.get(direction)!.get(itemName);
+    const botPos = this.bot.entity.position;
+    let closest: Vec3 | undefined = undefined;
+    let minDistance = Infinity;
+    for (const entityId of entityIDs ?? []) {
+      const position = this.itemEntityLookup.get(entityId)!.position;
+      const distance = botPos.distanceTo(position);
+      if (distance < minDistance) {
+        minDistance = distance;
+        closest = position;
+      }
+    }
+    if (closest) {
+      distantDir.itemEntitiesToClosestCoords.set(itemName, closest);
+    } else {
+      distantDir.itemEntitiesToClosestCoords.delete(itemName);
+    }
+  }
+
   private recalculateVicinities(): void {
     // Recalculate blocks
     for (const [blockKey, data] of this.blockLookup.entries()) {
@@ -509,6 +762,15 @@ export class SurroundingsHydrater {
       // If vicinity changed, update
       // if (newVicinity !== data.vicinity) {
       const block = this.bot.blockAt(pos)!;
+      if (
+        block &&
+        block.name === data.name &&
+        newVicinity === data.vicinity &&
+        newVicinity === Vicinity.IMMEDIATE_SURROUNDINGS
+      ) {
+        // Nothing to update (so no need to mark the immediate surroundings as changed)
+        continue;
+      }
       if (block && !BLOCKS_TO_IGNORE.includes(block.name)) {
         this.removeBlockFromVicinity(data.name, pos, data.vicinity);
         this.addBlockToVicinity(block, newVicinity);
@@ -520,40 +782,43 @@ export class SurroundingsHydrater {
     }
 
     // Recalculate items
-    for (const [entityId, data] of this.entityLookup.entries()) {
+    for (const entityId of [...this.itemEntityLookup.keys()]) {
       const entity = this.bot.entities[entityId];
       if (!entity) {
         this.removeItemEntity(entityId);
-        continue;
+      } else {
+        this.moveItemEntity(entityId, entity.position);
       }
-
-      // Check if still in range
-      const distance = this.bot.entity.position.distanceTo(entity.position);
-      if (distance > this.radii.distantSurroundingsRadius) {
-        this.removeItemEntity(entityId);
-        continue;
+    }
+    // The bot moving can change which item entities are the closest
+    for (const [direction, namesToIDs] of this.distantItemEntityIDs) {
+      for (const itemName of namesToIDs.keys()) {
+        this.recalculateClosestItemEntity(direction, itemName);
       }
+    }
+  }
 
-      // Determine new vicinity
-      const newVicinity = this.getVicinityForPosition(entity.position);
+  /**
+   * Gets the coordinates of every visible block w/ a given name (in any vicinity).
+   */
+  public getVisibleBlockCoords(blockName: string): Vec3[] {
+    return [...(this.blockNamesToKeys.get(blockName) ?? [])].map((key) => {
+      const [x, y, z] = key.split(",").map(Number);
+      return new Vec3(x, y, z);
+    });
+  }
 
-      // If vicinity changed, update
-      // if (newVicinity !== data.vicinity) {
-      const item = entity.getDroppedItem()!;
-      if (item) {
-        this.removeItemFromVicinity(data.name, entityId, data.vicinity);
-        this.addItemToVicinity(
-          item.name,
-          entity.position,
-          newVicinity,
-          entityId,
-        );
-        data.vicinity = newVicinity;
-      } else {
-        this.removeItemEntity(entityId);
+  /**
+   * Gets the positions of every item entity (in range) of a given item.
+   */
+  public getItemEntityCoords(itemName: string): Vec3[] {
+    const coords: Vec3[] = [];
+    for (const entityData of this.itemEntityLookup.values()) {
+      if (entityData.name === itemName) {
+        coords.push(entityData.position.clone());
       }
-      // }
     }
+    return coords;
   }
 
   // Public method to get the current surroundings
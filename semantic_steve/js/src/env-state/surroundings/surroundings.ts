@@ -1,11 +1,16 @@
 import { Bot } from "mineflayer";
 import { Vec3 } from "vec3";
 import { _Surroundings, SurroundingsRadii, Vicinity } from "./types";
-import { SurroundingsHydrater } from "./hydrater";
+import { FirstSeenCallback, SurroundingsHydrater } from "./hydrater";
+import { WorldMemory } from "./world-memory";
+import { getLogger } from "../../utils/logging";
+
+const logger = getLogger("surroundings");
 
 class HydratableSurroundings extends _Surroundings {
   private hydrater: SurroundingsHydrater;
   private timeOfLastHydration: Date;
+  private _worldMemory?: WorldMemory;
 
   constructor(bot: Bot, radii: SurroundingsRadii) {
     super(bot, radii);
@@ -20,9 +25,12 @@ class HydratableSurroundings extends _Surroundings {
     const shouldHydrate = timeSinceLastHydrationMS > throttleMS;
 
     if (shouldHydrate) {
-      console.log("Hydrating surroundings...");
+      logger.debug("Hydrating surroundings...");
+      // NOTE: The hydrater keeps these up to date (and versioned) in place, so we only
+      // need to start sharing them
       const hydrated = this.hydrater.getHydration();
-      Object.assign(this, hydrated);
+      this.immediate = hydrated.immediate;
+      this.distant = hydrated.distant;
       this.timeOfLastHydration = new Date();
     }
   }
@@ -30,6 +38,48 @@ class HydratableSurroundings extends _Surroundings {
   public getVicinityForPosition(pos: Vec3): Vicinity {
     return this.hydrater.getVicinityForPosition(pos);
   }
+
+  /**
+   * Gets the coordinates of every visible block w/ a given name, straight from the
+   * hydrater's (always up-to-date) indexes.
+   */
+  public getVisibleBlockCoords(blockName: string): Vec3[] {
+    return this.hydrater.getVisibleBlockCoords(blockName);
+  }
+
+  /**
+   * Gets the positions of every item entity (in range) of a given item, straight from the
+   * hydrater's (always up-to-date) indexes.
+   */
+  public getItemEntityCoords(itemName: string): Vec3[] {
+    return this.hydrater.getItemEntityCoords(itemName);
+  }
+
+  /**
+   * Opt-in persistent memory of the blocks seen so far (undefined unless attached).
+   */
+  public get worldMemory(): WorldMemory | undefined {
+    return this._worldMemory;
+  }
+
+  public attachWorldMemory(worldMemory: WorldMemory): void {
+    this._worldMemory = worldMemory;
+    this.hydrater.attachWorldMemory(worldMemory);
+  }
+
+  /**
+   * Subscribes to the first time any of the given things is visible (see
+   * `SurroundingsHydrater.onFirstSeen`).
+   *
+   * @returns A function that unsubscribes.
+   */
+  public onFirstSeen(
+    thingNames: string[],
+    vicinityFilter: Vicinity[] | undefined,
+    callback: FirstSeenCallback,
+  ): () => void {
+    return this.hydrater.onFirstSeen(thingNames, vicinityFilter, callback);
+  }
 }
 
 export { HydratableSurroundings as Surroundings };
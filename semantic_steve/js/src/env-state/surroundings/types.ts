@@ -138,18 +138,27 @@ export class ImmediateSurroundings {
   bot: Bot;
   blocksToAllCoords: Map<string, Vec3[]>;
   biomes: Set<number>;
-  // this is currently dropped item name mapped to coords, not the entity name.
-  itemEntitiesToAllCoords: Map<string, Vec3[]>;
+  // Dropped item name (not the entity name) -> entity ID -> coords
+  itemEntitiesToAllCoords: Map<string, Map<number, Vec3>>;
+  // Bumped (by the hydrater) whenever the contents of the DTO may have changed
+  version: number;
+  private cachedDTO?: ImmediateSurroundingsDTO;
+  private cachedDTOVersion?: number;
 
   constructor(bot: Bot) {
     this.bot = bot;
     this.blocksToAllCoords = new Map<string, Vec3[]>();
     this.biomes = new Set<number>();
-    this.itemEntitiesToAllCoords = new Map<string, Vec3[]>();
+    this.itemEntitiesToAllCoords = new Map<string, Map<number, Vec3>>();
+    this.version = 0;
   }
 
   getDTO(): ImmediateSurroundingsDTO {
-    return {
+    if (this.cachedDTO && this.cachedDTOVersion === this.version) {
+      return this.cachedDTO;
+    }
+    this.cachedDTOVersion = this.version;
+    this.cachedDTO = {
       visibleBlocks: Object.fromEntries(
         [...this.blocksToAllCoords.entries()].map(([block, allCoords]) => [
           block,
@@ -162,7 +171,7 @@ export class ImmediateSurroundings {
       visibleItems: Object.fromEntries(
         [...this.itemEntitiesToAllCoords.entries()].map(([item, allCoords]) => [
           item,
-          allCoords.map((coords) => [
+          [...allCoords.values()].map((coords) => [
             Number(coords.x.toFixed(2)),
             Number(coords.y.toFixed(2)),
             Number(coords.z.toFixed(2)),
@@ -170,6 +179,7 @@ export class ImmediateSurroundings {
         ]),
       ),
     };
+    return this.cachedDTO;
   }
 }
 
@@ -202,6 +212,10 @@ export class DistantSurroundingsInADirection {
   biomesToClosestCoords: Map<number, Vec3>;
   itemEntitiesToCounts: Map<string, number>;
   itemEntitiesToClosestCoords: Map<string, Vec3>;
+  // Bumped (by the hydrater) whenever the contents of the DTO may have changed
+  version: number;
+  private cachedDTO?: DistantSurroundingsInADirectionDTO;
+  private cachedDTOVersion?: number;
 
   constructor(bot: Bot) {
     this.bot = bot;
@@ -210,16 +224,22 @@ export class DistantSurroundingsInADirection {
     this.biomesToClosestCoords = new Map<number, Vec3>();
     this.itemEntitiesToCounts = new Map<string, number>();
     this.itemEntitiesToClosestCoords = new Map<string, Vec3>();
+    this.version = 0;
   }
 
   getDTO(): DistantSurroundingsInADirectionDTO {
-    return {
+    if (this.cachedDTO && this.cachedDTOVersion === this.version) {
+      return this.cachedDTO;
+    }
+    this.cachedDTOVersion = this.version;
+    this.cachedDTO = {
       visibleBlockCounts: Object.fromEntries(this.blocksToCounts),
       visibleBiomes: Array.from(this.biomesToClosestCoords.keys()).map(
         (biomeId) => this.bot.registry.biomes[biomeId].name,
       ),
       visibleItemCounts: Object.fromEntries(this.itemEntitiesToCounts),
     };
+    return this.cachedDTO;
   }
 }
 
@@ -299,6 +319,17 @@ export class _Surroundings {
     );
   }
 
+  /**
+   * Sum of the versions of all sections (changes whenever any section changes).
+   */
+  get version(): number {
+    let version = this.immediate.version;
+    for (const distantInDirection of this.distant.values()) {
+      version += distantInDirection.version;
+    }
+    return version;
+  }
+
   getDTO(): SurroundingsDTO {
     return {
       immediateSurroundings: this.immediate.getDTO(),
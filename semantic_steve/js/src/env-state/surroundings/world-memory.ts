@@ -0,0 +1,276 @@
+import * as fs from "fs";
+import * as path from "path";
+import { Bot } from "mineflayer";
+import { Vec3 } from "vec3";
+import { getLogger } from "../../utils/logging";
+
+const logger = getLogger("world-memory");
+
+// How often pending writes are flushed (in one transaction)
+const WORLD_MEMORY_FLUSH_INTERVAL_MS = 1000;
+// Number of pending writes at which they're flushed early
+const WORLD_MEMORY_MAX_PENDING_WRITES = 20000;
+// How much of the database file SQLite may memory-map
+const WORLD_MEMORY_MMAP_SIZE_BYTES = 256 * 1024 * 1024;
+// Max. distance (in chunks) searched when looking for the nearest known block
+const WORLD_MEMORY_MAX_SEARCH_CHUNK_RADIUS = 64;
+// Blocks that aren't remembered (cells seen to be one of these are forgotten instead)
+const AIR_BLOCK_NAMES = new Set(["air", "cave_air", "void_air"]);
+
+export function isAirBlockName(blockName: string): boolean {
+  return AIR_BLOCK_NAMES.has(blockName);
+}
+
+// NOTE: Rows are clustered by (dimension, chunk) (i.e., chunk-partitioned), and indexed
+// by (dimension, name, chunk) for finding known blocks of a given type. Keep in sync w/
+// semantic_steve/py/world_memory.py.
+const SCHEMA = `
+  CREATE TABLE IF NOT EXISTS blocks (
+    dimension TEXT NOT NULL,
+    chunk_x INTEGER NOT NULL,
+    chunk_z INTEGER NOT NULL,
+    x INTEGER NOT NULL,
+    y INTEGER NOT NULL,
+    z INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    last_seen_ms INTEGER NOT NULL,
+    PRIMARY KEY (dimension, chunk_x, chunk_z, x, y, z)
+  ) WITHOUT ROWID;
+  CREATE INDEX IF NOT EXISTS blocks_by_name
+    ON blocks (dimension, name, chunk_x, chunk_z);
+`;
+
+export type KnownBlock = {
+  name: string;
+  coordinates: [number, number, number];
+  lastSeenMS: number;
+};
+
+/**
+ * Gets the file name of the world memory of a world (e.g., of a server's host & port).
+ */
+export function getWorldMemoryFileName(worldName: string): string {
+  return `${worldName.replace(/[^a-zA-Z0-9_.-]/g, "_")}.sqlite`;
+}
+
+/**
+ * Opt-in, persistent memory of the last-seen block at every position the bot has seen,
+ * stored in a SQLite database (w/ one file per world, and one partition per dimension).
+ *
+ * The surroundings hydrater feeds it the blocks it sees (and the blocks it sees being
+ * removed). These writes are batched in memory and flushed in one transaction every
+ * `WORLD_MEMORY_FLUSH_INTERVAL_MS`. Queries only read the chunks they need (via the
+ * memory-mapped database file), and the database can be read concurrently (e.g., by
+ * Python for offline analysis) since it is in WAL mode.
+ */
+export class WorldMemory {
+  private bot: Bot;
+  private db: any;
+  private upsertStatement: any;
+  private deleteStatement: any;
+  // "x,y,z" -> block name (or null if the block was removed) to write
+  private pendingWrites: Map<string, string | null> = new Map();
+  private pendingWritesDimension?: string;
+  private flushInterval: NodeJS.Timeout;
+
+  constructor(bot: Bot, dbPath: string) {
+    // NOTE: node:sqlite is built into Node (>= 22.5), so no native dependency is needed
+    const { DatabaseSync } = require("node:sqlite");
+    fs.mkdirSync(path.dirname(dbPath), { recursive: true });
+    this.bot = bot;
+    this.db = new DatabaseSync(dbPath);
+    this.db.exec(`
+      PRAGMA journal_mode = WAL;
+      PRAGMA synchronous = NORMAL;
+      PRAGMA mmap_size = ${WORLD_MEMORY_MMAP_SIZE_BYTES};
+    `);
+    this.db.exec(SCHEMA);
+    this.upsertStatement = this.db.prepare(
+      "INSERT OR REPLACE INTO blocks VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+    );
+    this.deleteStatement = this.db.prepare(
+      "DELETE FROM blocks WHERE dimension = ? AND chunk_x = ? AND chunk_z = ? " +
+        "AND x = ? AND y = ? AND z = ?",
+    );
+    this.flushInterval = setInterval(
+      () => this.flush(),
+      WORLD_MEMORY_FLUSH_INTERVAL_MS,
+    );
+    this.flushInterval.unref();
+    this.bot.once("end", () => this.close());
+  }
+
+  /**
+   * Opens the world memory of a world in a directory, or returns undefined (w/ a warning)
+   * if it can't be opened (e.g., if this Node version doesn't have node:sqlite).
+   */
+  public static tryOpen(
+    bot: Bot,
+    dir: string,
+    worldName: string,
+  ): WorldMemory | undefined {
+    const dbPath = path.join(dir, getWorldMemoryFileName(worldName));
+    try {
+      return new WorldMemory(bot, dbPath);
+    } catch (error) {
+      logger.warning(`Failed to open world memory at ${dbPath}`, error);
+    }
+  }
+
+  private get dimension(): string {
+    return String(this.bot.game.dimension).replace(/^minecraft:/, "");
+  }
+
+  // ========
+  // Writing
+  // ========
+
+  /**
+   * Records the block seen at some coordinates (seeing air there forgets what was there).
+   */
+  public recordBlock(pos: Vec3, blockName: string): void {
+    this.addPendingWrite(pos, isAirBlockName(blockName) ? null : blockName);
+  }
+
+  public forgetBlock(pos: Vec3): void {
+    this.addPendingWrite(pos, null);
+  }
+
+  private addPendingWrite(pos: Vec3, blockName: string | null): void {
+    const dimension = this.dimension;
+    if (this.pendingWritesDimension !== dimension) {
+      this.flush(); // (Pending writes are all of one dimension)
+      this.pendingWritesDimension = dimension;
+    }
+    const key = `${Math.floor(pos.x)},${Math.floor(pos.y)},${Math.floor(pos.z)}`;
+    this.pendingWrites.set(key, blockName);
+    if (this.pendingWrites.size >= WORLD_MEMORY_MAX_PENDING_WRITES) {
+      this.flush();
+    }
+  }
+
+  public flush(): void {
+    if (this.pendingWrites.size === 0) {
+      return;
+    }
+    const dimension = this.pendingWritesDimension;
+    const now = Date.now();
+    this.db.exec("BEGIN");
+    try {
+      for (const [key, blockName] of this.pendingWrites) {
+        const [x, y, z] = key.split(",").map(Number);
+        const location = [dimension, x >> 4, z >> 4, x, y, z];
+        if (blockName === null) {
+          this.deleteStatement.run(...location);
+        } else {
+          this.upsertStatement.run(...location, blockName, now);
+        }
+      }
+      this.db.exec("COMMIT");
+    } catch (error) {
+      this.db.exec("ROLLBACK");
+      logger.error("Failed to flush world memory", error);
+    }
+    this.pendingWrites.clear();
+  }
+
+  public close(): void {
+    clearInterval(this.flushInterval);
+    this.flush();
+    this.db.close();
+  }
+
+  // ========
+  // Queries
+  // ========
+
+  /**
+   * Finds the nearest known block w/ a given name (in the bot's current dimension).
+   */
+  public getNearestKnown(
+    blockName: string,
+    from: Vec3,
+    maxChunkRadius: number = WORLD_MEMORY_MAX_SEARCH_CHUNK_RADIUS,
+  ): KnownBlock | undefined {
+    this.flush();
+    const statement = this.db.prepare(
+      "SELECT name, x, y, z, last_seen_ms FROM blocks WHERE dimension = ? AND " +
+        "name = ? AND chunk_x BETWEEN ? AND ? AND chunk_z BETWEEN ? AND ?",
+    );
+    const chunkX = Math.floor(from.x) >> 4;
+    const chunkZ = Math.floor(from.z) >> 4;
+    const getNearestWithin = (chunkRadius: number) => {
+      let nearest: any = undefined;
+      let minDistance = Infinity;
+      const rows = statement.all(
+        this.dimension,
+        blockName,
+        chunkX - chunkRadius,
+        chunkX + chunkRadius,
+        chunkZ - chunkRadius,
+        chunkZ + chunkRadius,
+      );
+      for (const row of rows) {
+        const distance = from.distanceTo(new Vec3(row.x, row.y, row.z));
+        if (distance < minDistance) {
+          minDistance = distance;
+          nearest = row;
+        }
+      }
+      return { nearest, minDistance };
+    };
+
+    // Search growing squares of chunks until one has a match
+    for (
+      let chunkRadius = 1;
+      chunkRadius <= maxChunkRadius;
+      chunkRadius = Math.min(chunkRadius * 2, maxChunkRadius + 1)
+    ) {
+      let { nearest, minDistance } = getNearestWithin(chunkRadius);
+      if (!nearest) {
+        continue;
+      }
+      // A nearer one could be in a chunk just outside the square
+      const coveringChunkRadius = Math.min(
+        Math.ceil(minDistance / 16) + 1,
+        maxChunkRadius,
+      );
+      if (coveringChunkRadius > chunkRadius) {
+        ({ nearest } = getNearestWithin(coveringChunkRadius));
+      }
+      return {
+        name: nearest.name,
+        coordinates: [nearest.x, nearest.y, nearest.z],
+        lastSeenMS: nearest.last_seen_ms,
+      };
+    }
+  }
+
+  /**
+   * Counts the known blocks of each type in a region of chunks (in the bot's current
+   * dimension), given the block coordinates of two of its opposite corners.
+   */
+  public getKnownCountsInRegion(
+    corner1: Vec3,
+    corner2: Vec3,
+  ): { [blockName: string]: number } {
+    this.flush();
+    const rows = this.db
+      .prepare(
+        "SELECT name, COUNT(*) AS count FROM blocks WHERE dimension = ? AND " +
+          "chunk_x BETWEEN ? AND ? AND chunk_z BETWEEN ? AND ? GROUP BY name",
+      )
+      .all(
+        this.dimension,
+        Math.floor(Math.min(corner1.x, corner2.x)) >> 4,
+        Math.floor(Math.max(corner1.x, corner2.x)) >> 4,
+        Math.floor(Math.min(corner1.z, corner2.z)) >> 4,
+        Math.floor(Math.max(corner1.z, corner2.z)) >> 4,
+      );
+    const counts: { [blockName: string]: number } = {};
+    for (const row of rows) {
+      counts[row.name] = Number(row.count);
+    }
+    return counts;
+  }
+}
@@ -15,6 +15,16 @@ const config = new SemanticSteveConfig({
   botPort: parseInt(process.env.BOT_PORT || "25565"),
   mfViewerPort: parseInt(process.env.MF_VIEWER_PORT || "3000"),
   zmqPort: parseInt(process.env.ZMQ_PORT || "5555"),
+  zmqEndpoint: process.env.ZMQ_ENDPOINT || undefined,
+  sharedMemoryPath: process.env.SHARED_MEMORY_PATH || undefined,
+  worldMemoryDir: process.env.WORLD_MEMORY_DIR || undefined,
+  profileDir: process.env.PROFILE_DIR || undefined,
+  profileNSlowest: process.env.PROFILE_N_SLOWEST
+    ? parseInt(process.env.PROFILE_N_SLOWEST)
+    : undefined,
+  heapSnapshotThresholdMB: process.env.HEAP_SNAPSHOT_THRESHOLD_MB
+    ? parseFloat(process.env.HEAP_SNAPSHOT_THRESHOLD_MB)
+    : undefined,
   immediateSurroundingsRadius: parseInt(
     process.env.IMMEDIATE_SURROUNDINGS_RADIUS || "5",
   ),
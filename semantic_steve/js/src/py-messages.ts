@@ -5,6 +5,7 @@ import { InventoryChangesDTO } from "./types";
 export type SkillInvocation = {
   skillName: string;
   args: any[];
+  invocationID?: number; // Tags the invocation's profiles (when profiling)
 };
 
 // We send these to python
@@ -13,3 +14,15 @@ export type DataFromMinecraft = {
   skillInvocationResults?: string;
   inventoryChanges?: InventoryChangesDTO;
 };
+
+// We receive these from python (in between skill invocations)
+export type SurroundingsQuery = {
+  queryName: string;
+  args: any[];
+};
+
+// We send these to python in response to a SurroundingsQuery
+export type SurroundingsQueryResponse = {
+  queryResult?: unknown;
+  queryError?: string;
+};
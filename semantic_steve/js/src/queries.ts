@@ -0,0 +1,217 @@
+import { Bot } from "mineflayer";
+import { Vec3 } from "vec3";
+import { SurroundingsQuery, SurroundingsQueryResponse } from "./py-messages";
+import { Block, ItemEntity, Thing } from "./thing";
+import { InvalidThingError } from "./types";
+import {
+  getAllPlaceableCoords,
+  PLACEABLE_COORDS_RADIUS,
+} from "./utils/placing";
+import { getLogger } from "./utils/logging";
+import { WorldMemory } from "./env-state/surroundings/world-memory";
+
+const logger = getLogger("queries");
+
+/**
+ * Error for queries that can't be answered given their arguments.
+ */
+export class InvalidQueryError extends Error {
+  constructor(message: string) {
+    super(message);
+    this.name = "InvalidQueryError";
+  }
+}
+
+type Coords = [number, number, number];
+
+function toCoords(vec: Vec3): Coords {
+  return [vec.x, vec.y, vec.z];
+}
+
+function parseCoords(coords: unknown): Vec3 {
+  if (
+    !Array.isArray(coords) ||
+    coords.length !== 3 ||
+    !coords.every((c) => typeof c === "number")
+  ) {
+    throw new InvalidQueryError(
+      `Invalid coordinates: ${JSON.stringify(coords)}. Expected [x, y, z].`,
+    );
+  }
+  return new Vec3(coords[0], coords[1], coords[2]);
+}
+
+function parseRadius(radius: unknown): number {
+  if (typeof radius !== "number" || !(radius >= 0)) {
+    throw new InvalidQueryError(
+      `Invalid radius: ${JSON.stringify(radius)}. Expected a non-negative number.`,
+    );
+  }
+  return radius;
+}
+
+/**
+ * Gets the coordinates of all visible instances of a block or item entity.
+ */
+function getAllVisibleCoords(bot: Bot, thing: Thing): Vec3[] {
+  if (thing instanceof Block) {
+    return bot.envState.surroundings.getVisibleBlockCoords(thing.name);
+  } else if (thing instanceof ItemEntity) {
+    return bot.envState.surroundings.getItemEntityCoords(thing.name);
+  }
+  throw new InvalidQueryError(
+    `Can't get the coordinates of all instances of ${thing.name} (only of blocks ` +
+      `and item entities).`,
+  );
+}
+
+function getWorldMemory(bot: Bot): WorldMemory {
+  const worldMemory = bot.envState.surroundings.worldMemory;
+  if (!worldMemory) {
+    throw new InvalidQueryError(
+      "World memory is disabled (it must be enabled w/ a world memory dir).",
+    );
+  }
+  return worldMemory;
+}
+
+// ========
+// Queries
+// ========
+
+// NOTE: These only read the surroundings' (always up-to-date) indexes (or the world
+// memory), i.e., they never run skills, hydrate the envState, or serialize it.
+const QUERIES: {
+  [queryName: string]: (bot: Bot, ...args: any[]) => Promise<unknown> | unknown;
+} = {
+  /**
+   * The coordinates of (and distance to) the nearest visible instance of a thing, or
+   * null if none is visible.
+   */
+  nearest: async (bot: Bot, thingName: string) => {
+    const thing = bot.thingFactory.createThing(thingName);
+    const coords = await thing.locateNearest();
+    if (!coords) {
+      return null;
+    }
+    return {
+      coordinates: toCoords(coords),
+      distance: bot.entity.position.distanceTo(coords),
+    };
+  },
+
+  /**
+   * The number of visible instances of a block or item entity within a radius (of the
+   * bot).
+   */
+  countInRadius: (bot: Bot, thingName: string, radius: unknown) => {
+    const thing = bot.thingFactory.createThing(thingName);
+    const maxDistance = parseRadius(radius);
+    const botPosition = bot.entity.position;
+    return getAllVisibleCoords(bot, thing).filter(
+      (coords) => botPosition.distanceTo(coords) <= maxDistance,
+    ).length;
+  },
+
+  /**
+   * Whether a thing is visible anywhere in the bot's surroundings.
+   */
+  isVisible: (bot: Bot, thingName: string) => {
+    const thing = bot.thingFactory.createThing(thingName);
+    return (
+      thing.isVisibleInImmediateSurroundings() ||
+      thing.isVisibleInDistantSurroundings()
+    );
+  },
+
+  /**
+   * The placeable coordinates within a radius of some coordinates (default: the bot's
+   * position), closest to those coordinates first. Only the coordinates in the cube
+   * within `PLACEABLE_COORDS_RADIUS` of the bot (i.e., w/in its reach) are considered,
+   * so the given coordinates must be in that cube too.
+   */
+  placeableNear: (bot: Bot, coordinates?: unknown, radius?: unknown) => {
+    const center =
+      coordinates === undefined || coordinates === null
+        ? bot.entity.position
+        : parseCoords(coordinates);
+    const botVoxel = bot.entity.position.floored();
+    const centerVoxel = center.floored();
+    if (
+      Math.abs(centerVoxel.x - botVoxel.x) > PLACEABLE_COORDS_RADIUS ||
+      Math.abs(centerVoxel.y - botVoxel.y) > PLACEABLE_COORDS_RADIUS ||
+      Math.abs(centerVoxel.z - botVoxel.z) > PLACEABLE_COORDS_RADIUS
+    ) {
+      throw new InvalidQueryError(
+        `Coordinates must be within ${PLACEABLE_COORDS_RADIUS} blocks of the bot ` +
+          "(along each axis), i.e., w/in its reach.",
+      );
+    }
+    const maxDistance =
+      radius === undefined || radius === null ? Infinity : parseRadius(radius);
+    return getAllPlaceableCoords(bot)
+      .map((coords): [Vec3, number] => [coords, center.distanceTo(coords)])
+      .filter(([, distance]) => distance <= maxDistance)
+      .sort((a, b) => a[1] - b[1])
+      .map(([coords]) => toCoords(coords));
+  },
+
+  /**
+   * The coordinates of (and distance to) the nearest block of a type that the bot has
+   * ever seen (in its current dimension), or null if none is known.
+   */
+  nearestKnown: (bot: Bot, blockName: string) => {
+    const block = bot.thingFactory.createThing(blockName);
+    if (!(block instanceof Block)) {
+      throw new InvalidQueryError(`${blockName} is not a block.`);
+    }
+    const botPosition = bot.entity.position;
+    const known = getWorldMemory(bot).getNearestKnown(block.name, botPosition);
+    if (!known) {
+      return null;
+    }
+    return {
+      coordinates: known.coordinates,
+      distance: botPosition.distanceTo(new Vec3(...known.coordinates)),
+    };
+  },
+
+  /**
+   * The number of blocks of each type that the bot has ever seen in the chunks spanned
+   * by two opposite corners (in its current dimension).
+   */
+  knownCountsInRegion: (bot: Bot, corner1: unknown, corner2: unknown) => {
+    return getWorldMemory(bot).getKnownCountsInRegion(
+      parseCoords(corner1),
+      parseCoords(corner2),
+    );
+  },
+};
+
+/**
+ * Answers a query about the bot's surroundings (w/out running a skill).
+ */
+export async function answerSurroundingsQuery(
+  bot: Bot,
+  query: SurroundingsQuery,
+): Promise<SurroundingsQueryResponse> {
+  const answer = QUERIES[query.queryName];
+  if (!answer) {
+    return {
+      queryError:
+        `Unknown query: ${query.queryName}. Supported queries are: ` +
+        `${Object.keys(QUERIES).join(", ")}.`,
+    };
+  }
+  try {
+    return { queryResult: await answer(bot, ...(query.args ?? [])) };
+  } catch (error) {
+    if (
+      !(error instanceof InvalidThingError) &&
+      !(error instanceof InvalidQueryError)
+    ) {
+      logger.error(`Query ${query.queryName} threw an error!`, error);
+    }
+    return { queryError: (error as Error).message ?? String(error) };
+  }
+}
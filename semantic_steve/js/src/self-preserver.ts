@@ -1,4 +1,16 @@
 import { Bot } from "mineflayer";
+import { getEntityIndex, isHostile } from "./utils/entity-index";
+import { getHazardMap } from "./utils/hazard-map";
+import { getLogger } from "./utils/logging";
+
+const logger = getLogger("self-preserver");
+
+// Radius (in blocks) within which hostile mobs are considered threats
+const HOSTILE_MOB_THREAT_RADIUS = 8;
+// Radius (in blocks) within which lava, fire, and void cells are considered threats
+const HAZARD_THREAT_RADIUS = 1.5;
+// Oxygen level (out of 20) below which the bot is considered to be drowning
+const DROWNING_OXYGEN_LEVEL = 6;
 
 /**
  * SelfPreserver monitors the bot's environment and health to trigger self-preservation actions when needed.
@@ -6,9 +18,11 @@ import { Bot } from "mineflayer";
  * to execute survival behaviors.
  */
 export class SelfPreserver {
-  // NOTE: Not yet implemented
   private bot: Bot;
   private checkThrottleMS: number;
+  private timeOfLastCheck: number = 0;
+  // Threats found by the last check
+  private threats: string[] = [];
 
   /**
    * Creates a new SelfPreserver instance.
@@ -18,6 +32,8 @@ export class SelfPreserver {
   constructor(bot: Bot, checkThrottleMS: number) {
     this.bot = bot;
     this.checkThrottleMS = checkThrottleMS;
+    // NOTE: The entity index and hazard map (and their event listeners) are only created
+    // by the first threat check, so they cost nothing until threats are asked for
   }
 
   /**
@@ -26,12 +42,60 @@ export class SelfPreserver {
    * @returns {boolean} - True if self-preservation is needed, false otherwise.
    */
   public shouldSelfPreserve(): boolean {
-    // this.bot.envState.hydrate(this.CheckThrottleMS);
-    // TODO: Check hydrated envState for threatening mobs, low hunger, drowning, etc.
-    return false; // FIXME
+    // NOTE: Until invoke() takes actual survival actions, pausing the active skill for it
+    // would only cost throughput, so threats are just surfaced (see getThreats) for now
+    return false;
+  }
+
+  /**
+   * Gets the current threats to the bot, rechecking them at most once per
+   * `checkThrottleMS` (and reusing the last check's result in between).
+   */
+  public getThreats(): string[] {
+    const now = Date.now();
+    if (now - this.timeOfLastCheck >= this.checkThrottleMS) {
+      this.timeOfLastCheck = now;
+      this.threats = this.findThreats();
+    }
+    return this.threats;
+  }
+
+  /**
+   * Finds the current threats w/ the (incrementally maintained) entity index and hazard
+   * map, i.e., only visiting what is near the bot.
+   */
+  private findThreats(): string[] {
+    const threats: string[] = [];
+    const position = this.bot.entity.position;
+    // TODO: Also check for low hunger, low health, etc.
+
+    const hostileMobs = getEntityIndex(this.bot).getEntitiesNear(
+      position,
+      HOSTILE_MOB_THREAT_RADIUS,
+      ["hostile", "mob"],
+      isHostile,
+    );
+    for (const mob of hostileMobs) {
+      const distance = mob.position.distanceTo(position).toFixed(1);
+      threats.push(`Hostile ${mob.name} ${distance} blocks away`);
+    }
+
+    const hazards = getHazardMap(this.bot).getHazardsNearBot(
+      HAZARD_THREAT_RADIUS,
+    );
+    for (const { hazard, coords } of hazards) {
+      threats.push(`${hazard} at [${coords.x}, ${coords.y}, ${coords.z}]`);
+    }
+
+    if (this.bot.oxygenLevel < DROWNING_OXYGEN_LEVEL) {
+      threats.push(`Drowning (oxygen level: ${this.bot.oxygenLevel}/20)`);
+    }
+    return threats;
   }
 
   public async invoke(): Promise<string> {
-    return ""; // TODO: Implement self-preservation (and returning of results?)
+    const threats = this.getThreats();
+    logger.debug(() => `Self-preserving from: ${threats.join("; ")}`);
+    return threats.join("; ");
   }
 }
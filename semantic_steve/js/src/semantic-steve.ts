@@ -1,7 +1,12 @@
 import * as zmq from "zeromq";
 import assert from "assert";
 import { Bot } from "mineflayer";
-import { SkillInvocation, DataFromMinecraft } from "./py-messages";
+import {
+  SkillInvocation,
+  DataFromMinecraft,
+  SurroundingsQuery,
+} from "./py-messages";
+import { answerSurroundingsQuery } from "./queries";
 import { SelfPreserver } from "./self-preserver";
 import {
   Skill,
@@ -11,27 +16,58 @@ import {
 } from "./skill";
 import { SkillResult, SemanticSteveConfig } from "./types";
 import { getInventoryChangesDTO } from "./utils/inventory-changes";
+import { getLogger } from "./utils/logging";
+import { SharedMemoryRing } from "./utils/shared-memory";
+import { SkillProfiler } from "./utils/profiling";
+import { WorldMemory } from "./env-state/surroundings/world-memory";
+import { SHARED_MEMORY_MIN_PAYLOAD_BYTES } from "./constants";
+
+const logger = getLogger("semantic-steve");
 
 export class SemanticSteve {
   private bot: Bot;
   private socket: zmq.Pair;
-  private zmqPort: number;
+  private zmqEndpoint: string;
+  private sharedMemoryRing?: SharedMemoryRing;
+  private skillProfiler?: SkillProfiler;
   private selfPreserver: SelfPreserver;
   private skills: { [key: string]: Skill };
   private activeSkill?: Skill;
   private timeOfLastSkillInvocation?: number;
-  private itemTotalsAtTimeOfLastMsgToPython?: Map<string, number>;
+  private inventoryJournalPositionAtTimeOfLastMsgToPython?: number;
   private hasDiedWhileAwaitingInvocation: boolean = false;
 
   constructor(
     bot: Bot,
     config: SemanticSteveConfig = new SemanticSteveConfig(),
   ) {
-    console.log("Javascript: Initializing SemanticSteve...");
+    logger.info("Javascript: Initializing SemanticSteve...");
     this.bot = bot;
 
     this.socket = new zmq.Pair({ receiveTimeout: 0 });
-    this.zmqPort = config.zmqPort;
+    this.zmqEndpoint = config.zmqEndpoint;
+    if (config.sharedMemoryPath) {
+      this.sharedMemoryRing = new SharedMemoryRing(config.sharedMemoryPath);
+    }
+
+    if (config.profileDir) {
+      this.skillProfiler = new SkillProfiler(
+        config.profileDir,
+        config.profileNSlowest,
+        config.heapSnapshotThresholdMB,
+      );
+    }
+
+    if (config.worldMemoryDir) {
+      const worldMemory = WorldMemory.tryOpen(
+        this.bot,
+        config.worldMemoryDir,
+        `${config.botHost}_${config.botPort}`,
+      );
+      if (worldMemory) {
+        this.bot.envState.surroundings.attachWorldMemory(worldMemory);
+      }
+    }
 
     this.selfPreserver = new SelfPreserver(
       this.bot,
@@ -49,9 +85,25 @@ export class SemanticSteve {
   // =======================================
 
   private async sendDataToPython(data: DataFromMinecraft): Promise<void> {
-    this.itemTotalsAtTimeOfLastMsgToPython =
-      this.bot.envState.inventory.itemsToTotalCounts;
-    await this.socket.send(JSON.stringify(data));
+    const inventory = this.bot.envState.inventory;
+    this.inventoryJournalPositionAtTimeOfLastMsgToPython =
+      inventory.journalPosition;
+    inventory.discardJournalBefore(inventory.journalPosition);
+    const payload = Buffer.from(JSON.stringify(data));
+    // Stop profiling the skill invocation (if any) that this data resolves
+    await this.skillProfiler?.stop();
+    if (
+      this.sharedMemoryRing &&
+      payload.length >= SHARED_MEMORY_MIN_PAYLOAD_BYTES
+    ) {
+      // Only notify Python of where in shared memory the payload was written
+      const notification = this.sharedMemoryRing.write(payload);
+      if (notification) {
+        await this.socket.send(JSON.stringify(notification));
+        return;
+      }
+    }
+    await this.socket.send(payload);
   }
 
   private async checkForMsgFromPython(): Promise<string | undefined> {
@@ -64,10 +116,29 @@ export class SemanticSteve {
     }
   }
 
+  private async answerQuery(query: SurroundingsQuery): Promise<void> {
+    logger.debug(() => `Answering query ${query.queryName}(${query.args})`);
+    const response = await answerSurroundingsQuery(this.bot, query);
+    await this.socket.send(JSON.stringify(response));
+  }
+
   // ================================
   // Skill invocation and resolution
   // ================================
 
+  private handleSkillInvocation(skillInvocation: SkillInvocation): void {
+    if (this.hasDiedWhileAwaitingInvocation) {
+      this.hasDiedWhileAwaitingInvocation = false; // Reset the flag
+      const result = new GenericSkillResults.DeathWhileAwaitingInvocation(
+        skillInvocation.skillName,
+      );
+      // NOTE: Faux skill-resolution w/out ever ever having an active skill
+      this.handleSkillResolution(result);
+    } else {
+      this.invokeSkill(skillInvocation);
+    }
+  }
+
   private invokeSkill(skillInvocation: SkillInvocation): void {
     assert(!this.activeSkill);
     // Add skill invocation to the macrotask queue (wrapped w/ handling of errors)
@@ -81,29 +152,37 @@ export class SemanticSteve {
         return;
       }
       const skillToInvoke = this.skills[skillInvocation.skillName];
+      // (Awaited before setting the fields below, so they are never seen half-set)
+      await this.skillProfiler?.start(
+        skillInvocation.skillName,
+        skillInvocation.invocationID,
+      );
       // Set fields that are to be set while skills are running
       this.activeSkill = this.skills[skillInvocation.skillName] ?? undefined;
-      console.log(
-        `Invoking skill ${skillInvocation.skillName} w/ args: ${skillInvocation.args}`,
+      logger.info(
+        () =>
+          `Invoking skill ${skillInvocation.skillName} w/ args: ${skillInvocation.args}`,
       );
       this.timeOfLastSkillInvocation = Date.now();
       try {
         await skillToInvoke.invoke(...skillInvocation.args);
       } catch (error) {
         if (!this.activeSkill) {
-          console.warn(
+          logger.error(
             `Skill.invoke (${skillInvocation.skillName}) threw an error and, somehow, ` +
               `the SemanticSteve.activeSkill became undefined before the error was ` +
               `thrown. Presumably, ${skillInvocation.skillName} called ` +
               `Skill.onResolution (which should = SemanticSteve.handleSkillResolution,` +
               ` the only place where SemanticSteve.activeSkill is supposed to set to ` +
               `undefined). This is the error that was thrown by Skill.invoke()...`,
+            error,
           );
-          console.error(error);
           return;
         }
-        console.warn(`Skill ${skillInvocation.skillName} threw an error!`);
-        console.error(error);
+        logger.error(
+          `Skill ${skillInvocation.skillName} threw an error!`,
+          error,
+        );
         const result = new GenericSkillResults.UnhandledInvocationError(
           skillInvocation.skillName,
           error as Error,
@@ -121,8 +200,9 @@ export class SemanticSteve {
     envStateIsHydrated?: boolean,
   ): void {
     // Unset fields that are only to be set while skills are running
-    console.log(
-      `Skill ${this.activeSkill?.constructor.name} resolved with result: ${result.message}`,
+    logger.info(
+      () =>
+        `Skill ${this.activeSkill?.constructor.name} resolved with result: ${result.message}`,
     );
     this.activeSkill = undefined;
     this.timeOfLastSkillInvocation = undefined;
@@ -150,35 +230,15 @@ export class SemanticSteve {
   // ==============
 
   private getInventoryChanges(): Map<string, number> {
-    console.log("Getting inventory changes...");
-    if (!this.itemTotalsAtTimeOfLastMsgToPython) {
+    logger.debug("Getting inventory changes...");
+    if (this.inventoryJournalPositionAtTimeOfLastMsgToPython === undefined) {
       throw new Error(
-        "This should never be called if `invAtTimeOfLastOutoingPythonMsg` is not set",
+        "This should never be called if `inventoryJournalPositionAtTimeOfLastMsgToPython` is not set",
       );
     }
-
-    const differentials: Map<string, number> = new Map<string, number>();
-
-    const curItemTotals = this.bot.envState.inventory.itemsToTotalCounts;
-    const oldItemTotals = this.itemTotalsAtTimeOfLastMsgToPython;
-
-    // Process all keys in current inventory
-    for (const [itemName, currentCount] of curItemTotals.entries()) {
-      const oldCount = oldItemTotals.get(itemName) || 0;
-      const diff = currentCount - oldCount;
-      if (diff !== 0) {
-        differentials.set(itemName, diff);
-      }
-    }
-
-    // Process keys that only exist in old inventory
-    for (const [itemName, oldCount] of oldItemTotals.entries()) {
-      if (!curItemTotals.has(itemName)) {
-        differentials.set(itemName, -oldCount); // Item was removed completely
-      }
-    }
-
-    return differentials;
+    return this.bot.envState.inventory.getChangesSince(
+      this.inventoryJournalPositionAtTimeOfLastMsgToPython,
+    );
   }
 
   private async checkForAndHandleSkillTimeout(): Promise<undefined> {
@@ -193,8 +253,8 @@ export class SemanticSteve {
         "A skill is running, but time of last invocation is not set",
       );
       assert(
-        this.itemTotalsAtTimeOfLastMsgToPython,
-        "A skill is running, but item totals at time of last outgoing python msg is not set",
+        this.inventoryJournalPositionAtTimeOfLastMsgToPython !== undefined,
+        "A skill is running, but inventory journal position at time of last outgoing python msg is not set",
       );
       const curSkillClass = this.activeSkill.constructor as typeof Skill;
       if (
@@ -227,7 +287,7 @@ export class SemanticSteve {
 
   public async initializeSocket(): Promise<void> {
     // Now we bind and properly await it
-    await this.socket.bind(`tcp://*:${this.zmqPort}`);
+    await this.socket.bind(this.zmqEndpoint);
   }
 
   private async getAndSendInitialState(): Promise<void> {
@@ -256,17 +316,14 @@ export class SemanticSteve {
       const msgFromPython = await this.checkForMsgFromPython();
 
       if (msgFromPython) {
-        assert(!this.activeSkill, "Got invocation before resolution");
-        const skillInvocation: SkillInvocation = JSON.parse(msgFromPython);
-        if (this.hasDiedWhileAwaitingInvocation) {
-          this.hasDiedWhileAwaitingInvocation = false; // Reset the flag
-          const result = new GenericSkillResults.DeathWhileAwaitingInvocation(
-            skillInvocation.skillName,
-          );
-          // NOTE: Faux skill-resolution w/out ever ever having an active skill
-          this.handleSkillResolution(result);
+        const msg: SkillInvocation | SurroundingsQuery =
+          JSON.parse(msgFromPython);
+        if ("queryName" in msg) {
+          // NOTE: Queries are answered right away (w/out running a skill)
+          await this.answerQuery(msg);
         } else {
-          this.invokeSkill(skillInvocation);
+          assert(!this.activeSkill, "Got invocation before resolution");
+          this.handleSkillInvocation(msg);
         }
       }
 
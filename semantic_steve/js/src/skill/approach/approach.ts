@@ -5,7 +5,7 @@ import { PathfindToCoordinates } from "../pathfind-to-coordinates/pathfind-to-co
 import { Vicinity, Direction } from "../../env-state/surroundings/types";
 import { ApproachResults } from "./results";
 import { Skill, SkillMetadata, SkillResolutionHandler } from "../skill";
-import { InvalidThingError, SkillResult } from "../../types";
+import { SkillResult } from "../../types";
 import { Thing, SUPPORTED_THING_TYPES, ItemEntity } from "../../thing";
 import { PathfindToCoordinatesResults } from "../pathfind-to-coordinates/results";
 import { ITEM_PICKUP_WAIT_MS } from "../../constants";
@@ -114,17 +114,15 @@ export class Approach extends Skill {
     stopIfFound?: string[],
   ): Promise<void> {
     if (typeof thing === "string") {
-      try {
-        this.thing = this.bot.thingFactory.createThing(thing);
-      } catch (err) {
-        if (err instanceof InvalidThingError) {
-          const result = new ApproachResults.InvalidThing(
-            thing,
-            SUPPORTED_THING_TYPES.toString(),
-          );
-          this.resolve(result);
-          return;
-        }
+      this.thing = this.bot.thingFactory.tryCreateThing(thing);
+      if (!this.thing) {
+        const result = new ApproachResults.InvalidThing(
+          thing,
+          SUPPORTED_THING_TYPES.toString(),
+          this.bot.thingFactory.getSuggestions(thing),
+        );
+        this.resolve(result);
+        return;
       }
     } else {
       this.thing = thing;
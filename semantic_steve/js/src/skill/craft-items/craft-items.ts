@@ -18,21 +18,27 @@ import {
 } from "../../constants";
 import { PlaceBlockResults } from "../place-block/results";
 import { MineBlocksResults } from "../mine-blocks/results";
+import { CraftingStep, getRecipeGraph } from "../../utils/recipes";
 
 // TODO: Resolve w/ a failure result if there is no space in the inventory for the crafted
 // items to be received in the inventory.
 
 export class CraftItems extends Skill {
-  public static readonly TIMEOUT_MS: number = 19000; // 19 seconds
+  public static readonly TIMEOUT_MS: number = 30000; // 30 seconds
   public static readonly METADATA: SkillMetadata = {
     name: "craftItems",
-    signature: "craftItems(item: string, quantity: number = 1)",
+    signature:
+      "craftItems(item: string, quantity: number = 1, craftIntermediates: boolean = false)",
     docstring: `
         /**
          * Crafts one or more of an item, assuming a crafting table (if necessary for the
          * recipe) is either in inventory or in the immediate surroundings.
          * @param item - The item to craft.
          * @param quantity - Optional quantity to craft. Defaults to 1.
+         * @param craftIntermediates - Optional flag to also craft any missing intermediate
+         * ingredients (e.g., planks and sticks for a wooden pickaxe), including a crafting
+         * table if one is needed, from the raw materials in your inventory. Defaults to
+         * false.
          */
       `,
   };
@@ -42,9 +48,10 @@ export class CraftItems extends Skill {
   private shouldTerminateSubskillWaiting: boolean = false;
   private itemToCraft?: ItemEntity;
   private quantityToCraft?: number;
-  private selectedRecipe?: Recipe;
+  private craftingSteps?: CraftingStep[];
+  private numCraftingStepsCompleted: number = 0;
+  private stepResultQuantityBeforeStep?: number;
   private quantityInInventoryBeforeCrafting?: number;
-  private useCraftingTable?: boolean;
 
   constructor(bot: Bot, onResolution: SkillResolutionHandler) {
     super(bot, onResolution);
@@ -57,41 +64,63 @@ export class CraftItems extends Skill {
     return quantityInInventory - this.quantityInInventoryBeforeCrafting;
   }
 
-  private async botCraft(table?: PBlock): Promise<void> {
+  private async craftNextStep(table?: PBlock): Promise<void> {
     assert(this.itemToCraft);
-    assert(this.quantityInInventoryBeforeCrafting !== undefined);
-    assert(this.selectedRecipe);
-    assert(this.quantityToCraft);
-    assert(this.useCraftingTable !== undefined);
+    assert(this.craftingSteps);
 
     if (!this.shouldBeDoingStuff) {
       // Exit on pause or stop
       return;
     }
-    const quantityOfRecipe =
-      this.quantityToCraft / this.selectedRecipe.result.count;
-
-    await this.bot.craft(this.selectedRecipe, quantityOfRecipe, table);
-    if (!this.shouldBeDoingStuff) {
-      // Exit on pause or stop
-      return;
+    const step = this.craftingSteps[this.numCraftingStepsCompleted];
+    const stepResult = new ItemEntity(
+      this.bot,
+      undefined,
+      step.recipe.result.id,
+    );
+    const stepResultQuantity = step.timesToCraft * step.recipe.result.count;
+    if (this.stepResultQuantityBeforeStep === undefined) {
+      this.stepResultQuantityBeforeStep = stepResult.getTotalCountInInventory();
     }
-    while (this.itemDifferentialSinceInvoke < this.quantityToCraft) {
-      // Wait for the items to register as being in the bot's inventory
-      await asyncSleep(CRAFTING_WAIT_MS);
+    const getStepResultDifferential = () =>
+      stepResult.getTotalCountInInventory() -
+      (this.stepResultQuantityBeforeStep as number);
+
+    if (getStepResultDifferential() < stepResultQuantity) {
+      try {
+        await this.bot.craft(step.recipe, step.timesToCraft, table);
+      } catch (err) {
+        this.shouldBeDoingStuff = false;
+        const result = new CraftItemsResults.CraftingStepFailed(
+          this.itemToCraft.name,
+          stepResult.name,
+          err instanceof Error ? err.message : String(err),
+        );
+        this.resolve(result);
+        return;
+      }
       if (!this.shouldBeDoingStuff) {
         // Exit on pause or stop
         return;
       }
+      while (getStepResultDifferential() < stepResultQuantity) {
+        // Wait for the items to register as being in the bot's inventory
+        await asyncSleep(CRAFTING_WAIT_MS);
+        if (!this.shouldBeDoingStuff) {
+          // Exit on pause or stop
+          return;
+        }
+      }
     }
+    this.numCraftingStepsCompleted++;
+    this.stepResultQuantityBeforeStep = undefined;
   }
 
   private async startOrResumeCrafting(): Promise<void> {
     assert(this.itemToCraft);
     assert(this.quantityToCraft);
-    assert(this.selectedRecipe);
+    assert(this.craftingSteps);
     assert(this.quantityInInventoryBeforeCrafting !== undefined);
-    assert(this.useCraftingTable !== undefined);
 
     if (this.itemDifferentialSinceInvoke >= this.quantityToCraft) {
       // We've acquired the expected amount of the item to craft...
@@ -107,12 +136,25 @@ export class CraftItems extends Skill {
       return;
     }
 
-    if (!this.useCraftingTable) {
-      await this.botCraft();
+    // Craft the leading steps that don't require a crafting table
+    const nextStepRequiresTable = () => {
+      assert(this.craftingSteps);
+      return this.craftingSteps[this.numCraftingStepsCompleted].recipe
+        .requiresTable;
+    };
+    while (
+      this.numCraftingStepsCompleted < this.craftingSteps.length &&
+      !nextStepRequiresTable()
+    ) {
+      await this.craftNextStep();
       if (!this.shouldBeDoingStuff) {
         // Exit on pause or stop
         return;
       }
+    }
+
+    if (this.numCraftingStepsCompleted === this.craftingSteps.length) {
+      this.shouldBeDoingStuff = false;
       const result = new CraftItemsResults.Success(
         this.itemToCraft.name,
         this.quantityToCraft,
@@ -121,8 +163,7 @@ export class CraftItems extends Skill {
       return;
     }
 
-    // Crafting table case
-    assert(this.useCraftingTable);
+    // Crafting table case (the table is placed/reused once for all remaining steps)
     const craftingTableBlockType = new Block(this.bot, "crafting_table");
     const craftingTableItemType = new ItemEntity(this.bot, "crafting_table");
     const craftingTableIsInInventory =
@@ -236,10 +277,16 @@ export class CraftItems extends Skill {
 
     assert(tableIsReachable());
 
-    // Finally, we craft the item
+    // Finally, we craft the remaining steps (ending w/ the item) at the table
     const table = this.bot.blockAt(nearestImmediateSurroundingsTableCoords);
     assert(table);
-    await this.botCraft(table);
+    while (this.numCraftingStepsCompleted < this.craftingSteps.length) {
+      await this.craftNextStep(table);
+      if (!this.shouldBeDoingStuff) {
+        // Exit on pause or stop
+        return;
+      }
+    }
 
     // Always collect the crafting table after crafting
     const handleMineBlocksResolution = (mineBlocksResult: SkillResult) => {
@@ -289,7 +336,12 @@ export class CraftItems extends Skill {
   public async doInvoke(
     item: string | ItemEntity,
     quantity: number = 1,
+    craftIntermediates: boolean | string = false,
   ): Promise<void> {
+    this.craftingSteps = undefined;
+    this.numCraftingStepsCompleted = 0;
+    this.stepResultQuantityBeforeStep = undefined;
+
     if (typeof item === "string") {
       // Validate the item string
       try {
@@ -334,6 +386,39 @@ export class CraftItems extends Skill {
       );
     };
 
+    if (craftIntermediates === true || craftIntermediates === "true") {
+      // Plan the whole chain of intermediate crafts from the raw materials in inventory
+      const inventory = new Map<number, number>();
+      for (const slotItem of this.bot.envState.inventory.itemSlots) {
+        inventory.set(
+          slotItem.type,
+          (inventory.get(slotItem.type) ?? 0) + slotItem.count,
+        );
+      }
+      const plan = getRecipeGraph(this.bot).planCrafting(
+        this.itemToCraft.id,
+        quantity,
+        inventory,
+        craftingTableIsAvailable(),
+      );
+      if (!plan) {
+        this.resolve(
+          new CraftItemsResults.InsufficientRawMaterials(
+            this.itemToCraft.name,
+            quantity,
+          ),
+        );
+        return;
+      }
+      this.craftingSteps = plan.steps;
+      this.quantityToCraft = plan.quantityToCraft;
+      this.shouldBeDoingStuff = true;
+      this.quantityInInventoryBeforeCrafting =
+        this.itemToCraft.getTotalCountInInventory();
+      this.startOrResumeCrafting();
+      return;
+    }
+
     const requiresCraftingTable = nonTableRecipes.length === 0;
     if (requiresCraftingTable && !craftingTableIsAvailable()) {
       this.resolve(
@@ -368,12 +453,11 @@ export class CraftItems extends Skill {
     }
 
     // Select the recipe (preferring to not use a crafting table if not required)
+    let selectedRecipe: Recipe;
     if (lastFeasibleNonTableRecipe) {
-      this.selectedRecipe = lastFeasibleNonTableRecipe;
-      this.useCraftingTable = false;
+      selectedRecipe = lastFeasibleNonTableRecipe;
     } else if (lastFeasibleTableRecipe) {
-      this.selectedRecipe = lastFeasibleTableRecipe;
-      this.useCraftingTable = true;
+      selectedRecipe = lastFeasibleTableRecipe;
     } else {
       // Since we already determined:
       // 1. that the item is craftable
@@ -392,9 +476,9 @@ export class CraftItems extends Skill {
     // NOTE: quantityToCraft can/should be larger than the requested quantity if a recipe
     // produces only multiples of the resulting item (e.g. 4 or 8) and the requested
     // quantity is not a multiple of that number.
-    this.quantityToCraft =
-      Math.ceil(quantity / this.selectedRecipe.result.count) *
-      this.selectedRecipe.result.count;
+    const timesToCraft = Math.ceil(quantity / selectedRecipe.result.count);
+    this.craftingSteps = [{ recipe: selectedRecipe, timesToCraft }];
+    this.quantityToCraft = timesToCraft * selectedRecipe.result.count;
     this.shouldBeDoingStuff = true;
     this.quantityInInventoryBeforeCrafting =
       this.itemToCraft.getTotalCountInInventory();
@@ -404,9 +488,8 @@ export class CraftItems extends Skill {
   public async doPause(): Promise<void> {
     assert(this.itemToCraft);
     assert(this.quantityToCraft);
-    assert(this.selectedRecipe);
+    assert(this.craftingSteps);
     assert(this.quantityInInventoryBeforeCrafting !== undefined);
-    assert(this.useCraftingTable !== undefined);
     this.shouldBeDoingStuff = false;
     if (this.activeSubskill) {
       await this.activeSubskill.pause();
@@ -416,9 +499,8 @@ export class CraftItems extends Skill {
   public async doResume(): Promise<void> {
     assert(this.itemToCraft);
     assert(this.quantityToCraft);
-    assert(this.selectedRecipe);
+    assert(this.craftingSteps);
     assert(this.quantityInInventoryBeforeCrafting !== undefined);
-    assert(this.useCraftingTable !== undefined);
     this.shouldBeDoingStuff = true;
     if (this.activeSubskill) {
       // TODO: Explanatory comment (for now, see the analogous comment in mine-blocks.ts)
@@ -432,9 +514,8 @@ export class CraftItems extends Skill {
   public async doStop(): Promise<void> {
     assert(this.itemToCraft);
     assert(this.quantityToCraft);
-    assert(this.selectedRecipe);
+    assert(this.craftingSteps);
     assert(this.quantityInInventoryBeforeCrafting !== undefined);
-    assert(this.useCraftingTable !== undefined);
     this.shouldBeDoingStuff = false;
     this.shouldTerminateSubskillWaiting = true;
     if (this.activeSubskill) {
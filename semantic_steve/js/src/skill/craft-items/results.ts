@@ -45,6 +45,20 @@ export namespace CraftItemsResults {
     }
   }
 
+  export class InsufficientRawMaterials implements SkillResult {
+    message: string;
+    constructor(item: string, quantity: number) {
+      this.message = `SkillInvocationError: You do not have the raw materials to craft '${quantity}' of '${item}', even when crafting its intermediate ingredients.`;
+    }
+  }
+
+  export class CraftingStepFailed implements SkillResult {
+    message: string;
+    constructor(item: string, stepItem: string, reason: string) {
+      this.message = `Failure: Crafting '${stepItem}' (on the way to crafting '${item}') failed: ${reason}`;
+    }
+  }
+
   export class NoCraftingTable implements SkillResult {
     message: string;
     constructor(item: string) {
@@ -1,5 +1,8 @@
 import { Bot } from "mineflayer";
 import { Vec3 } from "vec3";
+import { getLogger } from "../../utils/logging";
+
+const logger = getLogger("craft-items");
 
 /**
  * Checks if the bot has a crafting table in their inventory
@@ -91,7 +94,7 @@ export async function placeCraftingTable(bot: Bot): Promise<boolean> {
     );
     return true;
   } catch (error) {
-    console.error("Error placing crafting table:", error);
+    logger.warning("Error placing crafting table", error);
     return false;
   }
 }
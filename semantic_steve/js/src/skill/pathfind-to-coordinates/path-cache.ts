@@ -0,0 +1,242 @@
+import { Bot } from "mineflayer";
+import { Block as PBlock } from "prismarine-block";
+import { Vec3 } from "vec3";
+import { ComputedPath, Move, Movements, goals } from "mineflayer-pathfinder";
+import { getLogger } from "../../utils/logging";
+
+const logger = getLogger("path-cache");
+
+// Max. per-axis distances from a path node at which a block update invalidates the path
+// (same as mineflayer-pathfinder's own check for resetting the path it's following)
+const INVALIDATION_DISTANCE_XZ = 1;
+const INVALIDATION_DISTANCE_Y = 2;
+
+type CachedPath = {
+  // Pristine copies (the pathfinder consumes nodes' toBreak/toPlace as it follows them)
+  nodes: Move[];
+  // Block positions of the path's start and of each node (i.e., positions[i + 1] is
+  // nodes[i]'s)
+  positions: Vec3[];
+  // Keys of the blocks that following the path will break/place (i.e., expected updates)
+  plannedChangeKeys: Set<string>;
+  min: Vec3;
+  max: Vec3;
+};
+
+function getKey(pos: Vec3): string {
+  return `${Math.floor(pos.x)},${Math.floor(pos.y)},${Math.floor(pos.z)}`;
+}
+
+function cloneMove(move: Move): Move {
+  return Object.assign(Object.create(Object.getPrototypeOf(move)), move, {
+    toBreak: [...move.toBreak],
+    toPlace: [...move.toPlace],
+  });
+}
+
+/**
+ * Remembers the last path computed by the bot's pathfinder so that the A* search doesn't
+ * have to start from scratch every time a goal is set.
+ *
+ * Wraps `bot.pathfinder.getPathTo` (which the pathfinder calls whenever it needs a new
+ * path) such that, if the bot is standing on the cached route:
+ *
+ * - Goals reached further along the route (e.g., re-setting the same goal after pausing,
+ *   stopping early, or a partial success) reuse the route's remaining nodes.
+ * - Goals beyond the route's end (e.g., the next hop when traversing long distances w/
+ *   many short hops) reuse its remaining nodes and only search from its end.
+ *
+ * The cached route is invalidated by block updates (other than its own planned
+ * digging/placing) or chunk loads along it, and by respawns.
+ */
+export class PathCache {
+  private bot: Bot;
+  private computePath: Bot["pathfinder"]["getPathTo"];
+  private cachedPath?: CachedPath;
+
+  constructor(bot: Bot) {
+    this.bot = bot;
+    this.computePath = bot.pathfinder.getPathTo.bind(bot.pathfinder);
+    bot.pathfinder.getPathTo = this.getPathTo.bind(this);
+    this.setupEventListeners();
+  }
+
+  private setupEventListeners(): void {
+    this.bot.on("blockUpdate", (oldBlock: PBlock | null, newBlock: PBlock) => {
+      if (!this.cachedPath) return;
+      if (oldBlock && newBlock && oldBlock.type === newBlock.type) return;
+      const pos = (newBlock ?? oldBlock).position;
+      if (this.cachedPath.plannedChangeKeys.has(getKey(pos))) return;
+      if (this.isNearCachedPath(pos)) {
+        this.invalidate();
+      }
+    });
+    this.bot.world.on("chunkColumnLoad", (point: Vec3) => {
+      if (!this.cachedPath) return;
+      const { min, max } = this.cachedPath;
+      if (
+        point.x <= max.x &&
+        point.x + 15 >= min.x &&
+        point.z <= max.z &&
+        point.z + 15 >= min.z
+      ) {
+        this.invalidate();
+      }
+    });
+    this.bot.on("spawn", () => this.invalidate());
+  }
+
+  public invalidate(): void {
+    this.cachedPath = undefined;
+  }
+
+  private isNearCachedPath(pos: Vec3): boolean {
+    const { positions, min, max } = this.cachedPath!;
+    if (
+      pos.x < min.x - INVALIDATION_DISTANCE_XZ ||
+      pos.x > max.x + INVALIDATION_DISTANCE_XZ ||
+      pos.y < min.y - INVALIDATION_DISTANCE_Y ||
+      pos.y > max.y + INVALIDATION_DISTANCE_Y ||
+      pos.z < min.z - INVALIDATION_DISTANCE_XZ ||
+      pos.z > max.z + INVALIDATION_DISTANCE_XZ
+    ) {
+      return false;
+    }
+    return positions.some(
+      (nodePos) =>
+        Math.abs(nodePos.x - pos.x) <= INVALIDATION_DISTANCE_XZ &&
+        Math.abs(nodePos.y - pos.y) <= INVALIDATION_DISTANCE_Y &&
+        Math.abs(nodePos.z - pos.z) <= INVALIDATION_DISTANCE_XZ,
+    );
+  }
+
+  private remember(start: Vec3, nodes: Move[]): void {
+    const positions = [start.floored()];
+    const plannedChangeKeys = new Set<string>();
+    for (const node of nodes) {
+      positions.push(new Vec3(node.x, node.y, node.z).floored());
+      for (const change of [...node.toBreak, ...node.toPlace]) {
+        plannedChangeKeys.add(getKey(new Vec3(change.x, change.y, change.z)));
+      }
+    }
+    const min = positions[0].clone();
+    const max = positions[0].clone();
+    for (const pos of positions) {
+      min.set(
+        Math.min(min.x, pos.x),
+        Math.min(min.y, pos.y),
+        Math.min(min.z, pos.z),
+      );
+      max.set(
+        Math.max(max.x, pos.x),
+        Math.max(max.y, pos.y),
+        Math.max(max.z, pos.z),
+      );
+    }
+    this.cachedPath = {
+      nodes: nodes.map(cloneMove),
+      positions,
+      plannedChangeKeys,
+      min,
+      max,
+    };
+  }
+
+  private toComputedPath(nodes: Move[], time: number): ComputedPath {
+    return {
+      status: "success",
+      cost: nodes.reduce((cost, node) => cost + node.cost, 0),
+      time,
+      visitedNodes: 0,
+      generatedNodes: 0,
+      path: nodes,
+    } as ComputedPath;
+  }
+
+  /**
+   * Gets the cached route's remaining nodes (from the bot's position) if following them
+   * is still feasible w/ the bot's current scaffolding blocks.
+   */
+  private getRemainingCachedNodes(
+    movements: Movements,
+    botPos: Vec3,
+  ): Move[] | undefined {
+    if (!this.cachedPath) return;
+    const { nodes, positions } = this.cachedPath;
+    const index = positions.findIndex((pos) => pos.equals(botPos));
+    if (index === -1) return;
+    const remainingNodes = nodes.slice(index).map(cloneMove);
+    const nBlocksToPlace = remainingNodes.reduce(
+      (n, node) => n + node.toPlace.length,
+      0,
+    );
+    if (
+      nBlocksToPlace > 0 &&
+      nBlocksToPlace > (movements as any).countScaffoldingItems()
+    ) {
+      return;
+    }
+    return remainingNodes;
+  }
+
+  private getPathTo(
+    movements: Movements,
+    goal: goals.Goal,
+    timeout?: number,
+  ): ComputedPath {
+    const startTime = Date.now();
+    const botPos = this.bot.entity.position.floored();
+    const remainingNodes = this.getRemainingCachedNodes(movements, botPos);
+
+    if (remainingNodes && remainingNodes.length > 0) {
+      // Goal reached further along the cached route?
+      const endIndex = remainingNodes.findIndex((node) =>
+        goal.isEnd(new Vec3(node.x, node.y, node.z).floored()),
+      );
+      if (endIndex !== -1) {
+        const nodes = remainingNodes.slice(0, endIndex + 1);
+        logger.debug(`Reusing ${nodes.length} cached path nodes`);
+        return this.toComputedPath(nodes, Date.now() - startTime);
+      }
+
+      // Otherwise, extend the route from its end
+      const { positions } = this.cachedPath!;
+      const routeEnd = positions[positions.length - 1];
+      const extension = this.bot.pathfinder
+        .getPathFromTo(movements, routeEnd, goal, { timeout })
+        .next().value?.result as ComputedPath | undefined;
+      if (extension?.status === "success") {
+        logger.debug(
+          `Reusing ${remainingNodes.length} cached path nodes ` +
+            `(+${extension.path.length} new ones)`,
+        );
+        const nodes = [...remainingNodes, ...extension.path];
+        this.remember(botPos, nodes);
+        return this.toComputedPath(nodes, Date.now() - startTime);
+      }
+    }
+
+    // Cache miss: search from scratch
+    const result = this.computePath(movements, goal, timeout);
+    if (result.status === "success" && result.path.length > 0) {
+      this.remember(botPos, result.path);
+    } else {
+      this.invalidate();
+    }
+    return result;
+  }
+}
+
+const PATH_CACHES = new WeakMap<Bot, PathCache>();
+
+/**
+ * Gets the bot's `PathCache`, installing it on first use.
+ */
+export function getPathCache(bot: Bot): PathCache {
+  let pathCache = PATH_CACHES.get(bot);
+  if (!pathCache) {
+    pathCache = new PathCache(bot);
+    PATH_CACHES.set(bot, pathCache);
+  }
+  return pathCache;
+}
@@ -4,11 +4,13 @@ import { Bot, BotEvents } from "mineflayer";
 import { PartiallyComputedPath, goals } from "mineflayer-pathfinder";
 import { PathfindToCoordinatesResults } from "./results";
 import { SUPPORTED_THING_TYPES, Thing } from "../../thing";
-import { InvalidThingError } from "../../types";
+import { Vicinity } from "../../env-state/surroundings";
 import { Skill, SkillMetadata, SkillResolutionHandler } from "../skill";
 import { getGoodPathfindingTarget } from "./utils";
+import { getPathCache } from "./path-cache";
+import { getLogger } from "../../utils/logging";
 
-const STOP_IF_FOUND_CHECK_THROTTLE_MS = 1800;
+const logger = getLogger("pathfind-to-coordinates");
 
 export class PathfindToCoordinates extends Skill {
   public static readonly TIMEOUT_MS: number = 25000; // 25 seconds
@@ -41,6 +43,7 @@ export class PathfindToCoordinates extends Skill {
     event: keyof BotEvents;
     listener: (...args: any[]) => void;
   }[];
+  private unsubscribeFromStopIfFound?: () => void;
 
   constructor(bot: Bot, onResolution: SkillResolutionHandler) {
     super(bot, onResolution);
@@ -54,13 +57,14 @@ export class PathfindToCoordinates extends Skill {
   private beginPathfinding(): void {
     assert(this.targetCoords);
     this.setupListeners();
+    getPathCache(this.bot); // (Installs it, so that the pathfinder reuses cached routes)
     const goal: goals.GoalBlock = new goals.GoalBlock(
       this.targetCoords.x,
       this.targetCoords.y,
       this.targetCoords.z,
     );
     this.bot.pathfinder.setGoal(goal);
-    console.log("Goal set. Beginning pathfinding...");
+    logger.debug("Goal set. Beginning pathfinding...");
   }
 
   private manuallyStopPathfinder(): void {
@@ -108,15 +112,16 @@ export class PathfindToCoordinates extends Skill {
   // ====================
 
   private resolveInvalidCoords(coords: [number, number, number]): void {
-    console.log("Resolving pathfinding as invalid coordinates");
+    logger.debug("Resolving pathfinding as invalid coordinates");
     this.resolve(new PathfindToCoordinatesResults.InvalidCoords(coords));
   }
 
   private resolveInvalidThing(thingName: string): void {
-    console.log("Resolving pathfinding as invalid thing");
+    logger.debug("Resolving pathfinding as invalid thing");
     const result = new PathfindToCoordinatesResults.InvalidThing(
       thingName,
       SUPPORTED_THING_TYPES.toString(),
+      this.bot.thingFactory.getSuggestions(thingName),
     );
     this.resolve(result);
   }
@@ -126,16 +131,19 @@ export class PathfindToCoordinates extends Skill {
       | PathfindToCoordinatesResults.FoundThingInDistantSurroundings
       | PathfindToCoordinatesResults.FoundThingInImmediateSurroundings,
   ): void {
-    console.log("Resolving pathfinding as thing found");
+    logger.debug("Resolving pathfinding as thing found");
     assert(this.targetCoords);
     this.cleanupListeners();
     this.manuallyStopPathfinder();
     this.unsetPathfindingParams();
-    this.resolve(result);
+    // NOTE: Hydrating is cheap (the hydrater keeps the surroundings up to date) and lets
+    // us propagate the envStateIsHydrated flag as true (as Approach assumes we do)
+    this.bot.envState.hydrate();
+    this.resolve(result, true); // NOTE: true = envStateIsHydrated
   }
 
   private resolvePathfindingPartialSuccess(): void {
-    console.log("Resolving pathfinding as partial success");
+    logger.debug("Resolving pathfinding as partial success");
     assert(this.targetCoords);
     this.cleanupListeners();
     const result = new PathfindToCoordinatesResults.PartialSuccess(
@@ -147,7 +155,7 @@ export class PathfindToCoordinates extends Skill {
   }
 
   private resolvePathfindingSuccess(): void {
-    console.log("Resolving pathfinding as success");
+    logger.debug("Resolving pathfinding as success");
     assert(this.targetCoords);
     this.cleanupListeners();
     // NOTE: No throttle since, since we know we always want to hydrate here.
@@ -164,27 +172,34 @@ export class PathfindToCoordinates extends Skill {
     this.resolve(result, true); // NOTE: true = envStateIsHydrated
   }
 
-  private checkForStopIfFoundThingsAndHandle(lastMove: Vec3): void {
-    if (this.stopIfFound.length === 0) {
-      return;
-    }
-    this.bot.envState.hydrate(STOP_IF_FOUND_CHECK_THROTTLE_MS);
-    const result = this.getResultIfAnyStopIfFoundThingInSurroundings();
-    if (result) {
-      this.resolveThingFound(result);
-    }
+  private handleStopIfFoundThingSeen(
+    thingName: string,
+    vicinity: Vicinity,
+  ): void {
+    assert(this.targetCoords);
+    const result =
+      vicinity === Vicinity.IMMEDIATE_SURROUNDINGS
+        ? new PathfindToCoordinatesResults.FoundThingInImmediateSurroundings(
+            this.targetCoords,
+            thingName,
+          )
+        : new PathfindToCoordinatesResults.FoundThingInDistantSurroundings(
+            this.targetCoords,
+            thingName,
+          );
+    this.resolveThingFound(result);
   }
 
   private checkForTimeoutStatusAndHandle(path: PartiallyComputedPath): void {
     if (path.status === "timeout") {
-      console.log("path.status was 'timeout'");
+      logger.debug("path.status was 'timeout'");
       this.resolvePathfindingPartialSuccess();
     }
   }
 
   private checkForNoPathStatusAndHandle(path: PartiallyComputedPath): void {
     if (path.status === "noPath") {
-      console.log("path.status was 'noPath'");
+      logger.debug("path.status was 'noPath'");
       this.resolvePathfindingPartialSuccess();
     }
   }
@@ -202,15 +217,11 @@ export class PathfindToCoordinates extends Skill {
   }
 
   private setupListeners(): void {
-    console.log("Setting up pathfinding listeners");
+    logger.debug("Setting up pathfinding listeners");
     this.setupListener(
       "goal_reached",
       this.resolvePathfindingSuccess.bind(this),
     );
-    this.setupListener(
-      "move",
-      this.checkForStopIfFoundThingsAndHandle.bind(this),
-    );
     this.setupListener(
       "path_update",
       this.checkForNoPathStatusAndHandle.bind(this),
@@ -223,14 +234,26 @@ export class PathfindToCoordinates extends Skill {
       "path_stop",
       this.resolvePathfindingPartialSuccess.bind(this),
     );
+    if (this.stopIfFound.length > 0) {
+      // NOTE: Rather than polling on moves, we get called back as soon as the hydrater
+      // sees one of the things (or right away if one is already visible)
+      this.unsubscribeFromStopIfFound =
+        this.bot.envState.surroundings.onFirstSeen(
+          this.stopIfFound.map((thing) => thing.name),
+          undefined, // Any vicinity
+          this.handleStopIfFoundThingSeen.bind(this),
+        );
+    }
   }
 
   private cleanupListeners(): void {
-    console.log("Cleaning up pathfinding listeners");
+    logger.debug("Cleaning up pathfinding listeners");
     for (const { event, listener } of this.activeListeners) {
       this.bot.off(event, listener);
     }
     this.activeListeners = []; // Clear the array
+    this.unsubscribeFromStopIfFound?.();
+    this.unsubscribeFromStopIfFound = undefined;
   }
 
   // ============================
@@ -263,15 +286,12 @@ export class PathfindToCoordinates extends Skill {
     this.stopIfFound = [];
     if (stopIfFound?.length) {
       for (const thingName of stopIfFound) {
-        try {
-          const thing = this.bot.thingFactory.createThing(thingName);
-          this.stopIfFound.push(thing);
-        } catch (error) {
-          if (error instanceof InvalidThingError) {
-            this.resolveInvalidThing(thingName);
-            return;
-          }
+        const thing = this.bot.thingFactory.tryCreateThing(thingName);
+        if (!thing) {
+          this.resolveInvalidThing(thingName);
+          return;
         }
+        this.stopIfFound.push(thing);
       }
     }
 
@@ -4,8 +4,15 @@ import { SkillResult } from "../../types";
 export namespace PathfindToCoordinatesResults {
   export class InvalidThing implements SkillResult {
     message: string;
-    constructor(thing: string, supportedThingTypes: string) {
+    constructor(
+      thing: string,
+      supportedThingTypes: string,
+      suggestions: string[] = [],
+    ) {
       this.message = `SkillInvocationError: '${thing}' is not a recognized or supported thing. Currently, only these varieties of things can be stopped at if found: ${supportedThingTypes}.`;
+      if (suggestions.length > 0) {
+        this.message += ` Did you mean: ${suggestions.join(", ")}?`;
+      }
     }
   }
 
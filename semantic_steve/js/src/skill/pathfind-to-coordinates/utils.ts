@@ -8,6 +8,11 @@ type Octant = {
   zDirection: "north" | "south";
 };
 
+// Reused across calls (grown as needed) so that the search doesn't allocate per node
+let searchQueue = new Int32Array(0);
+let searchVisited = new Uint8Array(0);
+const searchPos = new Vec3(0, 0, 0);
+
 /**
  * Finds a good pathfinding target by searching in the octant opposite to the bot's position
  * relative to the target coordinates for an empty block, within the immediate surroundings
@@ -25,66 +30,69 @@ export function getGoodPathfindingTarget(bot: Bot, targetCoords: Vec3): Vec3 {
     return targetCoords; // If the target coordinates are already empty, return them
   }
 
-  const maxSearchRadius =
-    bot.envState.surroundings.radii.immediateSurroundingsRadius - 1;
+  const maxSearchRadius = Math.max(
+    0,
+    Math.floor(bot.envState.surroundings.radii.immediateSurroundingsRadius - 1),
+  );
 
   // Determine the octant the bot is in relative to targetCoords
   const botOctant = getBotOctant(bot.entity.position, targetCoords);
 
   // Get the opposite octant
   const oppositeOctant = getOppositeOctant(botOctant);
+  const offsets = getOffsetsForOctant(oppositeOctant);
+  const [xStep, yStep, zStep] = [offsets[0].x, offsets[1].y, offsets[2].z];
+
+  // Breadth-first search over the octant, where positions are packed into integer keys
+  // of their (non-negative) steps away from targetCoords: (dx * side + dy) * side + dz
+  const side = maxSearchRadius + 1;
+  const nKeys = side * side * side;
+  const keyStrides = [side * side, side, 1]; // dx + 1, dy + 1, dz + 1
+  if (searchQueue.length < nKeys) {
+    searchQueue = new Int32Array(nKeys);
+    searchVisited = new Uint8Array(nKeys);
+  } else {
+    searchVisited.fill(0, 0, nKeys);
+  }
+  let head = 0;
+  let tail = 0;
+  searchQueue[tail++] = 0;
+  searchVisited[0] = 1;
 
-  // Create a set to keep track of checked positions to avoid duplicates
-  const checkedPositions = new Set<string>();
-
-  const searchQueue: { pos: Vec3; distance: number }[] = [
-    { pos: targetCoords.clone(), distance: 0 },
-  ];
-
-  while (searchQueue.length > 0) {
-    const { pos, distance } = searchQueue.shift()!;
-
-    // Generate a string key for the position to check against the set
-    const posKey = `${Math.floor(pos.x)},${Math.floor(pos.y)},${Math.floor(
-      pos.z,
-    )}`;
-
-    // Skip if we've already checked this position
-    if (checkedPositions.has(posKey)) {
-      continue;
-    }
-
-    // Mark as checked
-    checkedPositions.add(posKey);
+  while (head < tail) {
+    const key = searchQueue[head++];
+    const dz = key % side;
+    const dy = ((key - dz) / side) % side;
+    const dx = (key - dz - dy * side) / (side * side);
 
     // Check if the block at this position is empty
-    if (!blockExistsAt(bot, pos)) {
-      return pos; // Found an empty block
+    searchPos.set(
+      targetCoords.x + dx * xStep,
+      targetCoords.y + dy * yStep,
+      targetCoords.z + dz * zStep,
+    );
+    if (!blockExistsAt(bot, searchPos)) {
+      return searchPos.clone(); // Found an empty block
     }
 
     // Stop if we've reached the maximum search radius
-    if (distance >= maxSearchRadius) {
+    if (dx + dy + dz >= maxSearchRadius) {
       continue;
     }
 
-    // Define offsets based on the opposite octant
-    const offsets = getOffsetsForOctant(oppositeOctant);
-
-    for (const offset of offsets) {
-      const nextPos = pos.clone().add(offset);
-
-      // Ensure we stay within the desired octant relative to original targetCoords
-      if (isInOctant(nextPos, targetCoords, oppositeOctant)) {
-        searchQueue.push({ pos: nextPos, distance: distance + 1 });
+    // Step further into the octant along x, y, then z
+    for (let i = 0; i < 3; i++) {
+      const nextKey = key + keyStrides[i];
+      if (!searchVisited[nextKey]) {
+        searchVisited[nextKey] = 1;
+        searchQueue[tail++] = nextKey;
       }
     }
   }
 
   // If no empty block was found within the radius, the diagonally adjacent block
   // opposite the bot's position
-  const offsets = getOffsetsForOctant(oppositeOctant);
-  const offset = new Vec3(offsets[0].x, offsets[1].y, offsets[2].z);
-  return targetCoords.clone().add(offset);
+  return targetCoords.clone().offset(xStep, yStep, zStep);
 }
 
 /**
@@ -141,32 +149,3 @@ function getOffsetsForOctant(octant: Octant): Vec3[] {
 
   return offsets;
 }
-
-/**
- * Checks if a position is within the specified octant relative to the target coordinates
- */
-function isInOctant(
-  position: Vec3,
-  targetCoords: Vec3,
-  octant: Octant,
-): boolean {
-  // X check
-  const xCheck =
-    octant.xDirection === "east"
-      ? position.x >= targetCoords.x
-      : position.x <= targetCoords.x;
-
-  // Y check
-  const yCheck =
-    octant.yDirection === "up"
-      ? position.y >= targetCoords.y
-      : position.y <= targetCoords.y;
-
-  // Z check
-  const zCheck =
-    octant.zDirection === "south"
-      ? position.z >= targetCoords.z
-      : position.z <= targetCoords.z;
-
-  return xCheck && yCheck && zCheck;
-}
@@ -12,7 +12,7 @@ import { PlaceBlock } from "../place-block/place-block";
 import { asyncSleep } from "../../utils/generic";
 import { PlaceBlockResults } from "../place-block/results";
 import { isWithinInteractionReach } from "../../utils/block";
-import { isFuel, getSmeltingProductName } from "../../utils/smelting";
+import { getSmeltingIndex } from "../../utils/smelting";
 import { MineBlocks } from "../mine-blocks/mine-blocks";
 import { MineBlocksResults } from "../mine-blocks/results";
 
@@ -415,7 +415,8 @@ export class SmeltItems extends Skill {
     assert(this.fuelItem);
 
     // Check if the item is smeltable
-    const expectedResultItemName = getSmeltingProductName(
+    const smeltingIndex = getSmeltingIndex(this.bot);
+    const expectedResultItemName = smeltingIndex.getProductName(
       this.itemToSmelt.name,
     );
     if (!expectedResultItemName) {
@@ -428,7 +429,7 @@ export class SmeltItems extends Skill {
     this.expectedResultItemQuantity = quantityToSmelt; // Always 1:1 in Minecraft
 
     // Check if the fuel item is usable as fuel
-    if (!isFuel(this.fuelItem.name)) {
+    if (!smeltingIndex.isFuel(this.fuelItem.name)) {
       this.resolve(
         new SmeltItemsResults.FuelItemNotUsableAsFuel(this.fuelItem.name),
       );
@@ -0,0 +1,158 @@
+import { Bot } from "mineflayer";
+import * as THREE from "three";
+import { Vec3 } from "vec3";
+import { BOT_EYE_HEIGHT } from "../../constants";
+
+// NOTE: On GPU-less Linux boxes, headless-gl falls back to Mesa's software rasterizer
+// (llvmpipe) when LIBGL_ALWAYS_SOFTWARE is set, which must happen before any GL context
+// is created (i.e., before the first canvas below). Set SEMANTIC_STEVE_SOFTWARE_GL to
+// "false" to opt out (e.g., when a GPU is available).
+if (
+  process.platform === "linux" &&
+  process.env.SEMANTIC_STEVE_SOFTWARE_GL !== "false" &&
+  process.env.LIBGL_ALWAYS_SOFTWARE === undefined
+) {
+  process.env.LIBGL_ALWAYS_SOFTWARE = "1";
+}
+
+const { createCanvas } = require("node-canvas-webgl/lib");
+const { Viewer, WorldView } = require("prismarine-viewer/viewer");
+
+const CANVAS_WIDTH = 512;
+const CANVAS_HEIGHT = 512;
+
+function viewDistanceToNumber(bot: Bot): number {
+  switch (bot.settings.viewDistance) {
+    case "tiny":
+      return 4;
+    case "short":
+      return 8;
+    case "normal":
+      return 12;
+    case "far":
+      return 16;
+    default:
+      return 12; // Default to normal if not recognized
+  }
+}
+
+/**
+ * Long-lived offscreen renderer of the bot's point of view.
+ *
+ * The canvas, WebGL renderer, viewer, and world view are created once per bot. The world
+ * view listens to the bot (`chunkColumnLoad`, `blockUpdate`, `move`, entity events), so
+ * chunk meshes stay warm and only changed chunks are re-meshed (in the viewer's mesher
+ * workers) between screenshots.
+ */
+export class POVRenderer {
+  private bot: Bot;
+  private canvas: any;
+  private renderer: THREE.WebGLRenderer;
+  private viewer: any;
+  private worldView: any;
+  private viewDistance: number;
+  private initialization: Promise<void>;
+
+  constructor(bot: Bot) {
+    this.bot = bot;
+    this.canvas = createCanvas(CANVAS_WIDTH, CANVAS_HEIGHT);
+    this.renderer = new THREE.WebGLRenderer({ canvas: this.canvas });
+    this.viewer = new Viewer(this.renderer);
+    if (!this.viewer.setVersion(this.bot.version)) {
+      throw new Error(
+        `prismarine-viewer does not support version: ${this.bot.version}`,
+      );
+    }
+    this.viewDistance = viewDistanceToNumber(this.bot);
+    const eyePosition = this.bot.entity.position.offset(0, BOT_EYE_HEIGHT, 0);
+    this.worldView = new WorldView(
+      this.bot.world,
+      this.viewDistance,
+      eyePosition,
+    );
+    this.viewer.listen(this.worldView);
+    this.initialization = this.initialize(eyePosition);
+  }
+
+  private async initialize(eyePosition: Vec3): Promise<void> {
+    await this.worldView.init(eyePosition);
+    // Entities that spawned before we started listening
+    for (const entity of Object.values(this.bot.entities)) {
+      if (entity !== this.bot.entity) {
+        this.viewer.updateEntity({
+          id: entity.id,
+          name: entity.name,
+          pos: entity.position,
+          width: entity.width,
+          height: entity.height,
+          pitch: entity.pitch,
+          yaw: entity.yaw,
+        });
+      }
+    }
+    this.worldView.listenToBot(this.bot);
+  }
+
+  public get isStale(): boolean {
+    return this.viewDistance !== viewDistanceToNumber(this.bot);
+  }
+
+  /**
+   * Renders the view from `eyePosition` looking at `lookAt` and encodes it as a PNG.
+   *
+   * The encoding happens on libuv's threadpool (via node-canvas's async `toBuffer`), so
+   * only the render itself blocks the event loop.
+   */
+  public async renderPNG(eyePosition: Vec3, lookAt: Vec3): Promise<Buffer> {
+    await this.initialization;
+    await this.worldView.updatePosition(eyePosition);
+    const { x, y, z } = eyePosition;
+    this.viewer.camera.position.set(x, y, z);
+    this.viewer.camera.lookAt(lookAt.x, lookAt.y, lookAt.z);
+
+    // Only waits on chunks that changed (or came into view) since the last render
+    await this.viewer.world.waitForChunksToRender();
+    this.renderer.render(this.viewer.scene, this.viewer.camera);
+
+    return await new Promise<Buffer>((resolve, reject) => {
+      this.canvas.toBuffer((err: Error | null, buffer: Buffer) => {
+        if (err) {
+          reject(err);
+        } else {
+          resolve(buffer);
+        }
+      }, "image/png");
+    });
+  }
+
+  public dispose(): void {
+    this.worldView.removeListenersFromBot(this.bot);
+    this.renderer.dispose();
+  }
+}
+
+const POV_RENDERERS = new WeakMap<Bot, POVRenderer>();
+
+/**
+ * Gets the bot's `POVRenderer`, creating it on first use (or when the bot's view
+ * distance has changed since it was created).
+ */
+export function getPOVRenderer(bot: Bot): POVRenderer {
+  let povRenderer = POV_RENDERERS.get(bot);
+  if (povRenderer && povRenderer.isStale) {
+    povRenderer.dispose();
+    povRenderer = undefined;
+  }
+  if (!povRenderer) {
+    const newPOVRenderer = new POVRenderer(bot);
+    bot.once("end", () => {
+      if (POV_RENDERERS.get(bot) === newPOVRenderer) {
+        newPOVRenderer.dispose();
+        POV_RENDERERS.delete(bot);
+      }
+    });
+    POV_RENDERERS.set(bot, newPOVRenderer);
+    povRenderer = newPOVRenderer;
+  }
+  return povRenderer;
+}
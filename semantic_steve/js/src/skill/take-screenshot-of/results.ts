@@ -3,8 +3,15 @@ import { SkillResult } from "../../types";
 export namespace TakeScreenshotOfResults {
   export class InvalidThing implements SkillResult {
     message: string;
-    constructor(thing: string, supportedThingTypes: string) {
+    constructor(
+      thing: string,
+      supportedThingTypes: string,
+      suggestions: string[] = []
+    ) {
       this.message = `SkillInvocationError: '${thing}' is not a recognized or supported thing. Currently, only screenshot of these varieties of things can be taken: ${supportedThingTypes}.`;
+      if (suggestions.length > 0) {
+        this.message += ` Did you mean: ${suggestions.join(", ")}?`;
+      }
     }
   }
 
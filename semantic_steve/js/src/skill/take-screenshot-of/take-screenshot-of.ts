@@ -1,29 +1,22 @@
 import assert from "assert";
 import { Bot } from "mineflayer";
 import { Skill, SkillMetadata, SkillResolutionHandler } from "../skill";
-import * as THREE from "three";
-const { createCanvas } = require("node-canvas-webgl/lib");
 import * as path from "path";
 import * as fs from "fs";
 import { Vec3 } from "vec3";
 import { keyboard, Key } from "@nut-tree-fork/nut-js";
 import { execSync } from "child_process";
-const {
-  Viewer,
-  WorldView,
-  getBufferFromStream,
-} = require("prismarine-viewer/viewer");
 import { SUPPORTED_THING_TYPES, Thing } from "../../thing";
-import { InvalidThingError } from "../../types";
 import { TakeScreenshotOfResults } from "./results";
 import { asyncSleep } from "../../utils/generic";
 import { BOT_EYE_HEIGHT } from "../../constants";
 import { MC_COMMAND_WAIT_MS, SCREENSHOT_WAIT_MS } from "../../constants";
+import { getPOVRenderer } from "./pov-renderer";
+import { getLogger } from "../../utils/logging";
 
-// TODO: Currently this skill isn't pausable/resumable like it should be.
+const logger = getLogger("take-screenshot-of");
 
-const CANVAS_WIDTH = 512;
-const CANVAS_HEIGHT = 512;
+// TODO: Currently this skill isn't pausable/resumable like it should be.
 
 // NOTE: If this is slower, commands in the chat are prone to returning:
 // "Chat disabled due to expired profile public key. Please try reconnecting."
@@ -68,88 +61,16 @@ export class TakeScreenshotOf extends Skill {
     }
   }
 
-  private viewDistanceToNumber(): number {
-    switch (this.bot.settings.viewDistance) {
-      case "tiny":
-        return 4;
-      case "short":
-        return 8;
-      case "normal":
-        return 12;
-      case "far":
-        return 16;
-      default:
-        return 12; // Default to normal if not recognized
-    }
-  }
-
   private async takePOVScreenshotWithViewer(
     destinationPath: string
   ): Promise<boolean> {
     assert(this.atCoords);
-    const canvas = createCanvas(CANVAS_WIDTH, CANVAS_HEIGHT);
-    const renderer = new THREE.WebGLRenderer({ canvas });
-    const viewer = new Viewer(renderer);
-    if (!viewer.setVersion(this.bot.version)) {
-      throw new Error(
-        `prismarine-viewer does not support version: ${this.bot.version}`
-      );
-    }
-
     const eyePosition = this.bot.entity.position.offset(0, BOT_EYE_HEIGHT, 0);
-
-    // Create world view
-    const worldView = new WorldView(
-      this.bot.world,
-      this.viewDistanceToNumber(),
-      eyePosition
+    const buffer = await getPOVRenderer(this.bot).renderPNG(
+      eyePosition,
+      this.atCoords
     );
-    viewer.listen(worldView);
-
-    // Set up the viewer
-    viewer.camera.position.set(eyePosition.x, eyePosition.y, eyePosition.z);
-    viewer.camera.lookAt(this.atCoords.x, this.atCoords.y, this.atCoords.z);
-
-    // Initialize the world view
-    await worldView.init(eyePosition);
-
-    // Synchronize with bot's entities if available
-    if (this.bot.entities) {
-      for (const entityId in this.bot.entities) {
-        const e = this.bot.entities[entityId];
-        if (e !== this.bot.entity) {
-          // Add other entities to the world view
-          viewer.updateEntity({
-            id: e.id,
-            pos: e.position,
-            pitch: e.pitch,
-            yaw: e.yaw,
-          });
-        }
-      }
-    }
-
-    // Wait for chunks to render
-    await viewer.world.waitForChunksToRender();
-
-    // Render the scene
-    renderer.render(viewer.scene, viewer.camera);
-
-    // Create image stream
-    const imageStream = canvas.createJPEGStream({
-      // bufsize: 4096,
-      quality: 100,
-      progressive: false,
-    });
-
-    // Get buffer from stream
-    const buffer = await getBufferFromStream(imageStream);
-    fs.writeFileSync(destinationPath, buffer); // Save the screenshot to the destination path
-
-    // Clean up resources
-    // viewer.dispose();
-    // renderer.dispose();
-
+    await fs.promises.writeFile(destinationPath, buffer);
     return true;
   }
 
@@ -174,17 +95,17 @@ export class TakeScreenshotOf extends Skill {
         .toString()
         .trim();
     } catch (error) {
-      console.error("Failed to get current frontmost application:", error);
+      logger.warning("Failed to get current frontmost application", error);
     }
 
     // Focus the Minecraft window
-    console.log("Attempting to focus Minecraft window...");
+    logger.debug("Attempting to focus Minecraft window...");
     try {
       execSync(
         `osascript -e 'tell application "System Events" to tell (first process whose name contains "java" or name contains "Minecraft") to set frontmost to true'`
       );
     } catch (error) {
-      console.error("Failed to focus Minecraft window:", error);
+      logger.error("Failed to focus Minecraft window", error);
       return false;
     }
 
@@ -199,7 +120,7 @@ export class TakeScreenshotOf extends Skill {
     const afterFiles = fs.readdirSync(MC_SCREENSHOT_DIR_PATH);
     const newFiles = afterFiles.filter((file) => !beforeFiles.includes(file));
     if (newFiles.length === 0) {
-      console.error("No new screenshot file detected");
+      logger.error("No new screenshot file detected");
       return false;
     }
     const screenshotPath = path.join(MC_SCREENSHOT_DIR_PATH, newFiles[0]);
@@ -210,14 +131,14 @@ export class TakeScreenshotOf extends Skill {
     await asyncSleep(MC_COMMAND_WAIT_MS); // Wait for chat to open
 
     // Restore the previously focused application
-    console.log("Restoring focus of previous application:", previousApp);
+    logger.debug(`Restoring focus of previous application: ${previousApp}`);
     if (previousApp) {
       try {
         execSync(
           `osascript -e 'tell application id "${previousApp}" to activate'`
         );
       } catch (error) {
-        console.error("Failed to restore previous application:", error);
+        logger.warning("Failed to restore previous application", error);
       }
     }
 
@@ -269,17 +190,15 @@ export class TakeScreenshotOf extends Skill {
     atCoordinates?: [number, number, number]
   ): Promise<void> {
     // Validate thing
-    try {
-      this.thing = this.bot.thingFactory.createThing(thing);
-    } catch (err) {
-      if (err instanceof InvalidThingError) {
-        const result = new TakeScreenshotOfResults.InvalidThing(
-          thing,
-          SUPPORTED_THING_TYPES.toString()
-        );
-        this.resolve(result);
-        return;
-      }
+    this.thing = this.bot.thingFactory.tryCreateThing(thing);
+    if (!this.thing) {
+      const result = new TakeScreenshotOfResults.InvalidThing(
+        thing,
+        SUPPORTED_THING_TYPES.toString(),
+        this.bot.thingFactory.getSuggestions(thing)
+      );
+      this.resolve(result);
+      return;
     }
     assert(typeof this.thing === "object"); // Obviously true (above), but TS compiler doesn't know this
 
@@ -3,7 +3,7 @@ import { Bot } from "mineflayer";
 import { Thing } from "./thing";
 import { Vec3 } from "vec3";
 import { Direction, Vicinity } from "../env-state/surroundings";
-import { MaybePromise } from "../types";
+import { MaybePromise, InvalidThingError } from "../types";
 
 export class Biome implements Thing {
   bot: Bot;
@@ -13,7 +13,7 @@ export class Biome implements Thing {
   constructor(bot: Bot, name: string) {
     const biomeNames = Object.values(bot.registry.biomes).map((b) => b.name);
     if (!biomeNames.includes(name)) {
-      throw new Error(`Invalid biome type: ${name}.`);
+      throw new InvalidThingError(`Invalid biome type: ${name}.`);
     }
 
     this.bot = bot;
@@ -4,9 +4,8 @@ import { Vec3 } from "vec3";
 import { Direction } from "../env-state/surroundings";
 import { MaybePromise, InvalidThingError } from "../types";
 import { IndexedBlock } from "minecraft-data";
-import { simplify as nbtSimplify } from "prismarine-nbt";
 import { Item as PItem } from "prismarine-item";
-import { getDigTimeMS } from "../utils/block";
+import { getDigTimeTable } from "../utils/mining";
 
 export class Block implements Thing {
   bot: Bot;
@@ -37,37 +36,20 @@ export class Block implements Thing {
    *   tool is needed).
    */
   public assessCurrentMineability(): [boolean, number | null] {
-    const pblock = this.pblock; // new PBlock(this.pblock.id, 0, 0); // Default metadata/stateId
-    if (!pblock.diggable) {
+    if (!this.pblock.diggable) {
       return [false, null];
     }
 
-    const canMine = (itemID: number | null): boolean => {
-      const pBlockHasNoDrops = !pblock.drops || pblock.drops.length === 0;
-      const pBlockHasNoHarvestTools = !pblock.harvestTools;
-      if (pBlockHasNoDrops || pBlockHasNoHarvestTools) {
-        return getDigTimeMS(this.bot, this.pblock.id, itemID) < 100000; // 100 seconds
-      } else {
-        if (itemID === null || !pblock.harvestTools) {
-          return false;
-        }
-        return (
-          itemID in pblock.harvestTools &&
-          getDigTimeMS(this.bot, this.pblock.id, itemID) < 100000 // 100 seconds
-        );
-      }
-    };
-
+    const digTimeTable = getDigTimeTable(this.bot);
+    const inventory = this.bot.envState.inventory;
     let fastestDigTime = Number.MAX_VALUE;
     let bestTool: PItem | undefined = undefined;
-    for (const item of this.bot.envState.inventory.itemSlots) {
-      const itemID = item.type;
-      if (canMine(itemID)) {
-        const digTime = getDigTimeMS(
-          this.bot,
+    for (const item of inventory.itemSlots) {
+      if (digTimeTable.canMineWith(this.pblock.id, item.type)) {
+        const digTime = digTimeTable.getDigTimeMS(
           this.pblock.id,
-          itemID,
-          item && item.nbt ? nbtSimplify(item.nbt).Enchantments : [],
+          item.type,
+          inventory.getEnchantments(item),
           this.bot.entity.effects,
         );
         if (digTime < fastestDigTime) {
@@ -79,7 +61,7 @@ export class Block implements Thing {
 
     if (bestTool) {
       return [true, bestTool.type];
-    } else if (canMine(null)) {
+    } else if (digTimeTable.canMineWith(this.pblock.id, null)) {
       return [true, null]; // If the block can be mined with the hand
     }
     return [false, null]; // No viable tool and block can't be mined w/ hand
@@ -3,39 +3,67 @@ import { Thing } from "./thing";
 import { Block } from "./block";
 import { Biome } from "./biome";
 import { ItemEntity } from "./item-entity";
+import { getThingNameIndex, ThingNameIndex } from "./name-index";
 import { InvalidThingError } from "../types";
 
 export const SUPPORTED_THING_TYPES: string[] = ["block", "biome", "itemEntity"];
 
 export class ThingFactory {
   bot: Bot;
+  // Canonical thing name -> Thing (Things are immutable, so they can be shared)
+  private namesToThings: Map<string, Thing> = new Map();
 
   constructor(bot: Bot) {
     this.bot = bot;
   }
 
-  public createThing(thingName: string): Thing {
-    const attemptCreate = (
-      Type: new (bot: Bot, name: string) => Thing,
-    ): Thing | null => {
-      try {
-        return new Type(this.bot, thingName);
-      } catch (err) {
-        if (!(err instanceof InvalidThingError)) throw err;
-        return null;
+  private get nameIndex(): ThingNameIndex {
+    return getThingNameIndex(this.bot.registry);
+  }
+
+  /**
+   * Gets the Thing for a name, or undefined if the name isn't valid for any supported
+   * type (w/out throwing, unlike `createThing`).
+   */
+  public tryCreateThing(thingName: string): Thing | undefined {
+    const lookup = this.nameIndex.lookup(thingName);
+    if (!lookup) {
+      return undefined;
+    }
+    const [kind, , name] = lookup;
+    let thing = this.namesToThings.get(name);
+    if (!thing) {
+      // Precedence (for names valid for multiple types): Block, ItemEntity, Biome
+      if (kind === "block") {
+        thing = new Block(this.bot, name);
+      } else if (kind === "itemEntity") {
+        thing = new ItemEntity(this.bot, name);
+      } else {
+        thing = new Biome(this.bot, name);
       }
-    };
+      this.namesToThings.set(name, thing);
+    }
+    return thing;
+  }
 
-    // Try each type in order of precedence
-    const types = [Block, ItemEntity, Biome];
-    for (const Type of types) {
-      const result = attemptCreate(Type);
-      if (result) return result;
+  public createThing(thingName: string): Thing {
+    const thing = this.tryCreateThing(thingName);
+    if (thing) {
+      return thing;
     }
 
     // If we reach here, it means the thingName is not valid for any supported type
+    const suggestions = this.getSuggestions(thingName);
     throw new InvalidThingError(
-      `Invalid thing name: ${thingName}. Supported types are: ${SUPPORTED_THING_TYPES}`,
+      `Invalid thing name: ${thingName}. Supported types are: ${SUPPORTED_THING_TYPES}` +
+        (suggestions.length ? `. Did you mean: ${suggestions.join(", ")}?` : ""),
     );
   }
+
+  /**
+   * Gets valid thing names that are close to an invalid one (e.g., "oak_log" for "log").
+   */
+  public getSuggestions(thingName: string): string[] {
+    return this.nameIndex.getSuggestions(thingName);
+  }
 }
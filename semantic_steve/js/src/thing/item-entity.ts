@@ -14,17 +14,13 @@ export class ItemEntity implements Thing {
 
   constructor(bot: Bot, name?: string, id?: number) {
     if (name) {
-      const itemEntityNames = Object.values(bot.registry.itemsByName).map(
-        (i) => i.name,
-      );
-      if (!itemEntityNames.includes(name)) {
+      if (!(name in bot.registry.itemsByName)) {
         throw new InvalidThingError(`Invalid item entity type: ${name}.`);
       }
       this.name = name;
       this.id = bot.registry.itemsByName[name].id;
-    } else if (id) {
-      const itemEntityIds = Object.values(bot.registry.items).map((i) => i.id);
-      if (!itemEntityIds.includes(id)) {
+    } else if (id !== undefined) {
+      if (!bot.registry.items[id]) {
         throw new InvalidThingError(`Invalid item entity id: ${id}.`);
       }
       this.id = id;
@@ -79,15 +75,18 @@ export class ItemEntity implements Thing {
       this.bot.envState.surroundings.immediate.itemEntitiesToAllCoords.get(
         this.name,
       );
-    if (immediate && immediate.length > 0) {
-      // Sort the coordinates by distance to the bot's position
-      immediate.sort((a, b) => {
-        const distanceA = a.distanceTo(this.bot.entity.position);
-        const distanceB = b.distanceTo(this.bot.entity.position);
-        return distanceA - distanceB;
-      });
-      // Return the closest coordinate
-      return immediate[0];
+    if (immediate && immediate.size > 0) {
+      // Find the coordinates closest to the bot's position
+      let closestCoords: Vec3 | undefined = undefined;
+      let minDistance = Infinity;
+      for (const coords of immediate.values()) {
+        const distance = coords.distanceTo(this.bot.entity.position);
+        if (distance < minDistance) {
+          minDistance = distance;
+          closestCoords = coords;
+        }
+      }
+      return closestCoords?.clone();
     }
   }
 
@@ -101,9 +100,9 @@ export class ItemEntity implements Thing {
           this.name,
         );
         if (count && count > 0) {
-          return surroundingsInDirection.itemEntitiesToClosestCoords.get(
-            this.name,
-          );
+          return surroundingsInDirection.itemEntitiesToClosestCoords
+            .get(this.name)
+            ?.clone();
         }
       }
       return undefined; // No item entities found in the specified direction
@@ -145,7 +144,7 @@ export class ItemEntity implements Thing {
         this.name,
       );
     if (immediate) {
-      return immediate.some((coord) => coord.equals(coords));
+      return [...immediate.values()].some((coord) => coord.equals(coords));
     }
     return false;
   }
@@ -0,0 +1,171 @@
+import { IndexedData } from "minecraft-data";
+
+// Maximum number of near-miss suggestions to return
+const MAX_SUGGESTIONS = 5;
+// Minimum trigram (Jaccard) similarity for a name to be suggested
+const MIN_TRIGRAM_SIMILARITY = 0.3;
+
+export type ThingKind = "block" | "itemEntity" | "biome";
+
+function getTrigrams(name: string): Set<string> {
+  const padded = `  ${name} `;
+  const trigrams = new Set<string>();
+  for (let i = 0; i < padded.length - 2; i++) {
+    trigrams.add(padded.slice(i, i + 3));
+  }
+  return trigrams;
+}
+
+function getSingularForms(name: string): string[] {
+  const forms: string[] = [];
+  if (name.endsWith("ies")) forms.push(`${name.slice(0, -3)}y`);
+  if (name.endsWith("es")) forms.push(name.slice(0, -2));
+  if (name.endsWith("s")) forms.push(name.slice(0, -1));
+  return forms;
+}
+
+/**
+ * Name -> (kind, ID) index of every thing name in a given `bot.registry`, w/ lookups for
+ * suggesting valid names close to invalid ones (e.g., LLM-generated plurals or "log" for
+ * "oak_log").
+ *
+ * Names that are valid for multiple kinds map to the first of block, item entity, biome.
+ */
+export class ThingNameIndex {
+  private namesToKindsAndIDs: Map<string, [ThingKind, number]> = new Map();
+  private names: string[] = [];
+  private tokensToNames: Map<string, string[]> = new Map();
+  private trigramsToNameIndices: Map<string, number[]> = new Map();
+  private nameTrigramCounts: number[] = [];
+
+  constructor(registry: IndexedData) {
+    const add = (name: string, kind: ThingKind, id: number) => {
+      if (!this.namesToKindsAndIDs.has(name)) {
+        this.namesToKindsAndIDs.set(name, [kind, id]);
+      }
+    };
+    for (const block of Object.values(registry.blocks)) {
+      add(block.name, "block", block.id);
+    }
+    for (const item of Object.values(registry.items)) {
+      add(item.name, "itemEntity", item.id);
+    }
+    for (const biome of Object.values(registry.biomes)) {
+      add(biome.name, "biome", biome.id);
+    }
+
+    for (const name of this.namesToKindsAndIDs.keys()) {
+      const nameIndex = this.names.length;
+      this.names.push(name);
+      for (const token of new Set(name.split("_"))) {
+        const namesWithToken = this.tokensToNames.get(token) ?? [];
+        namesWithToken.push(name);
+        this.tokensToNames.set(token, namesWithToken);
+      }
+      const trigrams = getTrigrams(name);
+      this.nameTrigramCounts.push(trigrams.size);
+      for (const trigram of trigrams) {
+        const nameIndices = this.trigramsToNameIndices.get(trigram) ?? [];
+        nameIndices.push(nameIndex);
+        this.trigramsToNameIndices.set(trigram, nameIndices);
+      }
+    }
+    for (const namesWithToken of this.tokensToNames.values()) {
+      namesWithToken.sort((a, b) => a.length - b.length);
+    }
+  }
+
+  /**
+   * Normalizes trivial differences (case, whitespace/hyphens, "minecraft:" prefix).
+   */
+  public static normalize(name: string): string {
+    return name
+      .trim()
+      .toLowerCase()
+      .replace(/^minecraft:/, "")
+      .replace(/[\s-]+/g, "_");
+  }
+
+  /**
+   * Looks up the kind and ID of a (possibly un-normalized) thing name.
+   *
+   * @returns [kind, ID, canonical name], or undefined if the name isn't valid.
+   */
+  public lookup(name: string): [ThingKind, number, string] | undefined {
+    for (const candidate of [name, ThingNameIndex.normalize(name)]) {
+      const kindAndID = this.namesToKindsAndIDs.get(candidate);
+      if (kindAndID) {
+        return [kindAndID[0], kindAndID[1], candidate];
+      }
+    }
+  }
+
+  /**
+   * Gets valid names that are close to an invalid one, best first.
+   */
+  public getSuggestions(name: string): string[] {
+    const normalized = ThingNameIndex.normalize(name);
+    const suggestions = new Set<string>();
+    const addSuggestion = (suggestion: string) => {
+      if (suggestions.size < MAX_SUGGESTIONS && suggestion !== normalized) {
+        suggestions.add(suggestion);
+      }
+    };
+
+    // 1. Singular forms of plurals (e.g., "oak_logs" -> "oak_log")
+    const singularForms = getSingularForms(normalized);
+    for (const form of singularForms) {
+      if (this.namesToKindsAndIDs.has(form)) addSuggestion(form);
+    }
+
+    // 2. Names containing the name as a whole token (e.g., "log" -> "oak_log")
+    for (const form of [normalized, ...singularForms]) {
+      for (const nameWithToken of this.tokensToNames.get(form) ?? []) {
+        addSuggestion(nameWithToken);
+      }
+    }
+
+    // 3. Names w/ the most similar trigrams (e.g., typos)
+    if (suggestions.size < MAX_SUGGESTIONS) {
+      const trigrams = getTrigrams(normalized);
+      const nameIndicesToNSharedTrigrams = new Map<number, number>();
+      for (const trigram of trigrams) {
+        for (const nameIndex of this.trigramsToNameIndices.get(trigram) ?? []) {
+          nameIndicesToNSharedTrigrams.set(
+            nameIndex,
+            (nameIndicesToNSharedTrigrams.get(nameIndex) ?? 0) + 1,
+          );
+        }
+      }
+      const scoredNames: [string, number][] = [];
+      for (const [nameIndex, nShared] of nameIndicesToNSharedTrigrams) {
+        const nUnion =
+          trigrams.size + this.nameTrigramCounts[nameIndex] - nShared;
+        const similarity = nShared / nUnion;
+        if (similarity >= MIN_TRIGRAM_SIMILARITY) {
+          scoredNames.push([this.names[nameIndex], similarity]);
+        }
+      }
+      scoredNames.sort((a, b) => b[1] - a[1]);
+      for (const [similarName] of scoredNames) {
+        addSuggestion(similarName);
+      }
+    }
+
+    return [...suggestions];
+  }
+}
+
+const THING_NAME_INDEXES = new WeakMap<IndexedData, ThingNameIndex>();
+
+/**
+ * Gets the `ThingNameIndex` for a registry, building it on first use.
+ */
+export function getThingNameIndex(registry: IndexedData): ThingNameIndex {
+  let index = THING_NAME_INDEXES.get(registry);
+  if (!index) {
+    index = new ThingNameIndex(registry);
+    THING_NAME_INDEXES.set(registry, index);
+  }
+  return index;
+}
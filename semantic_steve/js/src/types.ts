@@ -6,6 +6,12 @@ export interface SemanticSteveConfigOptions {
   botPort?: number;
   mfViewerPort?: number;
   zmqPort?: number;
+  zmqEndpoint?: string;
+  sharedMemoryPath?: string;
+  worldMemoryDir?: string;
+  profileDir?: string;
+  profileNSlowest?: number;
+  heapSnapshotThresholdMB?: number;
   username?: string;
 }
 
@@ -17,6 +23,16 @@ export class SemanticSteveConfig {
   botPort: number;
   mfViewerPort: number;
   zmqPort: number;
+  zmqEndpoint: string;
+  sharedMemoryPath?: string;
+  // Dir of the (opt-in) persistent world memories (one per world)
+  worldMemoryDir?: string;
+  // Dir to write profiles of skill invocations to (profiling is disabled if undefined)
+  profileDir?: string;
+  // Only keep the CPU profiles of the N slowest invocations (undefined = keep all)
+  profileNSlowest?: number;
+  // Heap size (MB) past which a heap snapshot is taken (undefined = never)
+  heapSnapshotThresholdMB?: number;
   username: string;
 
   constructor(options: SemanticSteveConfigOptions = {}) {
@@ -28,6 +44,12 @@ export class SemanticSteveConfig {
     this.botPort = options.botPort ?? 25565;
     this.mfViewerPort = options.mfViewerPort ?? 3000;
     this.zmqPort = options.zmqPort ?? 5555;
+    this.zmqEndpoint = options.zmqEndpoint ?? `tcp://*:${this.zmqPort}`;
+    this.sharedMemoryPath = options.sharedMemoryPath;
+    this.worldMemoryDir = options.worldMemoryDir;
+    this.profileDir = options.profileDir;
+    this.profileNSlowest = options.profileNSlowest;
+    this.heapSnapshotThresholdMB = options.heapSnapshotThresholdMB;
     this.username = options.username ?? "SemanticSteve";
   }
 }
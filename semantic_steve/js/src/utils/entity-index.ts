@@ -0,0 +1,167 @@
+import { Bot } from "mineflayer";
+import { Entity } from "prismarine-entity";
+import { Vec3 } from "vec3";
+
+// Side length (in blocks) of the cells of the spatial hash
+const ENTITY_INDEX_CELL_SIZE = 8;
+
+function toCell(coord: number): number {
+  return Math.floor(coord / ENTITY_INDEX_CELL_SIZE);
+}
+
+function getCellKey(cellX: number, cellY: number, cellZ: number): string {
+  return `${cellX},${cellY},${cellZ}`;
+}
+
+function getCellKeyOfPosition(position: Vec3): string {
+  return getCellKey(toCell(position.x), toCell(position.y), toCell(position.z));
+}
+
+export function isHostile(entity: Entity): boolean {
+  // NOTE: Depending on the version's minecraft-data, hostile mobs either have the type
+  // "hostile" or the type "mob" and the kind "Hostile mobs"
+  return (
+    (entity.type as string) === "hostile" || entity.kind === "Hostile mobs"
+  );
+}
+
+/**
+ * Spatial hash of the bot's live entities (other than itself), by entity type, kept up to
+ * date from entity spawns, moves, and removals.
+ *
+ * Finding the entities of a type near some position only visits the cells around it (and
+ * only the entities of that type in them), rather than all of `bot.entities`.
+ */
+export class EntityIndex {
+  private bot: Bot;
+  // Entity type -> cell key -> entities of that type in that cell
+  private cellsByType: Map<string, Map<string, Set<Entity>>> = new Map();
+  // Entity ID -> type & cell key the entity is indexed under
+  private indexedEntities: Map<number, { type: string; cellKey: string }> =
+    new Map();
+
+  constructor(bot: Bot) {
+    this.bot = bot;
+    this.rebuild();
+    this.bot.on("entitySpawn", (entity) => this.add(entity));
+    this.bot.on("entityMoved", (entity) => this.move(entity));
+    this.bot.on("entityGone", (entity) => this.remove(entity));
+    // Entities are replaced wholesale on (re)spawns (e.g., dimension changes)
+    this.bot.on("spawn", () => this.rebuild());
+  }
+
+  private rebuild(): void {
+    this.cellsByType.clear();
+    this.indexedEntities.clear();
+    for (const entity of Object.values(this.bot.entities)) {
+      this.add(entity);
+    }
+  }
+
+  private add(entity: Entity): void {
+    if (entity === this.bot.entity || this.indexedEntities.has(entity.id)) {
+      return;
+    }
+    const cellKey = getCellKeyOfPosition(entity.position);
+    let cells = this.cellsByType.get(entity.type);
+    if (!cells) {
+      cells = new Map();
+      this.cellsByType.set(entity.type, cells);
+    }
+    let cell = cells.get(cellKey);
+    if (!cell) {
+      cell = new Set();
+      cells.set(cellKey, cell);
+    }
+    cell.add(entity);
+    this.indexedEntities.set(entity.id, { type: entity.type, cellKey });
+  }
+
+  private move(entity: Entity): void {
+    const indexed = this.indexedEntities.get(entity.id);
+    if (!indexed) {
+      this.add(entity);
+    } else if (
+      indexed.type !== entity.type ||
+      indexed.cellKey !== getCellKeyOfPosition(entity.position)
+    ) {
+      this.remove(entity);
+      this.add(entity);
+    }
+  }
+
+  private remove(entity: Entity): void {
+    const indexed = this.indexedEntities.get(entity.id);
+    if (!indexed) {
+      return;
+    }
+    this.indexedEntities.delete(entity.id);
+    const cells = this.cellsByType.get(indexed.type);
+    const cell = cells?.get(indexed.cellKey);
+    if (cells && cell) {
+      cell.delete(entity);
+      if (cell.size === 0) {
+        cells.delete(indexed.cellKey);
+      }
+    }
+  }
+
+  /**
+   * Gets the (live) entities within a radius of a position, optionally only of some types
+   * and/or matching a predicate.
+   */
+  public getEntitiesNear(
+    position: Vec3,
+    radius: number,
+    types?: string[],
+    predicate?: (entity: Entity) => boolean,
+  ): Entity[] {
+    const minCellX = toCell(position.x - radius);
+    const maxCellX = toCell(position.x + radius);
+    const minCellY = toCell(position.y - radius);
+    const maxCellY = toCell(position.y + radius);
+    const minCellZ = toCell(position.z - radius);
+    const maxCellZ = toCell(position.z + radius);
+    const entities: Entity[] = [];
+    for (const type of types ?? this.cellsByType.keys()) {
+      const cells = this.cellsByType.get(type);
+      if (!cells) {
+        continue;
+      }
+      for (let cellX = minCellX; cellX <= maxCellX; cellX++) {
+        for (let cellY = minCellY; cellY <= maxCellY; cellY++) {
+          for (let cellZ = minCellZ; cellZ <= maxCellZ; cellZ++) {
+            const cell = cells.get(getCellKey(cellX, cellY, cellZ));
+            if (!cell) {
+              continue;
+            }
+            for (const entity of cell) {
+              if (
+                entity.isValid &&
+                entity.position.distanceTo(position) <= radius &&
+                (!predicate || predicate(entity))
+              ) {
+                entities.push(entity);
+              }
+            }
+          }
+        }
+      }
+    }
+    return entities;
+  }
+}
+
+const ENTITY_INDEXES = new WeakMap<Bot, EntityIndex>();
+
+/**
+ * Gets the bot's `EntityIndex`, creating it on first use.
+ */
+export function getEntityIndex(bot: Bot): EntityIndex {
+  let index = ENTITY_INDEXES.get(bot);
+  if (!index) {
+    index = new EntityIndex(bot);
+    ENTITY_INDEXES.set(bot, index);
+  }
+  return index;
+}
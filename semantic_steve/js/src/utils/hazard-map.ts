@@ -0,0 +1,226 @@
+import { Bot } from "mineflayer";
+import { Block as PBlock } from "prismarine-block";
+import { Vec3 } from "vec3";
+import { isAirBlockName } from "../env-state/surroundings/world-memory";
+
+export enum Hazard {
+  LAVA = "lava",
+  FIRE = "fire",
+  VOID = "void", // Nothing to land on before falling out of the world
+}
+
+const HAZARDOUS_BLOCKS: { [blockName: string]: Hazard } = {
+  lava: Hazard.LAVA,
+  fire: Hazard.FIRE,
+  soul_fire: Hazard.FIRE,
+};
+
+// Half the side length of the cube (around the bot) whose hazards are cached
+const HAZARD_MAP_RADIUS = 8;
+// How far (in blocks, along any axis) the bot can move before the cube is rebuilt
+const HAZARD_MAP_MAX_DRIFT = 4;
+// Max. radius around the bot that the cached cube always covers
+export const HAZARD_MAP_MAX_QUERY_RADIUS =
+  HAZARD_MAP_RADIUS - HAZARD_MAP_MAX_DRIFT;
+
+function getCellKey(x: number, y: number, z: number): string {
+  return `${x},${y},${z}`;
+}
+
+function getColumnKey(x: number, z: number): string {
+  return `${x},${z}`;
+}
+
+function isAir(block: PBlock | null): boolean {
+  return block === null || isAirBlockName(block.name);
+}
+
+/**
+ * Cache of the hazardous cells (lava, fire, and void columns) in a cube around the bot.
+ *
+ * The cube is only rebuilt once the bot drifts `HAZARD_MAP_MAX_DRIFT` blocks from its
+ * center (or chunks in it load). In between, block updates patch the affected cell and
+ * column (whose topmost solid block is cached, so that it is only rescanned when that
+ * block is removed), so finding the hazards near the bot only visits the (few)
+ * hazardous cells.
+ */
+export class HazardMap {
+  private bot: Bot;
+  private origin?: Vec3;
+  // Keys of the hazardous cells in the cube -> their hazard
+  private hazardousCells: Map<string, Hazard> = new Map();
+  // Keys of the (loaded) columns of the cube -> the y of their topmost solid block at or
+  // below the top of the cube (or null if there is none, i.e., the column is void)
+  private columnTops: Map<string, number | null> = new Map();
+  // Keys of the columns of the cube w/ nothing in them down to the bottom of the world
+  private voidColumns: Set<string> = new Set();
+  private searchPos: Vec3 = new Vec3(0, 0, 0);
+
+  constructor(bot: Bot) {
+    this.bot = bot;
+    this.bot.on("blockUpdate", (_, newBlock) => {
+      if (newBlock) {
+        this.handleBlockUpdate(newBlock);
+      }
+    });
+    this.bot.world.on("chunkColumnLoad", (point: Vec3) => {
+      // Rebuild (lazily) if the chunk overlaps the cube
+      if (
+        this.origin &&
+        point.x + 15 >= this.origin.x - HAZARD_MAP_RADIUS &&
+        point.x <= this.origin.x + HAZARD_MAP_RADIUS &&
+        point.z + 15 >= this.origin.z - HAZARD_MAP_RADIUS &&
+        point.z <= this.origin.z + HAZARD_MAP_RADIUS
+      ) {
+        this.origin = undefined;
+      }
+    });
+    this.bot.on("spawn", () => (this.origin = undefined));
+  }
+
+  private handleBlockUpdate(block: PBlock): void {
+    const position = block.position;
+    if (
+      !this.origin ||
+      Math.abs(position.x - this.origin.x) > HAZARD_MAP_RADIUS ||
+      Math.abs(position.z - this.origin.z) > HAZARD_MAP_RADIUS ||
+      position.y > this.origin.y + HAZARD_MAP_RADIUS
+    ) {
+      return;
+    }
+    if (position.y >= this.origin.y - HAZARD_MAP_RADIUS) {
+      this.updateCell(position.x, position.y, position.z, block);
+    }
+    // (Blocks below the cube can still fill or empty a void column)
+    const columnKey = getColumnKey(position.x, position.z);
+    if (!this.columnTops.has(columnKey)) {
+      return; // (Unloaded when the cube was built, so handled by the chunk's load)
+    }
+    const top = this.columnTops.get(columnKey)!;
+    if (!isAir(block)) {
+      if (top === null || position.y > top) {
+        this.setColumnTop(columnKey, position.y);
+      }
+    } else if (position.y === top) {
+      // The topmost solid block was removed, so look for the next one below it
+      this.setColumnTop(
+        columnKey,
+        this.findColumnTop(position.x, position.z, position.y - 1),
+      );
+    }
+  }
+
+  private updateCell(
+    x: number,
+    y: number,
+    z: number,
+    block: PBlock | null,
+  ): void {
+    const hazard = block ? HAZARDOUS_BLOCKS[block.name] : undefined;
+    if (hazard) {
+      this.hazardousCells.set(getCellKey(x, y, z), hazard);
+    } else {
+      this.hazardousCells.delete(getCellKey(x, y, z));
+    }
+  }
+
+  private setColumnTop(columnKey: string, top: number | null): void {
+    this.columnTops.set(columnKey, top);
+    if (top === null) {
+      this.voidColumns.add(columnKey);
+    } else {
+      this.voidColumns.delete(columnKey);
+    }
+  }
+
+  /**
+   * Gets the y of the topmost solid block of a column at or below `fromY` (or null if
+   * there is none down to the bottom of the world).
+   */
+  private findColumnTop(x: number, z: number, fromY: number): number | null {
+    const minY = (this.bot.game as any).minY ?? 0;
+    for (let y = fromY; y >= minY; y--) {
+      if (!isAir(this.bot.blockAt(this.searchPos.set(x, y, z)))) {
+        return y;
+      }
+    }
+    return null;
+  }
+
+  private rebuild(origin: Vec3): void {
+    this.origin = origin;
+    this.hazardousCells.clear();
+    this.columnTops.clear();
+    this.voidColumns.clear();
+    const r = HAZARD_MAP_RADIUS;
+    for (let x = origin.x - r; x <= origin.x + r; x++) {
+      for (let z = origin.z - r; z <= origin.z + r; z++) {
+        if (!this.bot.world.getColumnAt(this.searchPos.set(x, 0, z))) {
+          continue; // NOTE: Unloaded columns aren't void, just unknown
+        }
+        // Scan the cells top-down, noting the column's topmost solid block on the way
+        let top: number | null = null;
+        for (let y = origin.y + r; y >= origin.y - r; y--) {
+          const block = this.bot.blockAt(this.searchPos.set(x, y, z));
+          this.updateCell(x, y, z, block);
+          if (top === null && !isAir(block)) {
+            top = y;
+          }
+        }
+        if (top === null) {
+          // (Only columns that are empty throughout the cube are scanned below it)
+          top = this.findColumnTop(x, z, origin.y - r - 1);
+        }
+        this.setColumnTop(getColumnKey(x, z), top);
+      }
+    }
+  }
+
+  /**
+   * Gets the hazards within a radius (<= `HAZARD_MAP_MAX_QUERY_RADIUS`) of the bot. Void
+   * columns are reported at the cell below the bot's feet level.
+   */
+  public getHazardsNearBot(radius: number): { hazard: Hazard; coords: Vec3 }[] {
+    const position = this.bot.entity.position;
+    const botCell = position.floored();
+    if (
+      !this.origin ||
+      Math.abs(botCell.x - this.origin.x) > HAZARD_MAP_MAX_DRIFT ||
+      Math.abs(botCell.y - this.origin.y) > HAZARD_MAP_MAX_DRIFT ||
+      Math.abs(botCell.z - this.origin.z) > HAZARD_MAP_MAX_DRIFT
+    ) {
+      this.rebuild(botCell);
+    }
+    radius = Math.min(radius, HAZARD_MAP_MAX_QUERY_RADIUS);
+    const hazards: { hazard: Hazard; coords: Vec3 }[] = [];
+    for (const [cellKey, hazard] of this.hazardousCells) {
+      const [x, y, z] = cellKey.split(",").map(Number);
+      const coords = new Vec3(x, y, z);
+      if (coords.offset(0.5, 0.5, 0.5).distanceTo(position) <= radius) {
+        hazards.push({ hazard, coords });
+      }
+    }
+    for (const columnKey of this.voidColumns) {
+      const [x, z] = columnKey.split(",").map(Number);
+      const coords = new Vec3(x, botCell.y - 1, z);
+      if (Math.hypot(x + 0.5 - position.x, z + 0.5 - position.z) <= radius) {
+        hazards.push({ hazard: Hazard.VOID, coords });
+      }
+    }
+    return hazards;
+  }
+}
+
+const HAZARD_MAPS = new WeakMap<Bot, HazardMap>();
+
+/**
+ * Gets the bot's `HazardMap`, creating it on first use.
+ */
+export function getHazardMap(bot: Bot): HazardMap {
+  let hazardMap = HAZARD_MAPS.get(bot);
+  if (!hazardMap) {
+    hazardMap = new HazardMap(bot);
+    HAZARD_MAPS.set(bot, hazardMap);
+  }
+  return hazardMap;
+}
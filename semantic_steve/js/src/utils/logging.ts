@@ -0,0 +1,95 @@
+// Name of the env var (set by the Python process manager) w/ the min. level to log
+export const LOG_LEVEL_ENV_VAR_NAME = "SEMANTIC_STEVE_LOG_LEVEL";
+
+/**
+ * Log levels (w/ the same names & values as Python's `logging` levels).
+ */
+export enum LogLevel {
+  DEBUG = 10,
+  INFO = 20,
+  WARNING = 30,
+  ERROR = 40,
+}
+
+/**
+ * A message, or a function that builds it (so that building expensive messages is
+ * skipped entirely when their level is disabled).
+ */
+export type LogMessage = string | (() => string);
+export type LogMethod = (message: LogMessage, error?: unknown) => void;
+
+const noop: LogMethod = () => {};
+
+function getLogLevelFromEnv(): LogLevel {
+  const value = process.env[LOG_LEVEL_ENV_VAR_NAME]?.trim().toUpperCase();
+  if (!value) {
+    return LogLevel.INFO;
+  }
+  if (value in LogLevel && isNaN(Number(value))) {
+    return LogLevel[value as keyof typeof LogLevel];
+  }
+  const number = Number(value);
+  return isNaN(number) ? LogLevel.INFO : number;
+}
+
+function formatError(error: unknown): string {
+  return error instanceof Error ? (error.stack ?? error.message) : String(error);
+}
+
+/**
+ * Level-filtered logger that writes one JSON record per line to stderr (which the
+ * Python process manager streams into Python's `logging`).
+ *
+ * The methods of disabled levels are no-ops (bound once, at construction).
+ */
+export class Logger {
+  public readonly name: string;
+  public readonly level: LogLevel;
+  public readonly debug: LogMethod;
+  public readonly info: LogMethod;
+  public readonly warning: LogMethod;
+  public readonly error: LogMethod;
+
+  constructor(name: string, level: LogLevel = getLogLevelFromEnv()) {
+    this.name = name;
+    this.level = level;
+    const getMethod = (methodLevel: LogLevel): LogMethod =>
+      methodLevel >= level
+        ? (message, error) => this.write(methodLevel, message, error)
+        : noop;
+    this.debug = getMethod(LogLevel.DEBUG);
+    this.info = getMethod(LogLevel.INFO);
+    this.warning = getMethod(LogLevel.WARNING);
+    this.error = getMethod(LogLevel.ERROR);
+  }
+
+  public isEnabledFor(level: LogLevel): boolean {
+    return level >= this.level;
+  }
+
+  private write(level: LogLevel, message: LogMessage, error?: unknown): void {
+    const record: { [key: string]: string } = {
+      level: LogLevel[level],
+      name: this.name,
+      msg: typeof message === "function" ? message() : message,
+    };
+    if (error !== undefined) {
+      record.exc = formatError(error);
+    }
+    process.stderr.write(JSON.stringify(record) + "\n");
+  }
+}
+
+const LOGGERS = new Map<string, Logger>();
+
+/**
+ * Gets the logger w/ a given name, creating it on first use.
+ */
+export function getLogger(name: string): Logger {
+  let logger = LOGGERS.get(name);
+  if (!logger) {
+    logger = new Logger(name);
+    LOGGERS.set(name, logger);
+  }
+  return logger;
+}
@@ -0,0 +1,231 @@
+import { Bot } from "mineflayer";
+import { IndexedData } from "minecraft-data";
+import { Effect } from "prismarine-entity";
+
+// Dig times at or above this are considered "not mineable" (100 seconds)
+export const MAX_REASONABLE_DIG_TIME_MS = 100000;
+
+// Approximate tool material speed multipliers from Minecraft
+const TOOL_MATERIAL_MULTIPLIERS: { [material: string]: number } = {
+  wooden: 2,
+  stone: 4,
+  iron: 6,
+  diamond: 8,
+  netherite: 9,
+  gold: 12,
+  golden: 12,
+};
+
+// Which block materials each tool type is effective against
+const TOOL_TYPES_TO_EFFECTIVE_MATERIALS: { [toolType: string]: string } = {
+  pickaxe: "rock",
+  shovel: "dirt",
+  axe: "wood",
+  hoe: "plant",
+};
+
+const TOOL_TYPES = ["pickaxe", "shovel", "axe", "hoe", "sword", "shears"];
+
+export type Enchantment = { name: string; level: number };
+
+/**
+ * Precomputed (blockID, toolID) -> (base dig speed, harvestability) table for a given
+ * `bot.registry`.
+ *
+ * Column 0 is the "hand" column, which is shared by every item that is not a tool (since,
+ * for the purposes of digging, they all behave like an empty hand).
+ */
+export class DigTimeTable {
+  private registry: IndexedData;
+  private nColumns: number;
+  private itemIDsToColumns: Int16Array;
+  private baseDigSpeeds: Float32Array;
+  private canHarvest: Uint8Array;
+  private hasteEffectID?: number;
+  private miningFatigueEffectID?: number;
+
+  constructor(registry: IndexedData) {
+    this.registry = registry;
+    const items = Object.values(registry.items);
+    const blocks = Object.values(registry.blocks);
+
+    // Item IDs that get their own column (everything else maps to the hand column)
+    const toolIDs = new Set<number>();
+    for (const item of items) {
+      if (TOOL_TYPES.some((t) => item.name === t || item.name.endsWith(`_${t}`))) {
+        toolIDs.add(item.id);
+      }
+    }
+    for (const block of blocks) {
+      for (const id of Object.keys(block.harvestTools ?? {})) {
+        toolIDs.add(Number(id));
+      }
+    }
+    const maxItemID = Math.max(0, ...items.map((i) => i.id));
+    this.itemIDsToColumns = new Int16Array(maxItemID + 1); // 0 = hand column
+    const columnsToToolIDs: (number | null)[] = [null];
+    for (const toolID of toolIDs) {
+      if (toolID > maxItemID) continue;
+      this.itemIDsToColumns[toolID] = columnsToToolIDs.length;
+      columnsToToolIDs.push(toolID);
+    }
+    this.nColumns = columnsToToolIDs.length;
+
+    const maxBlockID = Math.max(0, ...blocks.map((b) => b.id));
+    this.baseDigSpeeds = new Float32Array((maxBlockID + 1) * this.nColumns);
+    this.canHarvest = new Uint8Array((maxBlockID + 1) * this.nColumns);
+    for (const block of blocks) {
+      const blockMaterial = block.material || "default";
+      for (let col = 0; col < this.nColumns; col++) {
+        const idx = block.id * this.nColumns + col;
+        const toolID = columnsToToolIDs[col];
+        const tool = toolID === null ? null : registry.items[toolID];
+        let canHarvest = true;
+        if (block.harvestTools) {
+          canHarvest = !!tool && !!block.harvestTools[tool.id];
+        }
+        let digSpeed = 1; // Default speed (bare hands)
+        if (tool) {
+          const [material, toolType] = tool.name.split("_"); // e.g., 'diamond_pickaxe'
+          const effectiveMaterial = TOOL_TYPES_TO_EFFECTIVE_MATERIALS[toolType];
+          const isEffective =
+            effectiveMaterial !== undefined &&
+            blockMaterial.includes(effectiveMaterial);
+          if (isEffective && canHarvest) {
+            digSpeed = TOOL_MATERIAL_MULTIPLIERS[material] || 1;
+          }
+        }
+        this.baseDigSpeeds[idx] = digSpeed;
+        this.canHarvest[idx] = canHarvest ? 1 : 0;
+      }
+    }
+
+    const effectsByName = (registry as any).effectsByName ?? {};
+    this.hasteEffectID = effectsByName["Haste"]?.id;
+    this.miningFatigueEffectID = effectsByName["MiningFatigue"]?.id;
+  }
+
+  private getIndex(blockID: number, toolID: number | null): number {
+    const col =
+      toolID === null || toolID >= this.itemIDsToColumns.length
+        ? 0
+        : this.itemIDsToColumns[toolID];
+    return blockID * this.nColumns + col;
+  }
+
+  /**
+   * Whether the tool (or hand, if null) can harvest (i.e., get drops from) the block.
+   */
+  public canHarvestWith(blockID: number, toolID: number | null): boolean {
+    return this.canHarvest[this.getIndex(blockID, toolID)] === 1;
+  }
+
+  /**
+   * Whether the block can be mined "in a reasonable amount of time" with the tool (or
+   * hand, if null), disregarding enchantments and effects.
+   */
+  public canMineWith(blockID: number, toolID: number | null): boolean {
+    const block = this.registry.blocks[blockID];
+    if (!block) {
+      throw new Error(`Block ${blockID} not found in minecraft-data`);
+    }
+    const blockHasNoDrops = !block.drops || block.drops.length === 0;
+    if (!blockHasNoDrops && block.harvestTools) {
+      if (toolID === null || !(toolID in block.harvestTools)) {
+        return false;
+      }
+    }
+    return this.getDigTimeMS(blockID, toolID) < MAX_REASONABLE_DIG_TIME_MS;
+  }
+
+  /**
+   * Gets the time it takes to dig a block w/ a tool (or hand, if null) in milliseconds.
+   */
+  public getDigTimeMS(
+    blockID: number,
+    toolID: number | null = null,
+    enchantments: Enchantment[] = [], // e.g., [{ name: 'efficiency', level: 2 }]
+    effects?: Effect[],
+    underwater = false,
+    notOnGround = false,
+    aquaAffinity = false,
+  ): number {
+    const block = this.registry.blocks[blockID];
+    if (!block) {
+      throw new Error(`Block ${blockID} not found in minecraft-data`);
+    }
+    if (toolID !== null && !this.registry.items[toolID]) {
+      throw new Error(`Tool ${toolID} not found in minecraft-data`);
+    }
+
+    // Check if block is diggable
+    if (!block.diggable || block.hardness === null || block.hardness < 0) {
+      return Infinity; // Non-diggable blocks (e.g., bedrock, water) take infinite time
+    }
+
+    const idx = this.getIndex(blockID, toolID);
+    let digSpeed = this.baseDigSpeeds[idx];
+
+    // Apply efficiency enchantment
+    for (const enchantment of enchantments) {
+      if (enchantment.name === "efficiency" && enchantment.level > 0) {
+        digSpeed += enchantment.level * enchantment.level + 1;
+        break;
+      }
+    }
+
+    // Apply haste and mining fatigue effects
+    if (effects) {
+      const hasteLevel = this.getEffectLevel(effects, this.hasteEffectID);
+      if (hasteLevel > 0) {
+        digSpeed *= 1 + 0.2 * hasteLevel;
+      }
+      const miningFatigueLevel = this.getEffectLevel(
+        effects,
+        this.miningFatigueEffectID,
+      );
+      if (miningFatigueLevel > 0) {
+        digSpeed *= Math.pow(0.3, Math.min(miningFatigueLevel, 4));
+      }
+    }
+
+    // Adjust for inability to harvest
+    if (this.canHarvest[idx] === 0) {
+      digSpeed /= 5; // Slower if tool can't harvest (e.g., breaking stone with hands)
+    }
+
+    // Calculate base dig time (in seconds)
+    let digTime = block.hardness / digSpeed;
+
+    // Environmental modifiers
+    if (underwater && !aquaAffinity) {
+      digTime *= 5; // 5x slower underwater without Aqua Affinity
+    }
+    if (notOnGround) {
+      digTime *= 5; // 5x slower if not on ground
+    }
+
+    // Convert to milliseconds and round up to nearest tick (1/20th of a second)
+    return Math.ceil((digTime * 1000) / 50) * 50;
+  }
+
+  private getEffectLevel(effects: Effect[], effectID?: number): number {
+    if (effectID === undefined) return 0;
+    const effect = (effects as any)[effectID] as Effect | undefined;
+    return effect ? effect.amplifier + 1 : 0;
+  }
+}
+
+const DIG_TIME_TABLES = new WeakMap<IndexedData, DigTimeTable>();
+
+/**
+ * Gets the `DigTimeTable` for the bot's registry, building it on first use.
+ */
+export function getDigTimeTable(bot: Bot): DigTimeTable {
+  let table = DIG_TIME_TABLES.get(bot.registry);
+  if (!table) {
+    table = new DigTimeTable(bot.registry);
+    DIG_TIME_TABLES.set(bot.registry, table);
+  }
+  return table;
+}
@@ -2,7 +2,11 @@ import assert from "assert";
 import { Bot } from "mineflayer";
 import { Block as PBlock } from "prismarine-block";
 import { Vec3 } from "vec3";
-import { MAX_PLACEMENT_REACH, ADJACENT_OFFSETS } from "../constants";
+import {
+  MAX_PLACEMENT_REACH,
+  ADJACENT_OFFSETS,
+  BOT_EYE_HEIGHT,
+} from "../constants";
 import { CubedMeter } from "./cubed-meter";
 import {
   areContentsOfCoordsVisible,
@@ -85,50 +89,274 @@ export function getViableReferenceBlockAndFaceVectorIfCoordsArePlaceable(
   }
 }
 
-export function getAllPlaceableCoords(bot: Bot): Vec3[] {
-  // Helper for readability
-  function isTooSmallAnOffsetToBeWorthChecking(
-    x: number,
-    y: number,
-    z: number,
-  ): boolean {
-    // If at least one coordinate is 0 and others are 0, 1, or -1
-    // (i.e., the manhattan distance is less than 2^(1/2))
-    const absX = Math.abs(x);
-    const absY = Math.abs(y);
-    const absZ = Math.abs(z);
-    const isZero = Number(absX === 0) + Number(absY === 0) + Number(absZ === 0);
-    const isZeroOrOne = absX <= 1 && absY <= 1 && absZ <= 1;
-    return isZero >= 1 && isZeroOrOne;
+// Radius of the cube (around the bot) in which placeable coords are looked for
+export const PLACEABLE_COORDS_RADIUS = MAX_PLACEMENT_REACH + 1;
+// Beyond this many pending block updates, a full recompute is cheaper than tracing each
+const MAX_PENDING_BLOCK_UPDATES = 64;
+// Voxels w/in this distance of the eye-to-cell-center segment can occlude raycasts to the
+// cell (~0.87 for a raycast target's offset from the cell center + ~0.87 for the voxel's)
+const RAYCAST_OCCLUSION_DISTANCE = 1.75;
+// Max. distance from a cell's center to the center of any of its faces
+const CELL_CENTER_TO_FACE_CENTER_DISTANCE = 0.5;
+
+enum CellState {
+  DIRTY = 0,
+  NOT_PLACEABLE = 1,
+  PLACEABLE = 2,
+}
+
+function isTooSmallAnOffsetToBeWorthChecking(
+  x: number,
+  y: number,
+  z: number,
+): boolean {
+  // If at least one coordinate is 0 and others are 0, 1, or -1
+  // (i.e., the manhattan distance is less than 2^(1/2))
+  const absX = Math.abs(x);
+  const absY = Math.abs(y);
+  const absZ = Math.abs(z);
+  const isZero = Number(absX === 0) + Number(absY === 0) + Number(absZ === 0);
+  const isZeroOrOne = absX <= 1 && absY <= 1 && absZ <= 1;
+  return isZero >= 1 && isZeroOrOne;
+}
+
+/**
+ * Index of the placeable coordinates in the cube around the bot.
+ *
+ * The cube is centered on (and keyed by) the bot's voxel, so it is only fully recomputed
+ * when the bot moves to another voxel (or a chunk overlapping it loads). Otherwise, only
+ * the cells that can have changed are marked as dirty and recomputed:
+ *
+ * - On a block update, the cell itself, its neighbors, and the cells whose line of sight
+ *   from the bot's eyes passes near it.
+ * - On a move w/in the voxel, the cells near the bot's hitbox and those whose faces are
+ *   close enough to the reach boundary to have crossed it. (The line of sight to the
+ *   other cells is that of when they were last computed, which is from the same voxel;
+ *   placing re-validates the chosen cell anyway.)
+ */
+export class PlaceableCoordsIndex {
+  private bot: Bot;
+  private side: number = 2 * PLACEABLE_COORDS_RADIUS + 1;
+  private cellStates: Uint8Array = new Uint8Array(this.side ** 3);
+  private lastBotPosition?: Vec3; // The bot position as of the last query
+  private origin?: Vec3; // The bot's voxel (i.e., floored position), at the cube's center
+  private pendingBlockUpdates: Vec3[] = [];
+  private sortedPlaceableCoords?: Vec3[];
+
+  constructor(bot: Bot) {
+    this.bot = bot;
+    this.bot.on("blockUpdate", (oldBlock: PBlock | null, newBlock: PBlock) => {
+      const position = newBlock?.position ?? oldBlock?.position;
+      if (position) {
+        this.handleBlockUpdate(position);
+      }
+    });
+    this.bot.on("chunkColumnLoad", (point: Vec3) => {
+      // Recompute (lazily) if the chunk overlaps the cube
+      const maxOffset = PLACEABLE_COORDS_RADIUS + 1;
+      if (
+        this.origin &&
+        point.x + 15 >= this.origin.x - maxOffset &&
+        point.x <= this.origin.x + maxOffset &&
+        point.z + 15 >= this.origin.z - maxOffset &&
+        point.z <= this.origin.z + maxOffset
+      ) {
+        this.invalidate();
+      }
+    });
   }
 
-  const placeableCoords: Vec3[] = [];
-  const botPosition = bot.entity.position.floored();
-  const radius = MAX_PLACEMENT_REACH + 1;
-  // Iterate through all blocks within the radius
-  for (let x = -radius; x <= radius; x++) {
-    for (let y = -radius; y <= radius; y++) {
-      for (let z = -radius; z <= radius; z++) {
-        if (isTooSmallAnOffsetToBeWorthChecking(x, y, z)) {
-          continue;
+  private invalidate(): void {
+    this.cellStates.fill(CellState.DIRTY);
+    this.pendingBlockUpdates = [];
+    this.sortedPlaceableCoords = undefined;
+  }
+
+  private handleBlockUpdate(position: Vec3): void {
+    if (!this.origin) {
+      return;
+    }
+    // Blocks just outside the cube can still be reference blocks for cells inside it
+    const maxOffset = PLACEABLE_COORDS_RADIUS + 1;
+    if (
+      Math.abs(position.x - this.origin.x) > maxOffset ||
+      Math.abs(position.y - this.origin.y) > maxOffset ||
+      Math.abs(position.z - this.origin.z) > maxOffset
+    ) {
+      return;
+    }
+    this.sortedPlaceableCoords = undefined;
+    if (this.pendingBlockUpdates.length >= MAX_PENDING_BLOCK_UPDATES) {
+      this.invalidate();
+    } else {
+      this.pendingBlockUpdates.push(position.clone());
+    }
+  }
+
+  private processPendingBlockUpdates(): void {
+    assert(this.origin && this.lastBotPosition);
+    const r = PLACEABLE_COORDS_RADIUS;
+    const eyeX = this.lastBotPosition.x;
+    const eyeY = this.lastBotPosition.y + BOT_EYE_HEIGHT;
+    const eyeZ = this.lastBotPosition.z;
+    for (const position of this.pendingBlockUpdates) {
+      const px = position.x + 0.5;
+      const py = position.y + 0.5;
+      const pz = position.z + 0.5;
+      let idx = 0;
+      for (let x = -r; x <= r; x++) {
+        for (let y = -r; y <= r; y++) {
+          for (let z = -r; z <= r; z++, idx++) {
+            if (this.cellStates[idx] === CellState.DIRTY) continue;
+            const cx = this.origin.x + x;
+            const cy = this.origin.y + y;
+            const cz = this.origin.z + z;
+            const manhattanDistance =
+              Math.abs(position.x - cx) +
+              Math.abs(position.y - cy) +
+              Math.abs(position.z - cz);
+            // Distance from the updated voxel's center to the eye-to-cell-center segment
+            const dx = cx + 0.5 - eyeX;
+            const dy = cy + 0.5 - eyeY;
+            const dz = cz + 0.5 - eyeZ;
+            const t = Math.max(
+              0,
+              Math.min(
+                1,
+                ((px - eyeX) * dx + (py - eyeY) * dy + (pz - eyeZ) * dz) /
+                  (dx * dx + dy * dy + dz * dz),
+              ),
+            );
+            const distanceToSegment = Math.hypot(
+              eyeX + t * dx - px,
+              eyeY + t * dy - py,
+              eyeZ + t * dz - pz,
+            );
+            if (
+              manhattanDistance <= 1 ||
+              distanceToSegment <= RAYCAST_OCCLUSION_DISTANCE
+            ) {
+              this.cellStates[idx] = CellState.DIRTY;
+            }
+          }
         }
-        const coords = botPosition.offset(x, y, z);
-        // Check if the coordinates are placeable
-        const refernceBlockAndFaceVector =
-          getViableReferenceBlockAndFaceVectorIfCoordsArePlaceable(bot, coords);
-        if (refernceBlockAndFaceVector !== undefined) {
-          placeableCoords.push(coords);
+      }
+    }
+    this.pendingBlockUpdates = [];
+  }
+
+  /**
+   * Marks as dirty the cells whose placeability can have changed w/ the bot moving from
+   * `lastBotPosition` to `botPosition` (w/in the same voxel).
+   */
+  private markPositionSensitiveCellsDirty(botPosition: Vec3): void {
+    assert(this.origin && this.lastBotPosition);
+    const r = PLACEABLE_COORDS_RADIUS;
+    // Every face center's distance to the bot changed by at most this much, so only faces
+    // that are now w/in it of the reach boundary can have crossed it
+    const maxReachChange = botPosition.distanceTo(this.lastBotPosition);
+    const maxCenterDistanceChange =
+      maxReachChange + CELL_CENTER_TO_FACE_CENTER_DISTANCE;
+    let idx = 0;
+    for (let x = -r; x <= r; x++) {
+      for (let y = -r; y <= r; y++) {
+        for (let z = -r; z <= r; z++, idx++) {
+          if (this.cellStates[idx] === CellState.DIRTY) continue;
+          const centerDistance = Math.hypot(
+            this.origin.x + x + 0.5 - botPosition.x,
+            this.origin.y + y + 0.5 - botPosition.y,
+            this.origin.z + z + 0.5 - botPosition.z,
+          );
+          // (The bot's hitbox, before and after, is w/in the cells at x and z offsets of
+          // -1 to 1, and y offsets of 0 to 2)
+          const isNearHitbox =
+            Math.abs(x) <= 1 && y >= 0 && y <= 2 && Math.abs(z) <= 1;
+          if (
+            isNearHitbox ||
+            Math.abs(centerDistance - MAX_PLACEMENT_REACH) <=
+              maxCenterDistanceChange
+          ) {
+            this.cellStates[idx] = CellState.DIRTY;
+          }
+        }
+      }
+    }
+    // (Hitbox cells are always dirtied, so the sorted list always needs recomputing)
+    this.sortedPlaceableCoords = undefined;
+  }
+
+  /**
+   * Gets all placeable coordinates around the bot, sorted by distance (closest first).
+   */
+  public getAll(): Vec3[] {
+    const botPosition = this.bot.entity.position;
+    const botVoxel = botPosition.floored();
+    if (!this.origin || !this.origin.equals(botVoxel)) {
+      this.origin = botVoxel;
+      this.invalidate();
+    } else if (!this.lastBotPosition!.equals(botPosition)) {
+      this.markPositionSensitiveCellsDirty(botPosition);
+    }
+    this.lastBotPosition = botPosition.clone();
+    if (!this.sortedPlaceableCoords) {
+      this.processPendingBlockUpdates();
+      this.sortedPlaceableCoords = this.recomputeDirtyCells();
+    }
+    return [...this.sortedPlaceableCoords];
+  }
+
+  private recomputeDirtyCells(): Vec3[] {
+    assert(this.origin);
+    const r = PLACEABLE_COORDS_RADIUS;
+    const placeableCoords: Vec3[] = [];
+    let idx = 0;
+    for (let x = -r; x <= r; x++) {
+      for (let y = -r; y <= r; y++) {
+        for (let z = -r; z <= r; z++, idx++) {
+          if (this.cellStates[idx] === CellState.DIRTY) {
+            const isPlaceable =
+              !isTooSmallAnOffsetToBeWorthChecking(x, y, z) &&
+              getViableReferenceBlockAndFaceVectorIfCoordsArePlaceable(
+                this.bot,
+                this.origin.offset(x, y, z),
+              ) !== undefined;
+            this.cellStates[idx] = isPlaceable
+              ? CellState.PLACEABLE
+              : CellState.NOT_PLACEABLE;
+          }
+          if (this.cellStates[idx] === CellState.PLACEABLE) {
+            placeableCoords.push(this.origin.offset(x, y, z));
+          }
         }
       }
     }
+    // Sort coordinates by distance to bot (closest first)
+    const origin = this.origin;
+    placeableCoords.sort((a, b) => {
+      const distanceA = origin.distanceTo(a);
+      const distanceB = origin.distanceTo(b);
+      return distanceA - distanceB;
+    });
+    return placeableCoords;
   }
-  // Sort coordinates by distance to bot (closest first)
-  placeableCoords.sort((a, b) => {
-    const distanceA = botPosition.distanceTo(a);
-    const distanceB = botPosition.distanceTo(b);
-    return distanceA - distanceB;
-  });
-  return placeableCoords;
+}
+
+const PLACEABLE_COORDS_INDEXES = new WeakMap<Bot, PlaceableCoordsIndex>();
+
+/**
+ * Gets the bot's `PlaceableCoordsIndex`, creating it on first use.
+ */
+export function getPlaceableCoordsIndex(bot: Bot): PlaceableCoordsIndex {
+  let index = PLACEABLE_COORDS_INDEXES.get(bot);
+  if (!index) {
+    index = new PlaceableCoordsIndex(bot);
+    PLACEABLE_COORDS_INDEXES.set(bot, index);
+  }
+  return index;
+}
+
+export function getAllPlaceableCoords(bot: Bot): Vec3[] {
+  return getPlaceableCoordsIndex(bot).getAll();
 }
 
 export function getPlaceableCoords(bot: Bot): Vec3 | undefined {
@@ -0,0 +1,168 @@
+import assert from "assert";
+import * as fs from "fs";
+import * as inspector from "inspector";
+import * as path from "path";
+import { getLogger } from "./logging";
+
+const logger = getLogger("profiling");
+
+function post(
+  session: inspector.Session,
+  method: string,
+  params: object = {},
+): Promise<any> {
+  return new Promise((resolve, reject) => {
+    session.post(method, params, (error, result) =>
+      error ? reject(error) : resolve(result),
+    );
+  });
+}
+
+type SavedProfile = {
+  durationMS: number;
+  filePath: string;
+};
+
+/**
+ * Captures (in-process, w/ the Node inspector API) a CPU profile of each skill invocation
+ * and, whenever the heap grows past a threshold, a heap snapshot.
+ *
+ * Files are named `<invocationID>-<skillName>.cpuprofile` (open w/ Chrome DevTools or
+ * speedscope) and `<invocationID>-<skillName>.heapsnapshot`, so that they can be matched
+ * to the invocations (and to the Python process's profiles of them).
+ */
+export class SkillProfiler {
+  private session: inspector.Session;
+  private outputDir: string;
+  private nSlowest?: number;
+  private heapSnapshotThresholdBytes?: number;
+  private isProfilerEnabled: boolean = false;
+  private currentProfile?: { fileStem: string; startTime: number };
+  // Saved CPU profiles, slowest first (only tracked if only the N slowest are kept)
+  private slowestProfiles: SavedProfile[] = [];
+  // Whether the heap was past the threshold at the last check (so that we only take one
+  // snapshot per breach)
+  private isHeapPastThreshold: boolean = false;
+
+  constructor(
+    outputDir: string,
+    nSlowest?: number,
+    heapSnapshotThresholdMB?: number,
+  ) {
+    assert(
+      nSlowest === undefined || nSlowest >= 1,
+      "The number of slowest profiles to keep must be at least 1",
+    );
+    fs.mkdirSync(outputDir, { recursive: true });
+    this.outputDir = outputDir;
+    this.nSlowest = nSlowest;
+    if (heapSnapshotThresholdMB !== undefined) {
+      this.heapSnapshotThresholdBytes = heapSnapshotThresholdMB * 1024 * 1024;
+    }
+    this.session = new inspector.Session();
+    this.session.connect();
+  }
+
+  /**
+   * Starts profiling a skill invocation.
+   */
+  public async start(skillName: string, invocationID?: number): Promise<void> {
+    const fileStem = `${invocationID ?? Date.now()}-${skillName}`;
+    try {
+      if (!this.isProfilerEnabled) {
+        await post(this.session, "Profiler.enable");
+        this.isProfilerEnabled = true;
+      }
+      await post(this.session, "Profiler.start");
+      this.currentProfile = { fileStem, startTime: Date.now() };
+    } catch (error) {
+      logger.error(`Failed to start profiling ${fileStem}`, error);
+    }
+  }
+
+  /**
+   * Stops profiling the current skill invocation (if any), saving its CPU profile (unless
+   * it isn't one of the N slowest) and taking a heap snapshot if the heap is past the
+   * threshold.
+   */
+  public async stop(): Promise<void> {
+    if (!this.currentProfile) {
+      return;
+    }
+    const { fileStem, startTime } = this.currentProfile;
+    this.currentProfile = undefined;
+    try {
+      const { profile } = await post(this.session, "Profiler.stop");
+      this.saveProfile(fileStem, Date.now() - startTime, profile);
+      await this.checkHeap(fileStem);
+    } catch (error) {
+      logger.error(`Failed to save the profiles of ${fileStem}`, error);
+    }
+  }
+
+  private saveProfile(
+    fileStem: string,
+    durationMS: number,
+    profile: object,
+  ): void {
+    const filePath = path.join(this.outputDir, `${fileStem}.cpuprofile`);
+    if (this.nSlowest === undefined) {
+      fs.writeFileSync(filePath, JSON.stringify(profile));
+      return;
+    }
+    const nSaved = this.slowestProfiles.length;
+    if (
+      nSaved >= this.nSlowest &&
+      durationMS <= this.slowestProfiles[nSaved - 1].durationMS
+    ) {
+      return; // Not one of the N slowest
+    }
+    fs.writeFileSync(filePath, JSON.stringify(profile));
+    const insertionIdx = this.slowestProfiles.findIndex(
+      (saved) => saved.durationMS < durationMS,
+    );
+    this.slowestProfiles.splice(
+      insertionIdx === -1 ? nSaved : insertionIdx,
+      0,
+      { durationMS, filePath },
+    );
+    for (const evicted of this.slowestProfiles.splice(this.nSlowest)) {
+      fs.rmSync(evicted.filePath, { force: true });
+    }
+  }
+
+  private async checkHeap(fileStem: string): Promise<void> {
+    if (this.heapSnapshotThresholdBytes === undefined) {
+      return;
+    }
+    const heapUsed = process.memoryUsage().heapUsed;
+    const wasHeapPastThreshold = this.isHeapPastThreshold;
+    this.isHeapPastThreshold = heapUsed > this.heapSnapshotThresholdBytes;
+    if (this.isHeapPastThreshold && !wasHeapPastThreshold) {
+      const filePath = path.join(this.outputDir, `${fileStem}.heapsnapshot`);
+      logger.info(
+        () =>
+          `Heap (${(heapUsed / 1024 / 1024).toFixed(1)} MB) is past the threshold, ` +
+          `taking a heap snapshot: ${filePath}`,
+      );
+      await this.takeHeapSnapshot(filePath);
+    }
+  }
+
+  private async takeHeapSnapshot(filePath: string): Promise<void> {
+    const fd = fs.openSync(filePath, "w");
+    const writeChunk = (message: { params: { chunk: string } }) => {
+      fs.writeSync(fd, message.params.chunk);
+    };
+    this.session.on("HeapProfiler.addHeapSnapshotChunk", writeChunk);
+    try {
+      await post(this.session, "HeapProfiler.takeHeapSnapshot");
+    } finally {
+      this.session.removeListener(
+        "HeapProfiler.addHeapSnapshotChunk",
+        writeChunk,
+      );
+      fs.closeSync(fd);
+    }
+  }
+}
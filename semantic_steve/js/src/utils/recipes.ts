@@ -0,0 +1,205 @@
+import { Bot } from "mineflayer";
+import { IndexedData } from "minecraft-data";
+import type { Recipe } from "prismarine-recipe";
+
+// How deep the planner is allowed to recurse into intermediate ingredients
+const MAX_CRAFTING_PLAN_DEPTH = 8;
+
+/**
+ * One `bot.craft` call of a crafting plan.
+ */
+export type CraftingStep = {
+  recipe: Recipe;
+  timesToCraft: number;
+};
+
+/**
+ * A sequence of crafting steps (ingredients before the items they are used in) that ends
+ * with the step that crafts the requested item.
+ */
+export type CraftingPlan = {
+  steps: CraftingStep[];
+  quantityToCraft: number; // Of the requested item (can exceed the requested quantity)
+};
+
+type PlanningState = {
+  inventory: Map<number, number>; // Item ID -> count still available for the plan
+  steps: CraftingStep[];
+  hasCraftingTable: boolean;
+  itemIDsBeingPlanned: Set<number>;
+};
+
+/**
+ * Item -> recipes -> ingredients graph for a given `bot.registry`, from which crafting
+ * plans (w/ all of the intermediate items) can be derived.
+ */
+export class RecipeGraph {
+  private RecipeClass: any;
+  private craftingTableID?: number;
+  private itemIDsToRecipes: Map<number, Recipe[]> = new Map();
+  private recipesToIngredients: WeakMap<Recipe, [number, number][]> =
+    new WeakMap();
+
+  constructor(registry: IndexedData) {
+    this.RecipeClass = require("prismarine-recipe")(registry).Recipe;
+    this.craftingTableID = registry.itemsByName["crafting_table"]?.id;
+  }
+
+  /**
+   * All recipes that produce the item, with those not requiring a crafting table first.
+   */
+  public getRecipes(itemID: number): Recipe[] {
+    let recipes = this.itemIDsToRecipes.get(itemID);
+    if (!recipes) {
+      const found: Recipe[] = this.RecipeClass.find(itemID, null);
+      recipes = [
+        ...found.filter((r) => !r.requiresTable),
+        ...found.filter((r) => r.requiresTable),
+      ];
+      this.itemIDsToRecipes.set(itemID, recipes);
+    }
+    return recipes;
+  }
+
+  /**
+   * The (item ID, count) pairs consumed by one craft of the recipe.
+   */
+  public getIngredients(recipe: Recipe): [number, number][] {
+    let ingredients = this.recipesToIngredients.get(recipe);
+    if (!ingredients) {
+      ingredients = recipe.delta
+        .filter((d) => d.count < 0 && d.id !== recipe.result.id)
+        .map((d) => [d.id, -d.count]);
+      this.recipesToIngredients.set(recipe, ingredients);
+    }
+    return ingredients;
+  }
+
+  /**
+   * Plans how to craft a quantity of an item from the given inventory, crafting any
+   * intermediate items (including a crafting table, if one is needed and unavailable).
+   *
+   * @param itemID - The item to craft.
+   * @param quantity - The (minimum) quantity of the item to craft.
+   * @param inventory - Map of item IDs to their counts in the inventory.
+   * @param hasCraftingTable - Whether a crafting table is already available.
+   * @returns The plan, or undefined if the inventory doesn't suffice.
+   */
+  public planCrafting(
+    itemID: number,
+    quantity: number,
+    inventory: Map<number, number>,
+    hasCraftingTable: boolean,
+  ): CraftingPlan | undefined {
+    const state: PlanningState = {
+      inventory: new Map(inventory),
+      steps: [],
+      hasCraftingTable,
+      itemIDsBeingPlanned: new Set(),
+    };
+    // NOTE: The requested item is always crafted, even if some are already in inventory
+    if (!this.planRecipeFor(itemID, quantity, state, 0)) {
+      return undefined;
+    }
+    const lastStep = state.steps[state.steps.length - 1];
+    return {
+      steps: state.steps,
+      quantityToCraft: lastStep.timesToCraft * lastStep.recipe.result.count,
+    };
+  }
+
+  /**
+   * Reserves a quantity of an item for the plan, taking it from the inventory and
+   * crafting the shortfall.
+   */
+  private planItem(
+    itemID: number,
+    quantity: number,
+    state: PlanningState,
+    depth: number,
+  ): boolean {
+    const available = state.inventory.get(itemID) ?? 0;
+    if (available >= quantity) {
+      state.inventory.set(itemID, available - quantity);
+      return true;
+    }
+    if (
+      depth >= MAX_CRAFTING_PLAN_DEPTH ||
+      state.itemIDsBeingPlanned.has(itemID) // Avoids cyclic recipes
+    ) {
+      return false;
+    }
+    state.inventory.set(itemID, 0);
+    if (this.planRecipeFor(itemID, quantity - available, state, depth)) {
+      return true;
+    }
+    state.inventory.set(itemID, available);
+    return false;
+  }
+
+  /**
+   * Adds the steps for crafting a quantity of an item to the plan, trying each recipe
+   * until one works out (and rolling back the state of the ones that don't).
+   */
+  private planRecipeFor(
+    itemID: number,
+    quantity: number,
+    state: PlanningState,
+    depth: number,
+  ): boolean {
+    state.itemIDsBeingPlanned.add(itemID);
+    for (const recipe of this.getRecipes(itemID)) {
+      const inventoryBefore = new Map(state.inventory);
+      const nStepsBefore = state.steps.length;
+      const hadCraftingTableBefore = state.hasCraftingTable;
+
+      const timesToCraft = Math.ceil(quantity / recipe.result.count);
+      let isFeasible = true;
+      if (recipe.requiresTable && !state.hasCraftingTable) {
+        isFeasible =
+          this.craftingTableID !== undefined &&
+          this.planItem(this.craftingTableID, 1, state, depth + 1);
+        state.hasCraftingTable = isFeasible;
+      }
+      for (const [ingredientID, count] of this.getIngredients(recipe)) {
+        if (!isFeasible) break;
+        isFeasible = this.planItem(
+          ingredientID,
+          count * timesToCraft,
+          state,
+          depth + 1,
+        );
+      }
+
+      if (isFeasible) {
+        state.steps.push({ recipe, timesToCraft });
+        const surplus = timesToCraft * recipe.result.count - quantity;
+        state.inventory.set(
+          itemID,
+          (state.inventory.get(itemID) ?? 0) + surplus,
+        );
+        state.itemIDsBeingPlanned.delete(itemID);
+        return true;
+      }
+      state.inventory = inventoryBefore;
+      state.steps.length = nStepsBefore;
+      state.hasCraftingTable = hadCraftingTableBefore;
+    }
+    state.itemIDsBeingPlanned.delete(itemID);
+    return false;
+  }
+}
+
+const RECIPE_GRAPHS = new WeakMap<IndexedData, RecipeGraph>();
+
+/**
+ * Gets the `RecipeGraph` for the bot's registry, building it on first use.
+ */
+export function getRecipeGraph(bot: Bot): RecipeGraph {
+  let graph = RECIPE_GRAPHS.get(bot.registry);
+  if (!graph) {
+    graph = new RecipeGraph(bot.registry);
+    RECIPE_GRAPHS.set(bot.registry, graph);
+  }
+  return graph;
+}
@@ -0,0 +1,44 @@
+import * as fs from "fs";
+
+// What we send over ZMQ in place of a payload that was written to shared memory
+export type SharedMemoryNotification = {
+  shmOffset: number;
+  shmLength: number;
+};
+
+/**
+ * Ring buffer of payloads to Python in a file that the Python process memory-maps (and
+ * that it creates, sized, on tmpfs where available).
+ *
+ * Payloads are written back to back, wrapping around to the start when one doesn't fit
+ * at the end. Since Python reads each payload before its next skill invocation (and we
+ * send at most one payload per invocation), unread payloads are never overwritten.
+ */
+export class SharedMemoryRing {
+  private fd: number;
+  private size: number;
+  private cursor: number = 0;
+
+  constructor(path: string) {
+    this.fd = fs.openSync(path, "r+");
+    this.size = fs.fstatSync(this.fd).size;
+  }
+
+  /**
+   * Writes a payload into the ring.
+   *
+   * @returns Where the payload was written, or undefined if it can't fit.
+   */
+  public write(payload: Buffer): SharedMemoryNotification | undefined {
+    if (payload.length > this.size) {
+      return undefined;
+    }
+    if (this.cursor + payload.length > this.size) {
+      this.cursor = 0;
+    }
+    fs.writeSync(this.fd, payload, 0, payload.length, this.cursor);
+    const notification = { shmOffset: this.cursor, shmLength: payload.length };
+    this.cursor += payload.length;
+    return notification;
+  }
+}
@@ -1,4 +1,11 @@
-import assert from "assert";
+import * as fs from "fs";
+import * as path from "path";
+import { Bot } from "mineflayer";
+import { IndexedData } from "minecraft-data";
+import { SEMANTIC_STEVE_CACHE_DIR } from "../constants";
+import { getLogger } from "./logging";
+
+const logger = getLogger("smelting");
 
 // =========================================================================================
 // NOTE: The following utils were generated by Claude on Apr 23, 2025 using the tablea from
@@ -10,20 +17,20 @@ import assert from "assert";
  * @param itemName - The mineflayer-style item name (e.g., "iron_ore")
  * @returns The name of the product, or undefined if the item is not smeltable
  */
-export function getSmeltingProductName(itemName: string): string | undefined {
+function getSmeltingProductName(itemName: string): string | undefined {
   // Convert to lowercase for case-insensitive matching
   const item = itemName.toLowerCase();
 
   // Food items
   if (item === "potato") return "baked_potato";
   if (item === "kelp") return "dried_kelp";
-  if (item === "raw_beef") return "cooked_beef";
-  if (item === "raw_porkchop") return "cooked_porkchop";
-  if (item === "raw_mutton") return "cooked_mutton";
-  if (item === "raw_chicken") return "cooked_chicken";
-  if (item === "raw_rabbit") return "cooked_rabbit";
-  if (item === "raw_cod") return "cooked_cod";
-  if (item === "raw_salmon") return "cooked_salmon";
+  if (item === "raw_beef" || item === "beef") return "cooked_beef";
+  if (item === "raw_porkchop" || item === "porkchop") return "cooked_porkchop";
+  if (item === "raw_mutton" || item === "mutton") return "cooked_mutton";
+  if (item === "raw_chicken" || item === "chicken") return "cooked_chicken";
+  if (item === "raw_rabbit" || item === "rabbit") return "cooked_rabbit";
+  if (item === "raw_cod" || item === "cod") return "cooked_cod";
+  if (item === "raw_salmon" || item === "salmon") return "cooked_salmon";
 
   // Raw materials to ingots
   if (item === "raw_iron") return "iron_ingot";
@@ -149,52 +156,44 @@ export function getSmeltingProductName(itemName: string): string | undefined {
 }
 
 /**
- * Determines if a given item can be used as fuel in a furnace
+ * Gets the number of ticks a given item burns for when used as fuel in a furnace
  * @param itemName - The mineflayer-style item name (e.g., "birch_planks")
- * @returns Whether the item can be used as fuel
+ * @returns The burn time in ticks, or undefined if the item cannot be used as fuel
  */
-export function isFuel(itemName: string): boolean {
+function getFuelBurnTimeTicks(itemName: string): number | undefined {
   // Convert to lowercase for case-insensitive matching
   const item = itemName.toLowerCase();
 
   // Special high-burn items
-  if (
-    item === "lava_bucket" ||
-    item === "coal_block" ||
-    item === "dried_kelp_block" ||
-    item === "blaze_rod" ||
-    item === "coal" ||
-    item === "charcoal"
-  ) {
-    return true;
-  }
+  if (item === "lava_bucket") return 20000;
+  if (item === "coal_block") return 16000;
+  if (item === "dried_kelp_block") return 4000;
+  if (item === "blaze_rod") return 2400;
+  if (item === "coal" || item === "charcoal") return 1600;
 
   // Boats (any type)
-  if (item.includes("_boat")) {
-    return true;
-  }
+  if (item.includes("_boat") || item.includes("_raft")) return 1200;
 
   // Bamboo items
+  if (item === "bamboo" || item === "scaffolding") return 50;
+  if (item === "bamboo_mosaic_slab" || item === "bamboo_slab") return 150;
   if (
     item === "bamboo_mosaic" ||
-    item === "bamboo_mosaic_slab" ||
     item === "bamboo_mosaic_stairs" ||
     item === "block_of_bamboo" ||
+    item === "bamboo_block" ||
     item === "block_of_stripped_bamboo" ||
+    item === "stripped_bamboo_block" ||
     item.startsWith("bamboo_") // Catches other bamboo items like planks, stairs, signs, etc.
   ) {
-    return true;
+    return 300;
   }
 
   // Bee-related
-  if (item === "bee_nest" || item === "beehive") {
-    return true;
-  }
+  if (item === "bee_nest" || item === "beehive") return 300;
 
   // Bookshelf
-  if (item === "chiseled_bookshelf") {
-    return true;
-  }
+  if (item === "chiseled_bookshelf") return 300;
 
   // Wood types
   const woodTypes = [
@@ -208,34 +207,36 @@ export function isFuel(itemName: string): boolean {
     "cherry",
   ];
 
-  // Wood categories
-  const woodCategories = [
-    "_log",
-    "_wood",
-    "_planks",
-    "_slab",
-    "_stairs",
-    "_sign",
-    "_button",
-    "_pressure_plate",
-    "_trapdoor",
-    "_door",
-    "_fence_gate",
-    "_fence",
+  // Wood categories (most specific first) and their burn times
+  const woodCategoriesToBurnTimes: [string, number][] = [
+    ["_hanging_sign", 800],
+    ["_log", 300],
+    ["_wood", 300],
+    ["_planks", 300],
+    ["_slab", 150],
+    ["_stairs", 300],
+    ["_sign", 200],
+    ["_button", 100],
+    ["_pressure_plate", 300],
+    ["_trapdoor", 300],
+    ["_door", 200],
+    ["_fence_gate", 300],
+    ["_fence", 300],
+    ["_sapling", 100],
   ];
 
   // Check if the item contains both a wood type and a wood category
   for (const type of woodTypes) {
     if (item.includes(type)) {
-      for (const category of woodCategories) {
+      for (const [category, burnTime] of woodCategoriesToBurnTimes) {
         if (item.includes(category)) {
-          return true;
+          return burnTime;
         }
       }
 
       // Check for stripped logs/wood
       if (item.includes("stripped_" + type)) {
-        return true;
+        return 300;
       }
     }
   }
@@ -252,21 +253,24 @@ export function isFuel(itemName: string): boolean {
     item === "lectern" ||
     item === "composter" ||
     item === "barrel" ||
-    item === "bowl" ||
+    item === "fishing_rod" ||
+    item === "ladder" ||
+    item.endsWith("_banner")
+  ) {
+    return 300;
+  }
+  if (
     item === "wooden_axe" ||
     item === "wooden_hoe" ||
     item === "wooden_pickaxe" ||
     item === "wooden_shovel" ||
     item === "wooden_sword" ||
-    item === "fishing_rod" ||
     item === "carrot_on_a_stick" ||
-    item === "warped_fungus_on_a_stick" ||
-    item === "stick" ||
-    item === "ladder" ||
-    item.endsWith("_banner")
+    item === "warped_fungus_on_a_stick"
   ) {
-    return true;
+    return 200;
   }
+  if (item === "bowl" || item === "stick") return 100;
 
   // Wool and carpet
   const colors = [
@@ -289,16 +293,171 @@ export function isFuel(itemName: string): boolean {
   ];
 
   for (const color of colors) {
-    if (item === `${color}_wool` || item === `${color}_carpet`) {
-      return true;
-    }
+    if (item === `${color}_wool`) return 100;
+    if (item === `${color}_carpet`) return 67;
   }
 
   // Handle uncolored wool and carpet
-  if (item === "wool" || item === "carpet") {
-    return true;
-  }
+  if (item === "wool") return 100;
+  if (item === "carpet") return 67;
 
   // If none of the above conditions match, it's not a fuel
-  return false;
+  return undefined;
+}
+
+// =========================================
+// Per-version, precomputed smelting index
+// =========================================
+
+type SmeltingIndexJSON = {
+  version: string;
+  inputsToProducts: { [key: string]: string };
+  fuelsToBurnTimeTicks: { [key: string]: number };
+};
+
+/**
+ * O(1) lookups of smelting products, fuel burn times, and (reversely) the inputs that can
+ * be smelted into a given product, for the items that exist in one game version.
+ */
+export class SmeltingIndex {
+  public readonly version: string;
+  private inputsToProducts: Map<string, string>;
+  private fuelsToBurnTimeTicks: Map<string, number>;
+  private productsToInputs: Map<string, string[]>;
+
+  constructor(
+    version: string,
+    inputsToProducts: Map<string, string>,
+    fuelsToBurnTimeTicks: Map<string, number>,
+  ) {
+    this.version = version;
+    this.inputsToProducts = inputsToProducts;
+    this.fuelsToBurnTimeTicks = fuelsToBurnTimeTicks;
+    this.productsToInputs = new Map();
+    for (const [input, product] of inputsToProducts) {
+      if (!this.productsToInputs.has(product)) {
+        this.productsToInputs.set(product, []);
+      }
+      this.productsToInputs.get(product)!.push(input);
+    }
+  }
+
+  /**
+   * Builds the index by evaluating the smelting/fuel rules (once) against every item in
+   * the registry, keeping only the entries whose items exist in this version.
+   */
+  public static fromRegistry(registry: IndexedData): SmeltingIndex {
+    const inputsToProducts = new Map<string, string>();
+    const fuelsToBurnTimeTicks = new Map<string, number>();
+    for (const item of Object.values(registry.items)) {
+      const productName = getSmeltingProductName(item.name);
+      if (productName && productName in registry.itemsByName) {
+        inputsToProducts.set(item.name, productName);
+      }
+      const burnTimeTicks = getFuelBurnTimeTicks(item.name);
+      if (burnTimeTicks !== undefined) {
+        fuelsToBurnTimeTicks.set(item.name, burnTimeTicks);
+      }
+    }
+    return new SmeltingIndex(
+      registry.version.minecraftVersion,
+      inputsToProducts,
+      fuelsToBurnTimeTicks,
+    );
+  }
+
+  public static fromJSON(json: SmeltingIndexJSON): SmeltingIndex {
+    return new SmeltingIndex(
+      json.version,
+      new Map(Object.entries(json.inputsToProducts)),
+      new Map(Object.entries(json.fuelsToBurnTimeTicks)),
+    );
+  }
+
+  public toJSON(): SmeltingIndexJSON {
+    return {
+      version: this.version,
+      inputsToProducts: Object.fromEntries(this.inputsToProducts),
+      fuelsToBurnTimeTicks: Object.fromEntries(this.fuelsToBurnTimeTicks),
+    };
+  }
+
+  /**
+   * Gets the smelting product name for a given item name, or undefined if the item is
+   * not smeltable.
+   */
+  public getProductName(itemName: string): string | undefined {
+    return this.inputsToProducts.get(itemName);
+  }
+
+  /**
+   * Gets the names of all items that can be smelted into the given product.
+   */
+  public getInputNames(productName: string): string[] {
+    return this.productsToInputs.get(productName) ?? [];
+  }
+
+  /**
+   * Gets the number of ticks an item burns for as fuel, or undefined if it's not a fuel.
+   */
+  public getBurnTimeTicks(itemName: string): number | undefined {
+    return this.fuelsToBurnTimeTicks.get(itemName);
+  }
+
+  public isFuel(itemName: string): boolean {
+    return this.fuelsToBurnTimeTicks.has(itemName);
+  }
+}
+
+// Bump this whenever the rules above change so that stale on-disk caches are ignored
+const SMELTING_RULES_VERSION = 1;
+
+const SMELTING_INDEXES = new WeakMap<IndexedData, SmeltingIndex>();
+
+function getSmeltingIndexCachePath(version: string): string {
+  const fileName = `smelting-index-v${SMELTING_RULES_VERSION}-${version}.json`;
+  return path.join(SEMANTIC_STEVE_CACHE_DIR, fileName);
+}
+
+function loadSmeltingIndexFromDisk(version: string): SmeltingIndex | undefined {
+  try {
+    const json = JSON.parse(
+      fs.readFileSync(getSmeltingIndexCachePath(version), "utf-8"),
+    );
+    if (json.version === version) {
+      return SmeltingIndex.fromJSON(json);
+    }
+  } catch (err) {
+    // No (valid) cache file for this version yet
+  }
+}
+
+function saveSmeltingIndexToDisk(index: SmeltingIndex): void {
+  try {
+    fs.mkdirSync(SEMANTIC_STEVE_CACHE_DIR, { recursive: true });
+    fs.writeFileSync(
+      getSmeltingIndexCachePath(index.version),
+      JSON.stringify(index),
+    );
+  } catch (err) {
+    logger.warning("Failed to cache smelting index to disk", err);
+  }
+}
+
+/**
+ * Gets the `SmeltingIndex` for the bot's registry, loading it from the on-disk cache for
+ * the game version (or building and caching it) on first use.
+ */
+export function getSmeltingIndex(bot: Bot): SmeltingIndex {
+  let index = SMELTING_INDEXES.get(bot.registry);
+  if (!index) {
+    const version = bot.registry.version.minecraftVersion;
+    index = loadSmeltingIndexFromDisk(version);
+    if (!index) {
+      index = SmeltingIndex.fromRegistry(bot.registry);
+      saveSmeltingIndexToDisk(index);
+    }
+    SMELTING_INDEXES.set(bot.registry, index);
+  }
+  return index;
 }
@@ -19,3 +19,14 @@ PATH_TO_JS_DIR = os.path.join(_PATH_TO_THIS_FILE_DIR, "../", "js")
 PATH_TO_SKILLS_DIR = os.path.join(PATH_TO_JS_DIR, "src", "skill")
 DEFAULT_PATH_TO_SCREENSHOT_DIR = os.path.join(PATH_TO_JS_DIR, "../", "screenshots/")
 SCREENSHORT_DIR_ENV_VAR_NAME = "SEMANTIC_STEVE_SCREENSHOT_DIR"
+LOG_LEVEL_ENV_VAR_NAME = "SEMANTIC_STEVE_LOG_LEVEL"
+JS_LOGGER_NAME = "semantic_steve.js"
+ZMQ_ENDPOINT_ENV_VAR_NAME = "ZMQ_ENDPOINT"
+SHARED_MEMORY_PATH_ENV_VAR_NAME = "SHARED_MEMORY_PATH"
+SHARED_MEMORY_DIR = "/dev/shm"  # tmpfs (where available)
+SHARED_MEMORY_RING_BYTES = 16 * 1024 * 1024
+WORLD_MEMORY_DIR_ENV_VAR_NAME = "WORLD_MEMORY_DIR"
+WORLD_MEMORY_MMAP_SIZE_BYTES = 256 * 1024 * 1024
+PROFILE_DIR_ENV_VAR_NAME = "PROFILE_DIR"
+PROFILE_N_SLOWEST_ENV_VAR_NAME = "PROFILE_N_SLOWEST"
+HEAP_SNAPSHOT_THRESHOLD_MB_ENV_VAR_NAME = "HEAP_SNAPSHOT_THRESHOLD_MB"
@@ -1,4 +1,5 @@
 import json
+from typing import Any
 
 from pydantic import BaseModel
 
@@ -20,6 +21,8 @@ class DataFromMinecraft(BaseModel):
 class SkillInvocation(BaseModel):
     skillName: str
     args: list[ValidSkillArgument]
+    # Tags the invocation's profiles (when profiling)
+    invocationID: int | None = None
 
     @staticmethod
     def from_str(str: str) -> "SkillInvocation":
@@ -28,3 +31,15 @@ class SkillInvocation(BaseModel):
             skillName=fn_name,
             args=args,
         )
+
+
+# We send these to the JS process (in between skill invocations)
+class SurroundingsQuery(BaseModel):
+    queryName: str
+    args: list[ValidSkillArgument]
+
+
+# We get these from the JS process in response to a SurroundingsQuery
+class SurroundingsQueryResponse(BaseModel):
+    queryResult: Any = None
+    queryError: str | None = None
@@ -1,12 +1,66 @@
+import json
+import logging
+import os
 import subprocess
+import threading
+from collections import deque
+from typing import TextIO
 
 from semantic_steve.py.constants import (
     CMD_TO_DEBUG_START_JS_PROCESS,
     CMD_TO_REBUILD_TYPESCRIPT,
     CMD_TO_START_JS_PROCESS,
+    JS_LOGGER_NAME,
+    LOG_LEVEL_ENV_VAR_NAME,
     PATH_TO_JS_DIR,
 )
 
+js_logger = logging.getLogger(JS_LOGGER_NAME)
+
+
+class JsStderrPump(threading.Thread):
+    """Background thread that drains the JS process's stderr into Python's `logging`.
+
+    Draining it continuously keeps the pipe's buffer from filling up (which would block
+    the JS process on its next write). Lines written by the JS logger (JSON records) are
+    logged to `semantic_steve.js.<name>` at their level; any other lines (e.g., uncaught
+    errors) are logged to `semantic_steve.js` as warnings. The last lines are kept for
+    reporting crashes.
+    """
+
+    TAIL_LENGTH = 200
+
+    def __init__(self, stderr: TextIO):
+        super().__init__(name="semantic-steve-js-stderr", daemon=True)
+        self.stderr = stderr
+        self.tail: deque[str] = deque(maxlen=self.TAIL_LENGTH)
+
+    def run(self) -> None:
+        for line in self.stderr:  # (Until EOF, i.e., the JS process exits)
+            self._handle_line(line.rstrip("\n"))
+
+    def _handle_line(self, line: str) -> None:
+        record = None
+        if line.startswith("{"):
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                pass
+        if not (isinstance(record, dict) and "level" in record and "msg" in record):
+            self.tail.append(line)
+            js_logger.warning(line)
+            return
+        level = logging.getLevelName(record["level"])
+        if not isinstance(level, int):
+            level = logging.WARNING
+        msg = record["msg"] if "exc" not in record else f"{record['msg']}\n{record['exc']}"
+        self.tail.append(f"{record['level']}: {msg}")
+        logger = js_logger.getChild(record["name"]) if record.get("name") else js_logger
+        logger.log(level, msg)
+
+    def get_tail(self) -> str:
+        return "\n".join(self.tail)
+
 
 class SemanticSteveJsProcessManager:
     """Context manager responsible for opening/cleaning up the Semantic Steve JS process."""
@@ -17,6 +71,9 @@ class SemanticSteveJsProcessManager:
         self.should_rebuild_typescript = should_rebuild_typescript
         self.debug = debug
         self.js_process: subprocess.Popen | None = None
+        self.stderr_pump: JsStderrPump | None = None
+        # Additional env vars for the JS process (e.g., how to reach the Python process)
+        self.extra_env_vars: dict[str, str] = {}
 
     ########################
     ## Context management ##
@@ -32,7 +89,10 @@ class SemanticSteveJsProcessManager:
             stderr=subprocess.PIPE,
             cwd=PATH_TO_JS_DIR,
             text=True,
+            env=self._get_js_process_env(),
         )
+        self.stderr_pump = JsStderrPump(self.js_process.stderr)
+        self.stderr_pump.start()
         self.check_and_propogate_errors()
         return self.js_process
 
@@ -57,6 +117,15 @@ class SemanticSteveJsProcessManager:
             print(e.stderr)  # Print the JS process error message to the console
             raise e
 
+    def _get_js_process_env(self) -> dict[str, str]:
+        env = os.environ.copy()
+        env.update(self.extra_env_vars)
+        # Unless overridden, the JS logger only logs what `semantic_steve.js` would handle
+        # (so that, e.g., disabled debug logs are never even written to the pipe)
+        if LOG_LEVEL_ENV_VAR_NAME not in env:
+            env[LOG_LEVEL_ENV_VAR_NAME] = str(js_logger.getEffectiveLevel())
+        return env
+
     def _cleanup_process_if_needed(self, js_process: subprocess.Popen) -> None:
         if js_process.poll() is None:
             print("Attempting to gracefully terminate the js process...")
@@ -76,7 +145,8 @@ class SemanticSteveJsProcessManager:
     def check_and_propogate_errors(self) -> None:
         return_code = self.js_process.poll()
         if return_code is not None:
-            _, stderr = self.js_process.communicate()
+            self.stderr_pump.join(timeout=self.TERMINATE_TIMEOUT_SECONDS)  # Drain the rest
+            stderr = self.stderr_pump.get_tail()
             if return_code != 0:
                 print(stderr)  # Print the JS process error message to the console
                 raise subprocess.CalledProcessError(
@@ -0,0 +1,101 @@
+import cProfile
+import logging
+import os
+import re
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from semantic_steve.py.constants import (
+    HEAP_SNAPSHOT_THRESHOLD_MB_ENV_VAR_NAME,
+    PROFILE_DIR_ENV_VAR_NAME,
+    PROFILE_N_SLOWEST_ENV_VAR_NAME,
+)
+from semantic_steve.py.schema import SemanticSteveProfilingConfig
+
+TRACEMALLOC_N_TOP_STATS = 25
+
+logger = logging.getLogger(__name__)
+
+
+def get_profile_file_stem(skill_name: str, invocation_id: int) -> str:
+    """Gets the stem of the names of the files profiling an invocation (shared w/ the JS
+    process's files, so that they can all be matched to the invocation).
+
+    NOTE: The skill name is sanitized, since it comes straight from the (possibly invalid)
+    invocation string.
+    """
+    return re.sub(r"[^a-zA-Z0-9_.-]", "_", f"{invocation_id}-{skill_name}")
+
+
+class SemanticSteveProfiler:
+    """Profiles each skill invocation of a `SemanticSteve` session.
+
+    Every session gets its own timestamped subdirectory of the configured `output_dir`,
+    in which, for each invocation:
+
+    - The JS process writes a CPU profile (`<id>-<skill>.cpuprofile`; open w/ Chrome
+      DevTools or speedscope), and a heap snapshot (`<id>-<skill>.heapsnapshot`) whenever
+      its heap grows past `heap_snapshot_threshold_mb`.
+    - If `profile_python`, `cProfile` stats (`<id>-<skill>.prof`; open w/ snakeviz) and
+      the top `tracemalloc` allocation diffs (`<id>-<skill>.tracemalloc.txt`) of the
+      Python process are written.
+    """
+
+    def __init__(self, config: SemanticSteveProfilingConfig):
+        self.config = config
+        self.session_dir: str | None = None
+
+    def open(self) -> dict[str, str]:
+        """Creates the session's directory.
+
+        Returns:
+            The env vars that tell the JS process how to profile.
+        """
+        output_dir = os.path.abspath(self.config.output_dir)
+        self.session_dir = os.path.join(output_dir, time.strftime("%Y%m%d-%H%M%S"))
+        os.makedirs(self.session_dir, exist_ok=True)
+        env_vars = {PROFILE_DIR_ENV_VAR_NAME: self.session_dir}
+        if self.config.n_slowest_skills is not None:
+            env_vars[PROFILE_N_SLOWEST_ENV_VAR_NAME] = str(self.config.n_slowest_skills)
+        if self.config.heap_snapshot_threshold_mb is not None:
+            threshold = str(self.config.heap_snapshot_threshold_mb)
+            env_vars[HEAP_SNAPSHOT_THRESHOLD_MB_ENV_VAR_NAME] = threshold
+        return env_vars
+
+    @contextmanager
+    def profile_invocation(self, skill_name: str, invocation_id: int) -> Iterator[None]:
+        """Profiles the Python process for the duration of the context (if enabled)."""
+        if not self.config.profile_python or self.session_dir is None:
+            yield
+            return
+        file_path_stem = os.path.join(
+            self.session_dir, get_profile_file_stem(skill_name, invocation_id)
+        )
+        started_tracemalloc = not tracemalloc.is_tracing()
+        if started_tracemalloc:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        start_snapshot = tracemalloc.take_snapshot()
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            end_snapshot = tracemalloc.take_snapshot()
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            if started_tracemalloc:
+                tracemalloc.stop()
+            # NOTE: Failing to save the profiles must never fail the invocation itself
+            try:
+                profiler.dump_stats(f"{file_path_stem}.prof")
+                top_stats = end_snapshot.compare_to(start_snapshot, "lineno")
+                with open(f"{file_path_stem}.tracemalloc.txt", "w") as f:
+                    f.write(f"Peak traced memory: {peak_bytes / 1024 / 1024:.2f} MiB\n")
+                    f.write(f"Top {TRACEMALLOC_N_TOP_STATS} allocation diffs:\n")
+                    for stat in top_stats[:TRACEMALLOC_N_TOP_STATS]:
+                        f.write(f"{stat}\n")
+            except OSError as error:
+                logger.warning(f"Failed to save the profiles of {file_path_stem}: {error}")
@@ -1,6 +1,6 @@
 from typing import TypeAlias
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PositiveInt
 
 PrimitiveDataType: TypeAlias = None | bool | int | float | str
 
@@ -19,6 +19,21 @@ class SemanticSteveDocs(BaseModel):
     tips_tutorials_and_sops: list[str]
 
 
+#############################
+## Profiling Config Object ##
+#############################
+
+
+class SemanticSteveProfilingConfig(BaseModel):
+    output_dir: str
+    # Only keep the JS CPU profiles of the N slowest invocations (None = keep all)
+    n_slowest_skills: PositiveInt | None = None
+    # JS heap size (MB) past which a heap snapshot is taken (None = never)
+    heap_snapshot_threshold_mb: float | None = None
+    # Whether to also cProfile/tracemalloc the Python process during invocations
+    profile_python: bool = True
+
+
 #######################
 ## Custom exceptions ##
 #######################
@@ -26,3 +41,7 @@ class SemanticSteveDocs(BaseModel):
 
 class SemanticSteveUsageError(Exception):
     pass
+
+
+class SemanticSteveQueryError(Exception):
+    pass
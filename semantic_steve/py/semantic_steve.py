@@ -1,5 +1,7 @@
 import asyncio
 import os
+from contextlib import nullcontext
+from typing import Any
 
 import zmq
 
@@ -7,11 +9,28 @@ from semantic_steve.py.constants import (
     DEFAULT_PATH_TO_SCREENSHOT_DIR,
     SEMANTIC_STEVE_USER_ROLE_AS_VERB_PHRASE,
     SCREENSHORT_DIR_ENV_VAR_NAME,
+    WORLD_MEMORY_DIR_ENV_VAR_NAME,
+)
+from semantic_steve.py.js_messages import (
+    DataFromMinecraft,
+    SkillInvocation,
+    SurroundingsQuery,
+    SurroundingsQueryResponse,
 )
-from semantic_steve.py.js_messages import DataFromMinecraft, SkillInvocation
 from semantic_steve.py.js_process import SemanticSteveJsProcessManager
-from semantic_steve.py.schema import SemanticSteveDocs, SemanticSteveUsageError
+from semantic_steve.py.profiling import SemanticSteveProfiler
+from semantic_steve.py.schema import (
+    SemanticSteveDocs,
+    SemanticSteveProfilingConfig,
+    SemanticSteveQueryError,
+    SemanticSteveUsageError,
+)
 from semantic_steve.py.skills_docs import generate_skills_docs
+from semantic_steve.py.transport import (
+    DEFAULT_ZMQ_TRANSPORT_KIND,
+    SemanticSteveTransport,
+    ZmqTransportKind,
+)
 from semantic_steve.py.utils import ascertain_js_dependencies
 
 
@@ -20,6 +39,10 @@ class SemanticSteve:
         self,
         zmq_port: int = 5555,
         screenshot_dir: str | os.PathLike = DEFAULT_PATH_TO_SCREENSHOT_DIR,
+        zmq_transport: ZmqTransportKind = DEFAULT_ZMQ_TRANSPORT_KIND,
+        use_shared_memory: bool = False,
+        world_memory_dir: str | os.PathLike | None = None,
+        profile: SemanticSteveProfilingConfig | str | os.PathLike | None = None,
         # Users should never use the following args (only devs):
         _debug: bool = False,
         _should_rebuild_typescript: bool = False,
@@ -29,10 +52,24 @@ class SemanticSteve:
             should_rebuild_typescript=_should_rebuild_typescript, debug=_debug
         )
         os.environ[SCREENSHORT_DIR_ENV_VAR_NAME] = str(screenshot_dir)
-        self.zmq_port = zmq_port
+        if world_memory_dir is not None:
+            # Opts into persisting the blocks seen (see `semantic_steve.py.world_memory`)
+            env_vars = self.js_process_manager.extra_env_vars
+            env_vars[WORLD_MEMORY_DIR_ENV_VAR_NAME] = os.path.abspath(world_memory_dir)
+        self.zmq_port = zmq_port  # (Only used w/ the "tcp" transport)
+        self.transport = SemanticSteveTransport(
+            kind=zmq_transport, zmq_port=zmq_port, use_shared_memory=use_shared_memory
+        )
+        if isinstance(profile, str | os.PathLike):
+            profile = SemanticSteveProfilingConfig(output_dir=str(profile))
+        self.profiler = SemanticSteveProfiler(profile) if profile is not None else None
+        self.invocation_count = 0
         self.debug = _debug
         self.socket: zmq.Socket | None = None
         self.context: zmq.Context | None = None
+        # Whether the JS process owes us `DataFromMinecraft` (i.e., the initial state or
+        # the results of a skill invocation), in which case it can't be queried
+        self.is_awaiting_data_from_minecraft = False
 
     ###########################
     ## Documentation getters ##
@@ -72,20 +109,26 @@ class SemanticSteve:
     ########################
 
     def __enter__(self):
+        self.js_process_manager.extra_env_vars.update(self.transport.open())
+        if self.profiler is not None:
+            self.js_process_manager.extra_env_vars.update(self.profiler.open())
         self.js_process_manager.__enter__()
         self.context = zmq.Context()
         self.socket = self.context.socket(zmq.PAIR)
-        self.socket.connect(f"tcp://localhost:{self.zmq_port}")
+        endpoint = self.transport.connect_endpoint
+        self.socket.connect(endpoint)
         self.socket.setsockopt(zmq.RCVTIMEO, 0)
-        print(f"SemanticSteve python connected to tcp://localhost:{self.zmq_port}.")
+        self.is_awaiting_data_from_minecraft = True  # (The initial state)
+        print(f"SemanticSteve python connected to {endpoint}.")
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         if self.socket is not None:
             self.socket.close()
             self.context.term()
-            print(f"Python disconnected from tcp://localhost:{self.zmq_port}.")
+            print(f"Python disconnected from {self.transport.connect_endpoint}.")
         self.js_process_manager.__exit__(exc_type, exc_value, traceback)
+        self.transport.close()
 
     #####################
     ## Private helpers ##
@@ -96,6 +139,16 @@ class SemanticSteve:
             msg = f"`{method_name}` must be called in a `with SemanticSteve()...` context."
             raise SemanticSteveUsageError(msg)
 
+    async def _receive_json(self, poll_interval_seconds: float = 0.1) -> dict:
+        msg = None
+        while msg is None:
+            try:
+                msg = self.socket.recv_json()
+            except zmq.Again:
+                self.js_process_manager.check_and_propogate_errors()
+                await asyncio.sleep(poll_interval_seconds)  # Avoid busy waiting
+        return self.transport.read_payload(msg)
+
     ####################
     ## Public methods ##
     ####################
@@ -104,17 +157,90 @@ class SemanticSteve:
         self._assert_called_in_context_manager_context(
             method_name="wait_for_data_from_minecraft"
         )
-        data_from_minecraft_dict = None
-        while data_from_minecraft_dict is None:
-            try:
-                data_from_minecraft_dict = self.socket.recv_json()
-            except zmq.Again:
-                self.js_process_manager.check_and_propogate_errors()
-                await asyncio.sleep(0.1)  # Sleep for a short time to avoid busy waiting
+        data_from_minecraft_dict = await self._receive_json()
+        self.is_awaiting_data_from_minecraft = False
         return DataFromMinecraft(**data_from_minecraft_dict)
 
     async def invoke(self, skill_invocation: str) -> DataFromMinecraft:
         self._assert_called_in_context_manager_context(method_name="invoke_skill")
         parsed_skill_invocation = SkillInvocation.from_str(skill_invocation)
-        self.socket.send_json(parsed_skill_invocation.model_dump())
-        return await self.wait_for_data_from_minecraft()
+        self.invocation_count += 1
+        parsed_skill_invocation.invocationID = self.invocation_count
+        profiling = (
+            nullcontext()
+            if self.profiler is None
+            else self.profiler.profile_invocation(
+                parsed_skill_invocation.skillName, self.invocation_count
+            )
+        )
+        with profiling:
+            self.socket.send_json(parsed_skill_invocation.model_dump())
+            self.is_awaiting_data_from_minecraft = True
+            return await self.wait_for_data_from_minecraft()
+
+    ##########################
+    ## Surroundings queries ##
+    ##########################
+
+    async def query(self, query_name: str, *args: Any) -> Any:
+        """Asks the JS process a question about the bot's surroundings (in between skill
+        invocations), w/out running a skill or getting the full envState.
+
+        Raises:
+            SemanticSteveQueryError: If the query (or its arguments) is invalid.
+        """
+        self._assert_called_in_context_manager_context(method_name="query")
+        if self.is_awaiting_data_from_minecraft:
+            msg = "Queries can't be made while awaiting data from Minecraft."
+            raise SemanticSteveUsageError(msg)
+        query = SurroundingsQuery(queryName=query_name, args=list(args))
+        self.socket.send_json(query.model_dump())
+        # NOTE: Queries are answered right away, so we poll more frequently
+        response = SurroundingsQueryResponse(
+            **await self._receive_json(poll_interval_seconds=0.001)
+        )
+        if response.queryError is not None:
+            raise SemanticSteveQueryError(response.queryError)
+        return response.queryResult
+
+    async def nearest(self, thing: str) -> dict | None:
+        """Gets the coordinates of (and distance to) the nearest visible `thing`, or None
+        if none is visible."""
+        return await self.query("nearest", thing)
+
+    async def count_in_radius(self, thing: str, radius: float) -> int:
+        """Counts the visible instances of a block or item entity within `radius` blocks
+        of the bot."""
+        return await self.query("countInRadius", thing, radius)
+
+    async def is_visible(self, thing: str) -> bool:
+        """Checks whether `thing` is visible anywhere in the bot's surroundings."""
+        return await self.query("isVisible", thing)
+
+    async def placeable_near(
+        self,
+        coordinates: tuple[int, int, int] | None = None,
+        radius: float | None = None,
+    ) -> list[list[int]]:
+        """Gets the placeable coordinates within `radius` blocks of `coordinates` (default:
+        the bot's position), closest first.
+
+        Results are limited to the cube within reach of the bot (5 blocks along each axis),
+        so `coordinates` must be in that cube (or `SemanticSteveQueryError` is raised).
+        """
+        args = [list(coordinates) if coordinates is not None else None, radius]
+        return await self.query("placeableNear", *args)
+
+    async def nearest_known(self, block: str) -> dict | None:
+        """Gets the coordinates of the nearest block named `block` that the bot has ever
+        seen (in its current dimension) according to its world memory, or None if none is
+        known. Requires `world_memory_dir`."""
+        return await self.query("nearestKnown", block)
+
+    async def known_counts_in_region(
+        self, corner1: tuple[int, int, int], corner2: tuple[int, int, int]
+    ) -> dict[str, int]:
+        """Counts the blocks of each type that the bot has ever seen in the chunks spanned
+        by two opposite corners, according to its world memory. Requires
+        `world_memory_dir`."""
+        return await self.query("knownCountsInRegion", list(corner1), list(corner2))
@@ -0,0 +1,115 @@
+import json
+import mmap
+import os
+import shutil
+import tempfile
+from typing import Literal
+
+from semantic_steve.py.constants import (
+    SHARED_MEMORY_DIR,
+    SHARED_MEMORY_PATH_ENV_VAR_NAME,
+    SHARED_MEMORY_RING_BYTES,
+    ZMQ_ENDPOINT_ENV_VAR_NAME,
+)
+
+ZmqTransportKind = Literal["tcp", "ipc"]
+# (libzmq doesn't support ipc:// endpoints on Windows)
+DEFAULT_ZMQ_TRANSPORT_KIND: ZmqTransportKind = "tcp" if os.name == "nt" else "ipc"
+
+
+class SemanticSteveTransport:
+    """How the Python and JS processes of a `SemanticSteve` talk to each other.
+
+    - "ipc": A Unix-domain socket in a per-session temp dir (no loopback TCP overhead and
+      no ports to manage, so many bots can run side by side).
+    - "tcp": localhost, on `zmq_port` (e.g., for platforms w/out Unix-domain sockets).
+
+    If `use_shared_memory`, the JS process writes large payloads (e.g., the envState)
+    into a ring buffer (a memory-mapped file on tmpfs, where available) and only sends
+    their offsets & lengths over ZMQ.
+    """
+
+    def __init__(
+        self,
+        kind: ZmqTransportKind,
+        zmq_port: int,
+        use_shared_memory: bool = False,
+    ):
+        self.kind = kind
+        self.zmq_port = zmq_port
+        self.use_shared_memory = use_shared_memory
+        self.session_dir: str | None = None
+        self.shared_memory_dir: str | None = None
+        self.shared_memory: mmap.mmap | None = None
+
+    ######################
+    ## Session handling ##
+    ######################
+
+    def open(self) -> dict[str, str]:
+        """Sets up the session's resources.
+
+        Returns:
+            The env vars that tell the JS process how to bind/write.
+        """
+        self.session_dir = tempfile.mkdtemp(prefix="semantic_steve_")
+        env_vars = {ZMQ_ENDPOINT_ENV_VAR_NAME: self.bind_endpoint}
+        if self.use_shared_memory:
+            shared_memory_dir = (
+                SHARED_MEMORY_DIR if os.path.isdir(SHARED_MEMORY_DIR) else None
+            )
+            self.shared_memory_dir = tempfile.mkdtemp(
+                prefix="semantic_steve_", dir=shared_memory_dir
+            )
+            path = os.path.join(self.shared_memory_dir, "payloads")
+            with open(path, "w+b") as f:
+                f.truncate(SHARED_MEMORY_RING_BYTES)
+                self.shared_memory = mmap.mmap(
+                    f.fileno(), SHARED_MEMORY_RING_BYTES, access=mmap.ACCESS_READ
+                )
+            env_vars[SHARED_MEMORY_PATH_ENV_VAR_NAME] = path
+        return env_vars
+
+    def close(self) -> None:
+        if self.shared_memory is not None:
+            self.shared_memory.close()
+            self.shared_memory = None
+        for dir in (self.session_dir, self.shared_memory_dir):
+            if dir is not None:
+                shutil.rmtree(dir, ignore_errors=True)
+        self.session_dir = None
+        self.shared_memory_dir = None
+
+    ###############
+    ## Endpoints ##
+    ###############
+
+    @property
+    def bind_endpoint(self) -> str:
+        """The endpoint the JS process binds."""
+        if self.kind == "ipc":
+            return self.connect_endpoint
+        return f"tcp://*:{self.zmq_port}"
+
+    @property
+    def connect_endpoint(self) -> str:
+        """The endpoint the Python process connects to."""
+        if self.kind == "ipc":
+            if self.session_dir is None:
+                raise RuntimeError("The transport must be opened to have an endpoint.")
+            return f"ipc://{os.path.join(self.session_dir, 'zmq.sock')}"
+        return f"tcp://localhost:{self.zmq_port}"
+
+    ##############
+    ## Payloads ##
+    ##############
+
+    def read_payload(self, msg: dict) -> dict:
+        """Gets the payload of a message from the JS process (i.e., reads it from shared
+        memory if the message is only a notification of where it was written)."""
+        if "shmOffset" not in msg:
+            return msg
+        if self.shared_memory is None:
+            raise RuntimeError("Got a shared memory notification w/out shared memory.")
+        start = msg["shmOffset"]
+        return json.loads(self.shared_memory[start : start + msg["shmLength"]])
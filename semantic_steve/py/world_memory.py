@@ -0,0 +1,129 @@
+import math
+import os
+import re
+import sqlite3
+from collections.abc import Iterator
+
+from semantic_steve.py.constants import WORLD_MEMORY_MMAP_SIZE_BYTES
+
+# NOTE: Keep in sync w/ semantic_steve/js/src/env-state/surroundings/world-memory.ts
+_MAX_SEARCH_CHUNK_RADIUS = 64
+
+
+def get_world_memory_path(
+    world_memory_dir: str | os.PathLike, host: str = "localhost", port: int = 25565
+) -> str:
+    """Gets the path of the world memory of the world (server) at `host`:`port`."""
+    world_name = re.sub(r"[^a-zA-Z0-9_.-]", "_", f"{host}_{port}")
+    return os.path.join(world_memory_dir, f"{world_name}.sqlite")
+
+
+class WorldMemory:
+    """Read-only (offline) access to a world memory written by the JS process, i.e., to
+    the last-seen block at every position the bot has seen in a world.
+
+    Can be used while the JS process is writing to it.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"No world memory at {path}.")
+        uri = f"file:{os.path.abspath(path)}?mode=ro"
+        self.connection = sqlite3.connect(uri, uri=True)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute(f"PRAGMA mmap_size = {WORLD_MEMORY_MMAP_SIZE_BYTES}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    #############
+    ## Queries ##
+    #############
+
+    def get_dimensions(self) -> list[str]:
+        """Gets the dimensions w/ known blocks."""
+        rows = self.connection.execute("SELECT DISTINCT dimension FROM blocks")
+        return [row["dimension"] for row in rows]
+
+    def get_known_blocks_in_chunk(
+        self, chunk_x: int, chunk_z: int, dimension: str = "overworld"
+    ) -> Iterator[tuple[str, tuple[int, int, int]]]:
+        """Yields the name and coordinates of every known block in a chunk."""
+        rows = self.connection.execute(
+            "SELECT name, x, y, z FROM blocks WHERE dimension = ? AND chunk_x = ? AND "
+            "chunk_z = ?",
+            (dimension, chunk_x, chunk_z),
+        )
+        for row in rows:
+            yield row["name"], (row["x"], row["y"], row["z"])
+
+    def nearest_known(
+        self,
+        block_name: str,
+        coordinates: tuple[float, float, float],
+        dimension: str = "overworld",
+        max_chunk_radius: int = _MAX_SEARCH_CHUNK_RADIUS,
+    ) -> tuple[int, int, int] | None:
+        """Gets the coordinates of the nearest known block named `block_name`, or None if
+        there is none within `max_chunk_radius` chunks."""
+        chunk_x = math.floor(coordinates[0]) >> 4
+        chunk_z = math.floor(coordinates[2]) >> 4
+
+        def get_nearest_within(chunk_radius: int) -> tuple[tuple | None, float]:
+            rows = self.connection.execute(
+                "SELECT x, y, z FROM blocks WHERE dimension = ? AND name = ? AND "
+                "chunk_x BETWEEN ? AND ? AND chunk_z BETWEEN ? AND ?",
+                (
+                    dimension,
+                    block_name,
+                    chunk_x - chunk_radius,
+                    chunk_x + chunk_radius,
+                    chunk_z - chunk_radius,
+                    chunk_z + chunk_radius,
+                ),
+            ).fetchall()
+            if not rows:
+                return None, math.inf
+            nearest = min(rows, key=lambda row: math.dist(coordinates, tuple(row)))
+            return tuple(nearest), math.dist(coordinates, tuple(nearest))
+
+        # Search growing squares of chunks until one has a match
+        chunk_radius = 1
+        while chunk_radius <= max_chunk_radius:
+            nearest, distance = get_nearest_within(chunk_radius)
+            if nearest is not None:
+                # A nearer one could be in a chunk just outside the square
+                covering_chunk_radius = min(math.ceil(distance / 16) + 1, max_chunk_radius)
+                if covering_chunk_radius > chunk_radius:
+                    nearest, _ = get_nearest_within(covering_chunk_radius)
+                return nearest
+            chunk_radius = min(chunk_radius * 2, max_chunk_radius + 1)
+        return None
+
+    def known_counts_in_region(
+        self,
+        corner1: tuple[int, int, int],
+        corner2: tuple[int, int, int],
+        dimension: str = "overworld",
+    ) -> dict[str, int]:
+        """Counts the known blocks of each type in the chunks spanned by two opposite
+        corners (like `SemanticSteve.known_counts_in_region`)."""
+        (x1, _, z1), (x2, _, z2) = corner1, corner2
+        rows = self.connection.execute(
+            "SELECT name, COUNT(*) AS count FROM blocks WHERE dimension = ? AND "
+            "chunk_x BETWEEN ? AND ? AND chunk_z BETWEEN ? AND ? GROUP BY name",
+            (
+                dimension,
+                math.floor(min(x1, x2)) >> 4,
+                math.floor(max(x1, x2)) >> 4,
+                math.floor(min(z1, z2)) >> 4,
+                math.floor(max(z1, z2)) >> 4,
+            ),
+        )
+        return {row["name"]: row["count"] for row in rows}